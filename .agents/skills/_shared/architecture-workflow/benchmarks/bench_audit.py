@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Measure audit log write throughput at different group-commit batch sizes.
+
+For each batch size, ``--threads`` producers append ``--events`` events in
+total to a fresh log through one ``archwf.audit.AuditLog`` (each batch is
+one write plus one fsync), then the remaining buffer is flushed. The
+report gives events/sec, the number of commits and fsyncs/sec per batch
+size; ``--no-fsync`` shows the cost without durability. Every log is
+re-read afterwards and its hash chain checked; a broken chain exits 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from archwf import audit  # noqa: E402
+from bench_workflow import git_commit  # noqa: E402
+
+
+def chain_ok(path: Path, expected: int) -> bool:
+    prev = audit.GENESIS_HASH
+    count = 0
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            event = json.loads(line)
+            if event["prev_event_hash"] != prev or audit.event_hash(event) != event["event_hash"]:
+                return False
+            prev = event["event_hash"]
+            count += 1
+    # The genesis event is written in front of the first batch.
+    return count == expected + 1
+
+
+def run(batch_size: int, events: int, threads: int, fsync: bool, root: Path) -> dict:
+    path = root / f"audit-{batch_size}.jsonl"
+    log = audit.AuditLog(path, batch_size, fsync=fsync)
+    timestamp = datetime.now(timezone.utc).isoformat()
+    per_thread = [events // threads + (1 if i < events % threads else 0) for i in range(threads)]
+
+    def produce(count: int, worker: int) -> None:
+        for i in range(count):
+            log.append(
+                audit.new_event(
+                    stage="decision",
+                    decision=f"bench event {worker}-{i}",
+                    project_id="bench",
+                    timestamp=timestamp,
+                    adr_id=f"ADR-{i:06d}",
+                    adr_path=f"docs/architecture/decisions/ADR-{i:06d}.md",
+                )
+            )
+
+    workers = [threading.Thread(target=produce, args=(count, w)) for w, count in enumerate(per_thread)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    log.flush()
+    elapsed = time.perf_counter() - start
+    return {
+        "batch_size": batch_size,
+        "events": events,
+        "seconds": round(elapsed, 4),
+        "events_per_s": round(events / elapsed, 1),
+        "commits": log.commits,
+        "commits_per_s": round(log.commits / elapsed, 1),
+        "bytes": path.stat().st_size,
+        "chain_ok": chain_ok(path, events),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument(
+        "--batch-size", type=int, action="append", help="Repeatable (default: 1, 8, 64, 512, 4096)."
+    )
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--no-fsync", action="store_true")
+    parser.add_argument("--dir", help="Directory for the logs (default: a temp dir); fsync cost depends on the filesystem.")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="archwf-audit-", dir=args.dir))
+    try:
+        results = [
+            run(size, args.events, max(1, args.threads), not args.no_fsync, root)
+            for size in args.batch_size or [1, 8, 64, 512, 4096]
+        ]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "benchmark": "audit",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "threads": args.threads,
+        "fsync": not args.no_fsync,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    broken = [str(r["batch_size"]) for r in results if not r["chain_ok"]]
+    if broken:
+        print(f"Error: broken hash chain at batch size {', '.join(broken)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Time indexed audit log queries against a full scan of the log.
+
+Writes a synthetic hash-chained log of ``--events`` events spread over
+``--sessions`` sessions, a handful of stages and one ADR per event, then
+times:
+
+- ``build``: indexing the whole log into ``<log>.index.sqlite``
+- ``incremental``: indexing ``--append`` newly appended events
+- one indexed query and one full scan each by ``adr_id``, ``session_id``,
+  ``stage`` and a one-hour time range
+
+Exits 1 if an indexed query returns different events than the scan.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from archwf import audit, audit_index  # noqa: E402
+from bench_workflow import git_commit  # noqa: E402
+
+STAGES = ("init", "decision", "review", "validation", "traceability")
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def write_events(log: audit.AuditLog, count: int, offset: int, sessions: int) -> None:
+    for i in range(offset, offset + count):
+        event = audit.new_event(
+            stage=STAGES[i % len(STAGES)],
+            decision=f"bench event {i}",
+            project_id="bench",
+            timestamp=(START + timedelta(seconds=i)).isoformat(),
+            adr_id=f"ADR-{i:07d}",
+            adr_path=f"docs/architecture/decisions/ADR-{i:07d}.md",
+        )
+        event["session_id"] = f"s-{i % sessions:04d}"
+        log.append(event)
+    log.flush()
+
+
+def scan(path: Path, since: str | None, until: str | None, filters: dict) -> list[bytes]:
+    matches = []
+    with path.open("rb") as fh:
+        for line in fh:
+            event = json.loads(line)
+            timestamp = event.get("timestamp") or ""
+            if since and timestamp < since:
+                continue
+            if until and timestamp > until + "\uffff":
+                continue
+            if all(event.get(k) == v for k, v in filters.items()):
+                matches.append(line.rstrip(b"\n"))
+    return matches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--append", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=500)
+    args = parser.parse_args()
+
+    total = args.events + args.append
+    middle = START + timedelta(seconds=total // 2)
+    queries = {
+        "adr_id": {"adr_id": f"ADR-{total // 2:07d}"},
+        "session_id": {"session_id": f"s-{7 % args.sessions:04d}"},
+        "stage": {"stage": "review"},
+        "time_range": {"since": middle.isoformat(), "until": (middle + timedelta(hours=1)).isoformat()},
+    }
+
+    root = Path(tempfile.mkdtemp(prefix="archwf-audit-query-"))
+    timings = {}
+    mismatched = []
+    try:
+        path = root / "audit-log.jsonl"
+        log = audit.AuditLog(path, 4096, fsync=False)
+        write_events(log, args.events, 0, args.sessions)
+
+        start = time.perf_counter()
+        added = audit_index.update(path)
+        timings["build"] = {"seconds": round(time.perf_counter() - start, 4), "indexed": added}
+
+        write_events(log, args.append, args.events, args.sessions)
+        start = time.perf_counter()
+        added = audit_index.update(path)
+        timings["incremental"] = {"seconds": round(time.perf_counter() - start, 4), "indexed": added}
+
+        for name, spec in queries.items():
+            filters = dict(spec)
+            since, until = filters.pop("since", None), filters.pop("until", None)
+            start = time.perf_counter()
+            indexed = list(audit_index.query(path, since=since, until=until, **filters))
+            indexed_s = time.perf_counter() - start
+            start = time.perf_counter()
+            scanned = scan(path, since, until, filters)
+            scan_s = time.perf_counter() - start
+            timings[name] = {
+                "matches": len(indexed),
+                "indexed_ms": round(indexed_s * 1000, 2),
+                "scan_ms": round(scan_s * 1000, 2),
+                "speedup": round(scan_s / indexed_s, 1) if indexed_s else None,
+            }
+            if indexed != scanned:
+                mismatched.append(name)
+        size = path.stat().st_size
+        index_size = audit_index.index_path(path).stat().st_size
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "benchmark": "audit_query",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "events": args.events,
+        "append": args.append,
+        "sessions": args.sessions,
+        "log_bytes": size,
+        "index_bytes": index_size,
+        "runs": timings,
+    }
+    print(json.dumps(report, indent=2))
+    if mismatched:
+        print(f"Error: indexed results differ from a full scan for {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Time audit log verification: sequential, parallel, checkpointed and incremental.
+
+Writes a synthetic hash-chained log of ``--events`` events, then times:
+
+- ``sequential``: one process, no checkpoints
+- ``parallel``: ``--jobs`` worker processes over ``--segment-mb`` ranges
+- ``checkpoint``: parallel run that also writes the checkpoints
+- ``full_with_checkpoints``: every range re-checked against its checkpoint
+- ``incremental``: after appending ``--append`` events, only the new ones
+
+Exits 1 if any run reports a different event count than was written.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from archwf import audit, audit_verify  # noqa: E402
+from bench_workflow import git_commit  # noqa: E402
+
+
+def write_events(log: audit.AuditLog, count: int, offset: int) -> None:
+    for i in range(offset, offset + count):
+        log.append(
+            audit.new_event(
+                stage="decision",
+                decision=f"bench event {i}",
+                project_id="bench",
+                timestamp="2025-01-01T00:00:00+00:00",
+                adr_id=f"ADR-{i:07d}",
+                adr_path=f"docs/architecture/decisions/ADR-{i:07d}.md",
+                references=[f"docs/architecture/decisions/ADR-{i:07d}.md"],
+            )
+        )
+    log.flush()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--append", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--segment-mb", type=float, default=8.0)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="archwf-audit-verify-"))
+    segment = int(args.segment_mb * 1024 * 1024)
+    timings = {}
+    mismatched = []
+    try:
+        path = root / "audit-log.jsonl"
+        log = audit.AuditLog(path, 4096, fsync=False)
+        write_events(log, args.events, 0)
+        expected = args.events + 1  # genesis
+
+        def timed(name: str, **kwargs) -> None:
+            start = time.perf_counter()
+            summary = audit_verify.verify(path, segment_bytes=segment, **kwargs)
+            timings[name] = {
+                "seconds": round(time.perf_counter() - start, 4),
+                "verified_events": summary["verified_events"],
+                "segments": summary["segments"],
+            }
+            if summary["events"] != expected:
+                mismatched.append(name)
+
+        timed("sequential", jobs=1, checkpoint=False)
+        timed("parallel", jobs=args.jobs, checkpoint=False)
+        timed("checkpoint", jobs=args.jobs)
+        timed("full_with_checkpoints", jobs=args.jobs)
+        write_events(log, args.append, args.events)
+        expected += args.append
+        timed("incremental", jobs=args.jobs, incremental=True)
+        size = path.stat().st_size
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "benchmark": "audit_verify",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "events": args.events,
+        "append": args.append,
+        "jobs": args.jobs,
+        "segment_mb": args.segment_mb,
+        "log_bytes": size,
+        "runs": timings,
+    }
+    print(json.dumps(report, indent=2))
+    if mismatched:
+        print(f"Error: wrong event count from {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Round-trip and time the dependency-free manifest YAML reader.
+
+For each history size, builds a manifest shaped like the ones the scripts
+write (actions with inputs, outputs and timing, ADRs, validations), plus
+strings carrying quotes, backslashes, newlines and other control
+characters, dumps it with ``fallback_yaml_dump`` and checks that
+``fallback_yaml_load`` returns the same data and, when PyYAML is
+installed, that PyYAML does too. Reports best-of-N parse time and
+throughput for the fallback reader next to PyYAML's loaders, so the
+reader's cost can be seen to grow linearly with manifest size.
+
+Exits 1 on any round-trip mismatch.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from archwf import serialization  # noqa: E402
+from bench_workflow import git_commit  # noqa: E402
+
+AWKWARD = [
+    "",
+    'say "hi"',
+    "C:\\temp\\new",
+    "two\nlines\r\n",
+    "tab\there",
+    "nul\x00bell\x07",
+    "next-line\x85sep\u2028para\u2029",
+    "key: value # not a comment",
+    "- not a list",
+    "123",
+    "true",
+    "null",
+    "{}",
+    "unicode é ✓ 𝄞",
+]
+
+
+def build_manifest(history: int) -> dict[str, Any]:
+    actions = [
+        {
+            "script": "validate_archifacts.py",
+            "timestamp": f"2025-{1 + h % 12:02d}-{1 + h % 28:02d}T00:00:{h % 60:02d}+00:00",
+            "inputs": {"system": "bench", "max_needs_work": 2, "all_systems": False, "report": None},
+            "outputs": {"result": "pass", "issues": [], "notes": AWKWARD[h % len(AWKWARD)]},
+            "exit_code": 0,
+            "workflow_version": "1.0.0",
+            "timing": {"wall_ms": 12.5 + h, "phases_ms": {"scan": 1.25, "manifest_save": 3.0}, "bytes_read": h},
+        }
+        for h in range(history)
+    ]
+    return {
+        "system": "bench",
+        "manifest_path": "bench.yaml",
+        "workflow_version": "1.0.0",
+        "adrs": [{"decision_id": f"d-{i}", "path": f"docs/architecture/decisions/ADR-{i}.md"} for i in range(history // 10)],
+        "wa_reviews": [],
+        "validations": [{"result": "pass", "fingerprint": {"adr_keys": "0" * 64}}],
+        "actions": actions,
+        "artifacts": {},
+        "artifact_table": {f"art-{i:08x}": f"docs/architecture/x {i}.md" for i in range(history // 10)},
+        "awkward": {text or "empty": text for text in AWKWARD},
+    }
+
+
+def best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, action="append", help="History entries per manifest (repeatable; default: 100, 1000, 5000).")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    yaml = serialization.yaml_module()
+    failures: list[str] = []
+    results = []
+    for history in args.history or [100, 1000, 5000]:
+        data = build_manifest(history)
+        text = serialization.fallback_yaml_dump(data) + "\n"
+        if serialization.fallback_yaml_load(text) != data:
+            failures.append(f"fallback_yaml_load, history={history}")
+        loaders: dict[str, Callable[[], Any]] = {"fallback": lambda: serialization.fallback_yaml_load(text)}
+        if yaml is not None:
+            if yaml.safe_load(text) != data:
+                failures.append(f"PyYAML, history={history}")
+            loaders["pyyaml_python"] = lambda: yaml.load(text, Loader=yaml.SafeLoader)
+            if getattr(yaml, "__with_libyaml__", False):
+                loaders["pyyaml_libyaml"] = lambda: yaml.load(text, Loader=yaml.CSafeLoader)
+        size = len(text.encode("utf-8"))
+        timings = {name: best_ms(fn, args.repeat) for name, fn in loaders.items()}
+        results.append(
+            {
+                "history": history,
+                "bytes": size,
+                "load_ms": timings,
+                "fallback_mb_per_s": round(size / 1e6 / (timings["fallback"] / 1000), 2),
+            }
+        )
+
+    report = {
+        "benchmark": "fallback_yaml",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "round_trip_failures": failures,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    if failures:
+        print(f"Error: round trip mismatch: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
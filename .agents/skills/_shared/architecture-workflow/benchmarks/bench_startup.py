@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure cold-start cost of real workflow runs and enforce a budget.
+
+Builds the ``archwf`` zipapp into a temp directory. Each of ``--repeat``
+rounds then builds a fresh small synthetic repo per variant (one system,
+five ADRs, one WA review, ten history entries; see ``bench_workflow.py``)
+and runs every workflow subcommand against ``sys-0000`` in workflow order
+(``wa-review`` last, as its unscored review would fail validation) three
+ways: the standalone script, ``python3 scripts/archwf <cmd>`` and
+``python3 archwf.pyz <cmd>``. The report keeps the best wall time per
+command and variant (daemon disabled); a bare ``python3 -c pass`` is timed
+as the floor.
+
+Exits 1 when any zipapp run exceeds ``--budget-ms`` or any run fails, so
+the budget can gate CI.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS = BENCH_DIR.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+sys.path.insert(0, str(BENCH_DIR))
+
+from archwf import bundle  # noqa: E402
+from archwf.__main__ import SCRIPT_COMMANDS  # noqa: E402
+from bench_workflow import TARGET, build_repo, git_commit  # noqa: E402
+
+# Workflow order; wa-review runs last (see the module docstring).
+ORDER = ["init", "new-adr", "validate", "decision-trace", "wa-review"]
+
+
+def command_args(command: str, run: str) -> list[str]:
+    if command == "new-adr":
+        return [
+            "--system", TARGET,
+            "--title", f"Startup decision {run}",
+            "--category", "data-store",
+            "--status", "proposed",
+            "--owners", "platform-team",
+            "--tags", "bench",
+        ]
+    return ["--system", TARGET]
+
+
+def timed_ms(argv: list[str], cwd: Path, env: dict[str, str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    proc = subprocess.run(argv, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(f"Warning: {' '.join(argv)} exited {proc.returncode}: {proc.stderr.strip()[:300]}", file=sys.stderr)
+    return elapsed * 1000, proc.returncode
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=150.0,
+        help="Max best-of-N wall time per zipapp subcommand run against the synthetic repo.",
+    )
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+
+    env = {k: v for k, v in os.environ.items() if not k.startswith("ARCHWF_")}
+    env["ARCHWF_DAEMON"] = "off"
+    py = sys.executable
+    root = Path(tempfile.mkdtemp(prefix="archwf-startup-"))
+    best: dict[str, float] = {}
+    failed: set[str] = set()
+    try:
+        pyz = bundle.build(root / "archwf.pyz")
+        variants = {
+            "script": lambda command, module: [py, str(SCRIPTS / f"{module}.py")],
+            "scripts/archwf": lambda command, module: [py, str(SCRIPTS / "archwf"), command],
+            "archwf.pyz": lambda command, module: [py, str(pyz), command],
+        }
+        floor = float("inf")
+        for round_index in range(args.repeat):
+            floor = min(floor, timed_ms([py, "-c", "pass"], root, env)[0])
+            for variant, prefix in variants.items():
+                repo = root / f"repo-{round_index}-{variant.replace('/', '-')}"
+                build_repo(repo, 1, 5, 1, 10)
+                for command in ORDER:
+                    module = SCRIPT_COMMANDS[command][0]
+                    label = f"{variant} {command}"
+                    argv = [*prefix(command, module), *command_args(command, f"{round_index}-{variant}")]
+                    ms, code = timed_ms(argv, repo, env)
+                    best[label] = min(best.get(label, float("inf")), ms)
+                    if code != 0:
+                        failed.add(label)
+                shutil.rmtree(repo, ignore_errors=True)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    results: dict[str, Any] = {"python -c pass": round(floor, 3)}
+    results.update({label: round(ms, 3) for label, ms in best.items()})
+    over = [label for label, ms in best.items() if label.startswith("archwf.pyz") and ms > args.budget_ms]
+    report = {
+        "benchmark": "startup",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "budget_ms": args.budget_ms,
+        "best_ms": results,
+        "over_budget": over,
+        "failed": sorted(failed),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"Report: {args.output}")
+    else:
+        print(text)
+    if over:
+        print(f"Error: over the {args.budget_ms:g} ms budget: {', '.join(over)}", file=sys.stderr)
+    if failed:
+        print(f"Error: runs failed: {', '.join(sorted(failed))}", file=sys.stderr)
+    return 1 if over or failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
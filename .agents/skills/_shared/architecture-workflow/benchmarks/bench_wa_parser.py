@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare the legacy per-pillar regex WA parser with archwf.wa_parser."""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from archwf import wa_parser  # noqa: E402
+
+
+def legacy_parse_scores(wa_text: str) -> tuple[dict[str, str], list[str]]:
+    issues: list[str] = []
+    scores: dict[str, str] = {}
+    for pillar in wa_parser.PILLARS:
+        section = re.search(rf"^##\s+{re.escape(pillar)}\s*$", wa_text, re.M)
+        if not section:
+            issues.append(f"Missing WA pillar section: {pillar}")
+            continue
+        following = wa_text[section.end() :]
+        next_section = re.search(r"^##\s+", following, re.M)
+        chunk = following[: next_section.start()] if next_section else following
+        score_match = re.search(r"^Score:\s*(Pass|Needs Work|Fail)\s*$", chunk, re.M)
+        if not score_match:
+            issues.append(f"Missing score for pillar: {pillar}")
+            continue
+        scores[pillar] = score_match.group(1)
+    return scores, issues
+
+
+def synthetic_review(target_bytes: int) -> str:
+    per_pillar = max(1, target_bytes // len(wa_parser.PILLARS))
+    parts = ["# Well-Architected Review\n\nSystem: bench\n\n"]
+    for i, pillar in enumerate(wa_parser.PILLARS):
+        parts.append(f"## {pillar}\nScore: {('Pass', 'Needs Work')[i % 2]}\nChecklist:\n")
+        parts.append("- [x] Control implemented.\n- [ ] Control verified.\nFindings + Remediations:\n")
+        block = "- Finding: latency regression under load in dependency call path\n  Remediation: add caching\n"
+        parts.append(block * (per_pillar // len(block)))
+    return "".join(parts)
+
+
+def best_of(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, action="append", help="Review size(s) in MB (default: 1).")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    for size_mb in args.size_mb or [1.0]:
+        text = synthetic_review(int(size_mb * 1024 * 1024))
+        if legacy_parse_scores(text) != wa_parser.parse_scores(text):
+            print("Error: parsers disagree on synthetic review.", file=sys.stderr)
+            return 1
+        legacy = best_of(legacy_parse_scores, text, args.repeat)
+        single_pass = best_of(wa_parser.parse_scores, text, args.repeat)
+        results.append(
+            {
+                "bytes": len(text.encode("utf-8")),
+                "legacy_ms": round(legacy * 1000, 3),
+                "single_pass_ms": round(single_pass * 1000, 3),
+            }
+        )
+    print(json.dumps({"benchmark": "wa_parser", "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
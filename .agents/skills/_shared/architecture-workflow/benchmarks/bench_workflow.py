@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Time the workflow scripts end to end against synthetic architecture repos.
+
+Each size builds a throwaway repo with N systems (full baseline doc packs
+with MAJOR_DECISION markers), M ADRs spread across them, K WA reviews and a
+manifest per system holding H history entries, all rendered from the shared
+templates. Every script then runs as a subprocess (daemon disabled) against
+system ``sys-0000``, ``--repeat`` times, and the JSON report records min and
+median wall time per script plus the phase breakdown the script recorded in
+its manifest action. Results carry the commit and interpreter so runs can
+be compared across commits.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+SHARED = Path(__file__).resolve().parent.parent
+SKILLS = SHARED.parent.parent
+sys.path.insert(0, str(SHARED / "scripts"))
+
+from archwf import manifest as manifest_store  # noqa: E402
+from archwf import serialization  # noqa: E402
+from archwf import templates  # noqa: E402
+
+SCRIPTS = SHARED / "scripts"
+RUN_EVALS = SKILLS / "aws-evals" / "scripts" / "run_evals.py"
+TEMPLATES = SHARED / "templates"
+PRESETS = {
+    "small": (5, 50, 5, 100),
+    "medium": (25, 500, 25, 1000),
+    "large": (100, 2000, 100, 5000),
+}
+DIAGRAMS = ("context", "containers", "dataflow", "network")
+TARGET = "sys-0000"
+
+
+def parse_size(value: str) -> tuple[str, tuple[int, int, int, int]]:
+    if value in PRESETS:
+        return value, PRESETS[value]
+    try:
+        n, m, k, h = (int(x) for x in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected one of {sorted(PRESETS)} or N,M,K,H; got {value!r}")
+    return value, (n, m, k, h)
+
+
+def render(name: str, values: dict[str, Any]) -> str:
+    return templates.load(TEMPLATES / name).render(values).text
+
+
+def build_repo(root: Path, systems: int, adrs: int, reviews: int, history: int) -> None:
+    # The scripts find REPO_ROOT via .agents/skills and load templates from it.
+    (root / ".agents").mkdir(parents=True)
+    os.symlink(SKILLS, root / ".agents" / "skills", target_is_directory=True)
+    arch = root / "docs" / "architecture"
+    for sub in ("decisions", "reviews", "diagrams", "threat-models", "runbooks", "solution-overviews", "manifest"):
+        (arch / sub).mkdir(parents=True, exist_ok=True)
+
+    names = [f"sys-{i:04d}" for i in range(systems)]
+    owned: dict[str, list[tuple[str, str]]] = {name: [] for name in names}
+    index_lines = []
+    for j in range(adrs):
+        system = names[j % systems]
+        slug = f"{system}-decision-{j:05d}"
+        adr_name = f"ADR-2025{1 + j % 12:02d}{1 + j % 28:02d}-{slug}.md"
+        text = render(
+            "adr-short.md" if j % 2 else "adr-full.md",
+            {
+                "decision_id": slug,
+                "system": system,
+                "category": "data-store",
+                "status": "accepted",
+                "owner": ["platform-team"],
+                "tag": ["bench"],
+                "date": "2025-01-01",
+                "title": f"Decision {j} for {system}",
+                "supersedes": "",
+                "superseded_by": "",
+            },
+        )
+        (arch / "decisions" / adr_name).write_text(text, encoding="utf-8")
+        owned[system].append((slug, adr_name))
+        index_lines.append(f"- ADR: `docs/architecture/decisions/{adr_name}`\n")
+    (arch / "index.md").write_text("# Architecture Index\n\n" + "".join(sorted(index_lines)), encoding="utf-8")
+
+    for i, system in enumerate(names):
+        values = {"system": system, "date": "2025-01-01", "owners": "platform-team"}
+        markers = "".join(
+            f"MAJOR_DECISION: data-store | {slug} | Synthetic decision {slug}\n" for slug, _ in owned[system]
+        )
+        overview = render("solution-overview.md", values) + "\n" + markers
+        (arch / "solution-overviews" / f"{system}.md").write_text(overview, encoding="utf-8")
+        (arch / "threat-models" / f"{system}-threat-model-lite.md").write_text(
+            render("threat-model-lite.md", values), encoding="utf-8"
+        )
+        (arch / "runbooks" / f"{system}-runbook-baseline.md").write_text(
+            render("runbook-baseline.md", values), encoding="utf-8"
+        )
+        for diagram in DIAGRAMS:
+            (arch / "diagrams" / f"{system}-{diagram}.md").write_text(f"# Diagram: {diagram}\n", encoding="utf-8")
+
+        history_entries = [
+            {
+                "script": "validate_archifacts.py",
+                "timestamp": f"2025-{1 + h % 12:02d}-{1 + h % 28:02d}T00:00:{h % 60:02d}+00:00",
+                "inputs": {"system": system, "max_needs_work": 2},
+                "outputs": {"result": "pass", "issues_count": 0},
+                "exit_code": 0,
+                "workflow_version": "1.0.0",
+            }
+            for h in range(history)
+        ]
+        manifest = {
+            "system": system,
+            "manifest_path": f"{system}.yaml",
+            "workflow_version": "1.0.0",
+            "adrs": [
+                {"decision_id": slug, "slug": slug, "path": f"docs/architecture/decisions/{adr_name}"}
+                for slug, adr_name in owned[system]
+            ],
+            "wa_reviews": [],
+            "validations": [],
+            "decision_traces": [],
+            "actions": history_entries,
+            "artifacts": {},
+        }
+        (root / f"{system}.yaml").write_text(serialization.dump_yaml(manifest), encoding="utf-8")
+
+    review = render("well-architected-review.md", {"system": "", "date": "2025-01-01", "reviewers": "bench"})
+    review = review.replace("Score: Pass | Needs Work | Fail", "Score: Pass")
+    for r in range(reviews):
+        system = names[r % systems]
+        day = 1 + (r // systems) % 28
+        (arch / "reviews" / f"WA-REVIEW-202501{day:02d}-{system}.md").write_text(
+            review.replace("System: \n", f"System: {system}\n"), encoding="utf-8"
+        )
+    (root / "systems.txt").write_text("\n".join(names) + "\n", encoding="utf-8")
+
+
+def commands(repeat_index: int) -> list[tuple[str, list[str]]]:
+    py = sys.executable
+    # wa_review runs last: its fresh, unscored review would fail later validations.
+    return [
+        ("init_arch_workflow", [py, str(SCRIPTS / "init_arch_workflow.py"), "--system", TARGET]),
+        (
+            "new_adr",
+            [
+                py,
+                str(SCRIPTS / "new_adr.py"),
+                "--system", TARGET,
+                "--title", f"Bench decision {repeat_index}",
+                "--category", "data-store",
+                "--status", "proposed",
+                "--owners", "platform-team",
+                "--tags", "bench",
+            ],
+        ),
+        ("validate_archifacts", [py, str(SCRIPTS / "validate_archifacts.py"), "--system", TARGET]),
+        ("validate_archifacts_all", [py, str(SCRIPTS / "validate_archifacts.py"), "--all-systems"]),
+        ("decision_trace", [py, str(SCRIPTS / "decision_trace.py"), "--system", TARGET]),
+        ("run_evals", [py, str(RUN_EVALS), "--scenario", "all", "--notes", "bench", "--system", TARGET]),
+        ("init_arch_workflow_systems_file", [py, str(SCRIPTS / "init_arch_workflow.py"), "--systems-file", "systems.txt"]),
+        ("wa_review", [py, str(SCRIPTS / "wa_review.py"), "--system", TARGET]),
+    ]
+
+
+def last_timing(root: Path, script: str) -> dict[str, Any] | None:
+    try:
+        data = manifest_store.read(root / f"{TARGET}.yaml")
+    except RuntimeError:
+        return None
+    for action in reversed(data.get("actions") or []):
+        if isinstance(action, dict) and action.get("script") == script:
+            return action.get("timing")
+    return None
+
+
+def run_size(label: str, size: tuple[int, int, int, int], repeat: int, env: dict[str, str], keep: bool) -> dict[str, Any]:
+    n, m, k, h = size
+    root = Path(tempfile.mkdtemp(prefix=f"archwf-bench-{label.replace(',', '-')}-"))
+    try:
+        start = time.perf_counter()
+        build_repo(root, n, m, k, h)
+        build_s = time.perf_counter() - start
+        timings: dict[str, list[float]] = {}
+        phases: dict[str, Any] = {}
+        exit_codes: dict[str, list[int]] = {}
+        for name, _ in commands(0):
+            for r in range(repeat):
+                argv = dict(commands(r))[name]
+                script = Path(argv[1]).name
+                start = time.perf_counter()
+                proc = subprocess.run(argv, cwd=root, env=env, capture_output=True, text=True)
+                elapsed = time.perf_counter() - start
+                if proc.returncode != 0:
+                    print(f"Warning: {name} exited {proc.returncode}: {proc.stderr.strip()[:300]}", file=sys.stderr)
+                exit_codes.setdefault(name, []).append(proc.returncode)
+                if elapsed <= min(timings.get(name, [elapsed])):
+                    phases[name] = last_timing(root, script)
+                timings.setdefault(name, []).append(elapsed)
+        return {
+            "size": {"label": label, "systems": n, "adrs": m, "wa_reviews": k, "history": h},
+            "build_s": round(build_s, 3),
+            "scripts": {
+                name: {
+                    "min_ms": round(min(values) * 1000, 3),
+                    "median_ms": round(statistics.median(values) * 1000, 3),
+                    "runs": len(values),
+                    "exit_codes": exit_codes[name],
+                    "recorded_timing": phases.get(name),
+                }
+                for name, values in timings.items()
+            },
+            **({"repo": str(root)} if keep else {}),
+        }
+    finally:
+        if not keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=SHARED, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        action="append",
+        help=f"Preset ({', '.join(PRESETS)}) or N,M,K,H = systems,ADRs,WA reviews,history entries (default: small).",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--env", action="append", default=[], help="Extra KEY=VALUE for the scripts, e.g. ARCHWF_MANIFEST_JOURNAL=1.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic repos for inspection.")
+    args = parser.parse_args()
+
+    env = {k: v for k, v in os.environ.items() if not k.startswith("ARCHWF_")}
+    env["ARCHWF_DAEMON"] = "off"
+    for item in args.env:
+        key, sep, value = item.partition("=")
+        if not sep:
+            print(f"Error: --env expects KEY=VALUE, got {item!r}.", file=sys.stderr)
+            return 2
+        env[key] = value
+
+    report = {
+        "benchmark": "workflow",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "yaml_backend": serialization.yaml_backend(),
+        "repeat": args.repeat,
+        "env": {k: v for k, v in env.items() if k.startswith("ARCHWF_")},
+        "results": [
+            run_size(label, size, args.repeat, env, args.keep) for label, size in args.size or [("small", PRESETS["small"])]
+        ],
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"Report: {args.output}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Time manifest load/dump with the pure-Python YAML, libyaml and JSON backends.
+
+Every YAML backend's document is also loaded by every other YAML backend
+and compared as data (not text: the dumpers wrap long escaped strings
+differently); a mismatch exits 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable
+
+import yaml
+
+
+def synthetic_manifest(actions: int) -> dict[str, Any]:
+    return {
+        "system": "bench",
+        "workflow_version": "1.0.0",
+        "artifacts": {"solution_overview": "docs/architecture/solution-overviews/bench.md"},
+        "adrs": [],
+        "wa_reviews": [],
+        "validations": [],
+        "decision_traces": [],
+        "actions": [
+            {
+                "script": "validate_archifacts.py",
+                "timestamp": f"2026-01-01T00:00:{i % 60:02d}+00:00",
+                "inputs": {"system": "bench", "interactive": False, "max_needs_work": 2},
+                "outputs": {"result": "pass", "issue_count": 0, "paths": [f"docs/architecture/reviews/r-{i}.md"]},
+                # Long non-ASCII text with control characters is dumped escaped and wrapped.
+                "notes": f"Überprüfung {i}: café, naïve, \x07 " * 8,
+                "exit_code": 0,
+                "workflow_version": "1.0.0",
+            }
+            for i in range(actions)
+        ],
+    }
+
+
+def backends() -> dict[str, tuple[Callable[[str], Any], Callable[[Any], str]]]:
+    out = {
+        "python": (
+            lambda text: yaml.load(text, Loader=yaml.SafeLoader),
+            lambda data: yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=True, default_flow_style=False),
+        ),
+        "json": (json.loads, lambda data: json.dumps(data, sort_keys=True)),
+    }
+    if getattr(yaml, "__with_libyaml__", False):
+        out["libyaml"] = (
+            lambda text: yaml.load(text, Loader=yaml.CSafeLoader),
+            lambda data: yaml.dump(data, Dumper=yaml.CSafeDumper, sort_keys=True, default_flow_style=False),
+        )
+    return out
+
+
+def best_of(fn: Callable[[Any], Any], arg: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--actions", type=int, action="append", help="Action count(s) per manifest (default: 1000 and 10000)."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    available = backends()
+    if "libyaml" not in available:
+        print("Warning: PyYAML was built without libyaml; skipping that backend.", file=sys.stderr)
+    results = []
+    for actions in args.actions or [1000, 10000]:
+        manifest = synthetic_manifest(actions)
+        row: dict[str, Any] = {"actions": actions}
+        for name, (load, dump) in available.items():
+            text = dump(manifest)
+            readers = [other for other in available if (other == "json") == (name == "json")]
+            for reader in readers:
+                if available[reader][0](text) != manifest:
+                    print(f"Error: {reader} cannot load the {name} backend's document back to the manifest.", file=sys.stderr)
+                    return 1
+            row[name] = {
+                "bytes": len(text.encode("utf-8")),
+                "load_ms": round(best_of(load, text, args.repeat) * 1000, 3),
+                "dump_ms": round(best_of(dump, manifest, args.repeat) * 1000, 3),
+            }
+        results.append(row)
+    print(json.dumps({"benchmark": "yaml_backends", "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+"""Shared support library for the architecture workflow scripts."""
+
+WORKFLOW_VERSION = "1.0.0"
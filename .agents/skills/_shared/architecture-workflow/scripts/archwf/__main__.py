@@ -0,0 +1,48 @@
+"""Single ``archwf`` entry point.
+
+Workflow subcommands (``init``, ``new-adr``, ...) hand the rest of the
+command line to the matching shared script, so ``archwf new-adr --help``
+is ``new_adr.py --help``. They are dispatched before anything else is
+imported; the maintenance commands live in :mod:`archwf.cli` and are only
+loaded when one of them runs. Runs from the scripts directory
+(``python3 scripts/archwf ...``) or from the zipapp built by
+``archwf zipapp``.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+if __package__ in (None, ""):
+    # Executed as `python3 .../scripts/archwf`: make the package importable.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# subcommand -> (script module, help)
+SCRIPT_COMMANDS = {
+    "init": ("init_arch_workflow", "Initialize the architecture workflow for a system"),
+    "new-adr": ("new_adr", "Create an ADR from the shared templates"),
+    "wa-review": ("wa_review", "Generate a Well-Architected review"),
+    "validate": ("validate_archifacts", "Validate architecture artifacts"),
+    "decision-trace": ("decision_trace", "Build the decision trace report"),
+}
+
+
+def run_script(module_name: str, argv: list[str]) -> int:
+    import importlib
+
+    sys.argv = [f"{module_name}.py", *argv]
+    return int(importlib.import_module(module_name).main() or 0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SCRIPT_COMMANDS:
+        return run_script(SCRIPT_COMMANDS[argv[0]][0], argv[1:])
+
+    from archwf import cli
+
+    return cli.main(argv, SCRIPT_COMMANDS)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
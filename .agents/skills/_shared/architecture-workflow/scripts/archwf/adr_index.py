@@ -0,0 +1,95 @@
+"""Persistent ADR key index shared by the validator and decision trace.
+
+The index lives at ``docs/architecture/.cache/adr-index.json`` and records,
+per ADR file, its size, mtime and the keys it can be referenced by (filename
+slug and ``decision_id``). Refreshing only re-reads ADRs whose size or mtime
+changed since the last run.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+from archwf import fileio
+
+INDEX_VERSION = 1
+DECISION_ID_RE = re.compile(r"^decision_id:\s*\"?([^\n\"]+)\"?\s*$", re.M)
+
+# Entries from the last refresh in this process; every entry is still
+# revalidated against the ADR's stat, so this only skips re-reading the
+# cache file (matters for the long-running daemon).
+_memory: dict[str, dict[str, Any]] = {}
+
+
+def cache_path(decisions_dir: Path) -> Path:
+    return decisions_dir.parent / ".cache" / "adr-index.json"
+
+
+def read_decision_id(adr: Path) -> str | None:
+    m = DECISION_ID_RE.search(fileio.read_text(adr))
+    return m.group(1).strip() if m else None
+
+
+def load_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(fileio.read_text(path))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(path: Path, entries: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fileio.write_text(tmp, json.dumps({"version": INDEX_VERSION, "entries": entries}, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        # The cache is an optimization; a read-only checkout still validates.
+        pass
+
+
+def refresh(decisions_dir: Path) -> dict[str, dict[str, Any]]:
+    path = cache_path(decisions_dir)
+    cached = _memory.get(str(path))
+    if cached is None:
+        cached = load_cache(path)
+    entries: dict[str, dict[str, Any]] = {}
+    changed = False
+    for adr in sorted(decisions_dir.glob("ADR-*.md")):
+        st = adr.stat()
+        entry = cached.get(adr.name)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            entries[adr.name] = entry
+            continue
+        entries[adr.name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "slug": adr.stem.split("-", 2)[-1],
+            "decision_id": read_decision_id(adr),
+        }
+        changed = True
+    if changed or len(entries) != len(cached):
+        save_cache(path, entries)
+    _memory[str(path)] = entries
+    return entries
+
+
+def adr_index(decisions_dir: Path) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for name, entry in refresh(decisions_dir).items():
+        adr_path = str(decisions_dir / name)
+        out[entry["slug"]] = adr_path
+        if entry.get("decision_id"):
+            out[entry["decision_id"]] = adr_path
+    return out
+
+
+def adr_keys(decisions_dir: Path) -> set[str]:
+    return set(adr_index(decisions_dir))
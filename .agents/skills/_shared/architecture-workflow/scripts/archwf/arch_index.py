@@ -0,0 +1,193 @@
+"""Structured backing store for ``docs/architecture/index.md``.
+
+The index is kept as the file's own lines in
+``docs/architecture/.cache/architecture-index.json`` together with the
+``index.md`` stat it was last rendered to. Membership is an exact-line set
+lookup over the top-level bullets (not a substring scan of the whole file),
+and ``index.md`` is only rewritten when an entry was actually added.
+
+Existing text is never reordered: headings, blank lines, nested notes and
+hand-sorted bullets render back byte-for-byte. A missing bullet is inserted
+after the last bullet of the same or an earlier kind in ``KIND_ORDER``
+(after its nested lines), before the first bullet if there is none, or at
+the end of a file without bullets. When ``index.md`` was edited by hand
+(its stat no longer matches the sidecar) it is parsed again.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+from archwf import fileio
+
+INDEX_VERSION = 2
+HEADER = "# Architecture Index\n\n"
+KIND_ORDER = [
+    "Decisions",
+    "Reviews",
+    "Diagrams",
+    "Threat Models",
+    "Runbooks",
+    "Solution Overviews",
+    "Manifest",
+    "ADR",
+]
+_RANK = {kind: i for i, kind in enumerate(KIND_ORDER)}
+
+
+def index_md_path(arch_root: Path) -> Path:
+    return arch_root / "index.md"
+
+
+def sidecar_path(arch_root: Path) -> Path:
+    return arch_root / ".cache" / "architecture-index.json"
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def adr_line(adr_name: str) -> str:
+    return f"- ADR: `docs/architecture/decisions/{adr_name}`"
+
+
+def rank(line: str) -> int:
+    kind = line[2:].split(":", 1)[0].strip()
+    # Directory links keep their fixed order; ADRs and other bullets follow.
+    return _RANK.get(kind, len(KIND_ORDER))
+
+
+def is_bullet(line: str) -> bool:
+    return line.startswith("- ")
+
+
+class ArchitectureIndex:
+    def __init__(self, lines: Iterable[str] = ()) -> None:
+        self.lines = list(lines)
+        self.pending: dict[int, list[str]] = {}
+        self.cached = False
+        self.scan()
+
+    def scan(self) -> None:
+        """Index the top-level bullets: members, and where each kind's block ends."""
+        self.members: set[str] = set()
+        self.block_end: dict[int, int] = {}
+        self.first_bullet: int | None = None
+        current: int | None = None
+        for i, line in enumerate(self.lines):
+            bare = line.rstrip("\n")
+            if is_bullet(bare):
+                self.members.add(bare.rstrip())
+                if self.first_bullet is None:
+                    self.first_bullet = i
+                current = rank(bare)
+                self.block_end[current] = i
+            elif current is not None and bare.strip() and bare[:1] in (" ", "\t"):
+                # Nested list items and continuation lines belong to the bullet above.
+                self.block_end[current] = i
+            else:
+                current = None
+
+    @classmethod
+    def parse(cls, text: str) -> "ArchitectureIndex":
+        return cls(text.splitlines(keepends=True))
+
+    def __contains__(self, line: str) -> bool:
+        return line in self.members
+
+    def anchor(self, line: str) -> int:
+        """Index of the line ``line`` goes after (-1: top of file)."""
+        own = rank(line)
+        earlier = [end for kind, end in self.block_end.items() if kind <= own]
+        if earlier:
+            return max(earlier)
+        if self.first_bullet is not None:
+            return self.first_bullet - 1
+        return len(self.lines) - 1
+
+    def add(self, line: str) -> bool:
+        """Queue ``line`` for insertion in its section; returns False if it was already present."""
+        line = line.rstrip()
+        if line in self.members:
+            return False
+        self.pending.setdefault(self.anchor(line), []).append(line + "\n")
+        self.members.add(line)
+        return True
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        if not self.lines:
+            self.lines = HEADER.splitlines(keepends=True)
+            self.pending = {len(self.lines) - 1: self.pending.pop(-1)}
+        elif self.first_bullet is None and len(self.lines) - 1 in self.pending and self.lines[-1].strip():
+            # First bullets of a file that only has prose: keep a blank line before the list.
+            self.pending[len(self.lines) - 1].insert(0, "\n")
+        out = list(self.pending.get(-1, []))
+        for i, line in enumerate(self.lines):
+            added = self.pending.get(i)
+            if added and not line.endswith("\n"):
+                line += "\n"
+            out.append(line)
+            out.extend(added or ())
+        self.lines = out
+        self.pending = {}
+        self.scan()
+
+    def render(self) -> str:
+        self.flush()
+        return "".join(self.lines)
+
+    def to_json(self) -> dict:
+        self.flush()
+        return {"version": INDEX_VERSION, "lines": self.lines}
+
+
+def load(arch_root: Path) -> ArchitectureIndex:
+    """Load the sidecar, or re-parse ``index.md`` if it changed outside this module."""
+    md_path = index_md_path(arch_root)
+    stamp = file_stamp(md_path)
+    try:
+        data = json.loads(fileio.read_text(sidecar_path(arch_root)))
+    except (OSError, ValueError):
+        data = None
+    if isinstance(data, dict) and data.get("version") == INDEX_VERSION and data.get("stamp") == stamp:
+        index = ArchitectureIndex(data.get("lines", []))
+        index.cached = True
+        return index
+    if stamp is None:
+        return ArchitectureIndex()
+    return ArchitectureIndex.parse(fileio.read_text(md_path))
+
+
+def save_sidecar(arch_root: Path, index: ArchitectureIndex) -> None:
+    path = sidecar_path(arch_root)
+    data = {**index.to_json(), "stamp": file_stamp(index_md_path(arch_root))}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fileio.write_text(tmp, json.dumps(data, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        # The sidecar is an optimization; index.md stays the source of truth.
+        pass
+
+
+def update(arch_root: Path, lines: Iterable[str]) -> bool:
+    """Add ``lines`` to the index; returns True if ``index.md`` was (re)written."""
+    md_path = index_md_path(arch_root)
+    with fileio.locked(sidecar_path(arch_root)):
+        index = load(arch_root)
+        added = [line for line in lines if index.add(line)]
+        write = bool(added) or not md_path.exists()
+        if write:
+            fileio.atomic_write_text(md_path, index.render(), fsync=False)
+        if write or not index.cached:
+            save_sidecar(arch_root, index)
+    return write
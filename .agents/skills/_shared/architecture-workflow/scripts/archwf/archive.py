@@ -0,0 +1,200 @@
+"""Manifest history retention and archive tiers.
+
+Only the newest entries of the ``actions`` and ``validations`` sections stay
+inline in ``<system>.yaml``; older ones are moved to gzip-compressed JSON
+lines under ``manifest-archive/<system>/YYYY-MM.jsonl.gz`` beside the
+manifest, partitioned by each entry's ``timestamp``. Each save appends a new
+gzip member, so archive files are never rewritten.
+
+Retention comes from the manifest's own ``retention`` mapping (e.g.
+``{actions: 200, validations: 50}``) or, failing that, from
+``ARCHWF_MANIFEST_RETAIN`` applied to both sections; values that are not
+positive integers are skipped with a warning. Without either, nothing is
+rotated. Sections are trimmed back to their limit only once they exceed it
+by a quarter, so a full snapshot rewrite is not paid on every save.
+
+Archived entries are stored with artifact ids expanded to their paths, so
+they do not depend on the manifest's ``artifact_table``; after a rotation
+the table keeps only the ids still used inline.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+from archwf import timing
+
+RETAIN_ENV = "ARCHWF_MANIFEST_RETAIN"
+SECTIONS = ("actions", "validations")
+MONTH_RE = re.compile(r"^(\d{4})-(\d{2})")
+
+
+def archive_dir(manifest_path: Path) -> Path:
+    return manifest_path.parent / "manifest-archive" / manifest_path.stem
+
+
+def partition(entry: Any) -> str:
+    stamp = entry.get("timestamp") if isinstance(entry, dict) else None
+    m = MONTH_RE.match(str(stamp or ""))
+    return f"{m.group(1)}-{m.group(2)}" if m else "undated"
+
+
+def positive_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def retention(manifest: dict[str, Any]) -> dict[str, int]:
+    configured = manifest.get("retention")
+    if isinstance(configured, dict):
+        limits = {}
+        for section, value in configured.items():
+            if section not in SECTIONS:
+                continue
+            keep = positive_int(value)
+            if keep is None:
+                print(f"Warning: ignoring manifest retention.{section}={value!r}; expected a positive integer.", file=sys.stderr)
+            else:
+                limits[section] = keep
+        return limits
+    raw = os.environ.get(RETAIN_ENV, "").strip()
+    if not raw:
+        return {}
+    keep = positive_int(raw)
+    if keep is None:
+        print(f"Warning: ignoring {RETAIN_ENV}={raw!r}; expected a positive integer.", file=sys.stderr)
+        return {}
+    return {section: keep for section in SECTIONS}
+
+
+def expand(value: Any, table: dict[str, Any]) -> Any:
+    """Replace artifact ids from ``table`` (recursively) with their paths."""
+    if isinstance(value, dict):
+        return {k: expand(v, table) for k, v in value.items()}
+    if isinstance(value, list):
+        return [expand(v, table) for v in value]
+    if isinstance(value, str):
+        return table.get(value, value)
+    return value
+
+
+def referenced_ids(value: Any, table: dict[str, Any], found: set[str]) -> None:
+    if isinstance(value, dict):
+        for v in value.values():
+            referenced_ids(v, table, found)
+    elif isinstance(value, list):
+        for v in value:
+            referenced_ids(v, table, found)
+    elif isinstance(value, str) and value in table:
+        found.add(value)
+
+
+def prune_artifact_table(manifest: dict[str, Any]) -> int:
+    """Drop ``artifact_table`` ids no inline entry uses; returns how many were dropped."""
+    table = manifest.get("artifact_table")
+    if not isinstance(table, dict):
+        return 0
+    used: set[str] = set()
+    for key, value in manifest.items():
+        if key != "artifact_table":
+            referenced_ids(value, table, used)
+    unused = [ref for ref in table if ref not in used]
+    if unused:
+        manifest["artifact_table"] = {ref: path for ref, path in table.items() if ref in used}
+    return len(unused)
+
+
+def write_entries(manifest_path: Path, section: str, entries: list[Any]) -> None:
+    groups: dict[str, list[str]] = {}
+    for entry in entries:
+        line = json.dumps({"section": section, "entry": entry}, sort_keys=True, default=str)
+        groups.setdefault(partition(entry), []).append(line + "\n")
+    import gzip
+
+    directory = archive_dir(manifest_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    for month, lines in sorted(groups.items()):
+        with open(directory / f"{month}.jsonl.gz", "ab") as raw:
+            start = raw.tell()
+            with gzip.GzipFile(fileobj=raw, mode="ab") as fh:
+                fh.write("".join(lines).encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+            timing.count_written(raw.tell() - start)
+
+
+def rotate(
+    manifest_path: Path,
+    manifest: dict[str, Any],
+    keep: dict[str, int] | None = None,
+    *,
+    slack: bool = True,
+) -> int:
+    """Move entries beyond the retention limit to the archive; returns how many moved.
+
+    Archive files are written before the caller saves the trimmed manifest,
+    so an interrupted save can duplicate archived entries but never lose them.
+    """
+    limits = retention(manifest) if keep is None else keep
+    table = manifest.get("artifact_table")
+    table = table if isinstance(table, dict) else {}
+    moved = 0
+    for section, limit in limits.items():
+        entries = manifest.get(section)
+        if not isinstance(entries, list):
+            continue
+        threshold = limit + (max(1, limit // 4) if slack else 0)
+        if len(entries) <= threshold:
+            continue
+        cut = len(entries) - limit
+        write_entries(manifest_path, section, [expand(entry, table) for entry in entries[:cut]])
+        manifest[section] = entries[cut:]
+        moved += cut
+    if moved:
+        prune_artifact_table(manifest)
+    return moved
+
+
+def iter_archived(manifest_path: Path, section: str | None = None) -> Iterator[tuple[str, Any]]:
+    """Yield ``(section, entry)`` from the archive, oldest month first."""
+    directory = archive_dir(manifest_path)
+    if not directory.is_dir():
+        return
+    import gzip
+
+    for path in sorted(directory.glob("*.jsonl.gz")):
+        timing.count_file(path)
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    raise RuntimeError(f"Manifest archive {path} has an unreadable record at line {lineno}.")
+                if section is None or record.get("section") == section:
+                    yield record.get("section"), record.get("entry")
+
+
+def iter_history(
+    manifest_path: Path,
+    manifest: dict[str, Any],
+    section: str | None = None,
+) -> Iterator[tuple[str, str, Any]]:
+    """Yield ``(tier, section, entry)`` across the archive and the inline manifest."""
+    for name, entry in iter_archived(manifest_path, section):
+        yield "archive", name, entry
+    for name in [section] if section else SECTIONS:
+        entries = manifest.get(name)
+        if isinstance(entries, list):
+            for entry in entries:
+                yield "inline", name, entry
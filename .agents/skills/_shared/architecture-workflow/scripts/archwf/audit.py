@@ -0,0 +1,329 @@
+"""Hash-chained audit log (``docs/architecture/audit/audit-log.jsonl``).
+
+One JSON event per line, in the shape of ``examples/*/audit/audit-log.jsonl``.
+Every event carries ``prev_event_hash`` (the previous line's
+``event_hash``; 64 zeros for the first, genesis event) and ``event_hash``,
+the SHA-256 of the event's canonical JSON (sorted keys, no whitespace,
+UTF-8) with ``event_hash`` itself left out. Editing, dropping or reordering
+any line breaks the chain from that point on.
+
+Events are buffered and group-committed: a commit chains the whole buffer
+onto the log's current tail under an advisory lock, appends it with one
+write and one ``fsync``. Threads that commit while another commit is in
+flight queue behind it and their events go out together in the next
+batch. The tail hash is remembered between commits and only re-read
+(from the end of the file) when another process appended in between.
+
+The workflow scripts log one event per recorded action (one per ADR for
+``new_adr.py --batch``) when the manifest is saved. ``ARCHWF_AUDIT=off``
+disables logging, ``ARCHWF_AUDIT_LOG`` moves the log (relative paths are
+taken from the repo root), and ``ARCHWF_SESSION_ID`` / ``ARCHWF_AUDIT_ACTOR``
+fill in ``session_id`` and ``actor``.
+
+The manifest is the record of the run: when the log cannot be written after
+a successful manifest save, the script warns and keeps the events buffered
+for the next commit or the exit-time flush, which also only warns.
+``ARCHWF_AUDIT=strict`` makes an audit failure fail the save instead.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from archwf import fileio
+from archwf import timing
+
+AUDIT_ENV = "ARCHWF_AUDIT"
+LOG_ENV = "ARCHWF_AUDIT_LOG"
+BATCH_ENV = "ARCHWF_AUDIT_BATCH"
+SESSION_ENV = "ARCHWF_SESSION_ID"
+ACTOR_ENV = "ARCHWF_AUDIT_ACTOR"
+DEFAULT_BATCH_SIZE = 256
+GENESIS_HASH = "0" * 64
+GENESIS_ID = "00000000-0000-0000-0000-000000000000"
+STAGES = {
+    "init_arch_workflow.py": "init",
+    "new_adr.py": "decision",
+    "wa_review.py": "review",
+    "validate_archifacts.py": "validation",
+    "decision_trace.py": "traceability",
+    "run_evals.py": "evaluation",
+}
+
+
+def enabled() -> bool:
+    return os.environ.get(AUDIT_ENV, "").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def strict() -> bool:
+    return os.environ.get(AUDIT_ENV, "").strip().lower() == "strict"
+
+
+def log_path(repo_root: Path) -> Path:
+    override = os.environ.get(LOG_ENV, "").strip()
+    if override:
+        return repo_root / override
+    return repo_root / "docs" / "architecture" / "audit" / "audit-log.jsonl"
+
+
+def canonical(event: dict[str, Any]) -> bytes:
+    body = {k: v for k, v in event.items() if k != "event_hash"}
+    return json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def event_hash(event: dict[str, Any]) -> str:
+    import hashlib
+
+    return hashlib.sha256(canonical(event)).hexdigest()
+
+
+def uuid4() -> str:
+    """Random (version 4) UUID string; ``uuid`` itself imports ``platform`` at startup."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def new_event(
+    *,
+    stage: str,
+    decision: str,
+    project_id: str | None,
+    timestamp: str,
+    adr_id: str | None = None,
+    adr_path: str | None = None,
+    references: list[str] | None = None,
+    event_id: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "event_id": event_id or uuid4(),
+        "timestamp": timestamp,
+        "stage": stage,
+        "actor": os.environ.get(ACTOR_ENV) or "agent",
+        "session_id": os.environ.get(SESSION_ENV) or None,
+        "project_id": project_id,
+        "decision": decision,
+        "adr_id": adr_id,
+        "adr_path": adr_path,
+        "assumptions": [],
+        "cost": None,
+        "references": references or [],
+        "approval": None,
+    }
+
+
+def read_tail(path: Path) -> tuple[int, str | None]:
+    """Return ``(size, event_hash of the last line)``; the hash is None for an empty log."""
+    try:
+        fh = path.open("rb")
+    except FileNotFoundError:
+        return 0, None
+    with fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return 0, None
+        # Read backwards until the chunk holds the whole last line.
+        block = 4096
+        tail = b""
+        pos = size
+        while pos > 0 and tail.count(b"\n") < 2:
+            step = min(block, pos)
+            pos -= step
+            fh.seek(pos)
+            tail = fh.read(step) + tail
+            block *= 2
+    timing.count_read(len(tail))
+    if not tail.endswith(b"\n"):
+        raise RuntimeError(f"Audit log {path} ends with a partial record; repair it before appending.")
+    line = tail[:-1].rsplit(b"\n", 1)[-1]
+    try:
+        last = json.loads(line)
+    except ValueError as exc:
+        raise RuntimeError(f"Audit log {path} has an unreadable last record: {exc}")
+    value = last.get("event_hash") if isinstance(last, dict) else None
+    if not (isinstance(value, str) and len(value) == 64 and all(c in "0123456789abcdef" for c in value)):
+        raise RuntimeError(f"Audit log {path} last record has no valid event_hash; the chain cannot be extended.")
+    return size, value
+
+
+def hash_before(log: Path, offset: int) -> str | None:
+    """``event_hash`` of the record that ends exactly at ``offset``."""
+    with log.open("rb") as fh:
+        back = min(offset, 65536)
+        fh.seek(offset - back)
+        chunk = fh.read(back)
+    if not chunk.endswith(b"\n"):
+        return None
+    try:
+        return json.loads(chunk[:-1].rsplit(b"\n", 1)[-1]).get("event_hash")
+    except (ValueError, AttributeError):
+        return None
+
+
+class AuditLog:
+    """Buffered, group-committing writer for one audit log file."""
+
+    def __init__(self, path: Path, batch_size: int = DEFAULT_BATCH_SIZE, *, fsync: bool = True) -> None:
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.fsync = fsync
+        self.pending: list[dict[str, Any]] = []
+        self.lock = threading.Lock()
+        # Serializes commits; appends keep buffering while one is in flight.
+        self.commit_lock = threading.Lock()
+        # (file size, last event_hash) as of this writer's last commit.
+        self.tail: tuple[int, str | None] | None = None
+        self.commits = 0
+
+    def append(self, event: dict[str, Any]) -> None:
+        with self.lock:
+            self.pending.append(event)
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def extend(self, events: Iterable[dict[str, Any]]) -> None:
+        with self.lock:
+            self.pending.extend(events)
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def current_tail(self) -> tuple[int, str | None]:
+        if self.tail is not None:
+            try:
+                if self.path.stat().st_size == self.tail[0]:
+                    return self.tail
+            except FileNotFoundError:
+                pass
+        return read_tail(self.path)
+
+    def flush(self) -> int:
+        """Commit everything buffered; returns the number of events written."""
+        with self.commit_lock:
+            with self.lock:
+                batch, self.pending = self.pending, []
+            if not batch:
+                return 0
+            try:
+                data = self.commit(batch)
+            except BaseException:
+                # Nothing (or only a torn tail) reached the log; keep the events for a retry.
+                with self.lock:
+                    self.pending[:0] = batch
+                raise
+            self.commits += 1
+        timing.count_written(len(data))
+        return len(batch)
+
+    def commit(self, batch: list[dict[str, Any]]) -> bytes:
+        with fileio.locked(self.path):
+            _, prev = self.current_tail()
+            if prev is None:
+                first = batch[0]
+                genesis = new_event(
+                    stage=first.get("stage") or "init",
+                    decision="audit log initialized (genesis)",
+                    project_id=first.get("project_id"),
+                    timestamp=first.get("timestamp") or "",
+                    event_id=GENESIS_ID,
+                )
+                genesis["session_id"] = first.get("session_id")
+                batch = [genesis, *batch]
+                prev = GENESIS_HASH
+            lines = []
+            for event in batch:
+                record = {**event, "prev_event_hash": prev}
+                prev = record["event_hash"] = event_hash(record)
+                lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str))
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                if self.fsync:
+                    os.fsync(fd)
+                self.tail = (os.fstat(fd).st_size, prev)
+            finally:
+                os.close(fd)
+        return data
+
+
+_writers: dict[str, AuditLog] = {}
+_writers_lock = threading.Lock()
+
+
+def writer(path: Path) -> AuditLog:
+    """Process-wide writer for ``path``; buffered events are committed at exit."""
+    key = os.path.abspath(path)
+    with _writers_lock:
+        log = _writers.get(key)
+        if log is None:
+            if not _writers:
+                atexit.register(flush_all)
+            raw = os.environ.get(BATCH_ENV, "").strip()
+            try:
+                batch_size = int(raw or DEFAULT_BATCH_SIZE)
+            except ValueError:
+                print(f"Warning: ignoring {BATCH_ENV}={raw!r}; expected an integer.", file=sys.stderr)
+                batch_size = DEFAULT_BATCH_SIZE
+            log = _writers[key] = AuditLog(Path(key), batch_size)
+    return log
+
+
+def flush_all() -> None:
+    """Exit hook: commit what is still buffered, warning (never raising) on failure."""
+    for log in list(_writers.values()):
+        try:
+            log.flush()
+        except Exception as exc:
+            print(f"Warning: {len(log.pending)} audit event(s) were not written to {log.path}: {exc}", file=sys.stderr)
+
+
+def action_events(system: str, action: dict[str, Any], portable: Callable[[Any], Any]) -> list[dict[str, Any]]:
+    """Audit events for one manifest action: one per ADR it created, else one for the run."""
+    script = str(action.get("script") or "")
+    stage = STAGES.get(script, Path(script).stem or "workflow")
+    timestamp = str(action.get("timestamp") or "")
+    outputs = action.get("outputs") if isinstance(action.get("outputs"), dict) else {}
+    references = []
+    for key, value in sorted(outputs.items()):
+        values = value if isinstance(value, list) else [value]
+        if key.endswith(("_path", "_paths")):
+            references.extend(str(portable(v)) for v in values if isinstance(v, str) and v)
+
+    adr_paths = [str(portable(v)) for v in outputs.get("adr_paths", [outputs.get("adr_path")]) if v]
+    if script == "new_adr.py" and adr_paths:
+        return [
+            new_event(
+                stage=stage,
+                decision=f"ADR created: {Path(path).name}",
+                project_id=system,
+                timestamp=timestamp,
+                adr_id=Path(path).stem,
+                adr_path=path,
+                references=[path],
+            )
+            for path in adr_paths
+        ]
+    exit_code = action.get("exit_code", 0)
+    outcome = "completed" if exit_code == 0 else f"failed (exit {exit_code})"
+    return [new_event(stage=stage, decision=f"{script} {outcome}", project_id=system, timestamp=timestamp, references=references)]
+
+
+def record_actions(repo_root: Path, system: str, actions: list[dict[str, Any]], portable: Callable[[Any], Any]) -> None:
+    """Log and commit the events for ``actions`` (called after the manifest save)."""
+    if not actions or not enabled():
+        return
+    with timing.phase("audit"):
+        log = writer(log_path(repo_root))
+        log.extend(event for action in actions for event in action_events(system, action, portable))
+        log.flush()
@@ -0,0 +1,199 @@
+"""SQLite sidecar index over the audit log (``<log>.index.sqlite``).
+
+One row per event: its index, byte offset and length in the log, plus the
+fields queries filter on (``timestamp``, ``stage``, ``actor``,
+``session_id``, ``project_id``, ``adr_id``), each with a B-tree index led by
+the field and followed by the timestamp. A query resolves matching offsets
+in SQLite and then reads just those lines from the log, so it never scans
+the log itself.
+
+The index is brought up to date before every query by parsing only the
+bytes appended since the last update (up to the last complete line, so a
+batch still being written is picked up next time). If the log no longer
+ends the indexed prefix with the same ``event_hash`` it was rewritten, and
+the index is rebuilt from scratch; so is an unreadable index file. The
+index is derived data and is written without fsync.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator
+
+from archwf import audit
+
+SCHEMA_VERSION = 1
+FIELDS = ("stage", "actor", "session_id", "project_id", "adr_id")
+INSERT_BATCH = 10000
+
+
+def index_path(log: Path) -> Path:
+    return log.with_name(f"{log.name}.index.sqlite")
+
+
+def _create(db: sqlite3.Connection) -> None:
+    db.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+        CREATE TABLE IF NOT EXISTS events (
+            idx INTEGER PRIMARY KEY,
+            offset INTEGER NOT NULL,
+            length INTEGER NOT NULL,
+            timestamp TEXT,
+            stage TEXT,
+            actor TEXT,
+            session_id TEXT,
+            project_id TEXT,
+            adr_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+        """
+        + "".join(f"CREATE INDEX IF NOT EXISTS events_{f} ON events ({f}, timestamp);\n" for f in FIELDS)
+    )
+    db.execute("INSERT OR IGNORE INTO meta VALUES ('version', ?)", (SCHEMA_VERSION,))
+
+
+def connect(log: Path) -> sqlite3.Connection:
+    path = index_path(log)
+    for attempt in (1, 2):
+        db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA synchronous=OFF")
+            _create(db)
+            version = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if version and version[0] == SCHEMA_VERSION:
+                return db
+        except sqlite3.DatabaseError:
+            if attempt == 2:
+                raise
+        db.close()
+        # Unreadable or from another schema version: it is derived data, start over.
+        path.unlink(missing_ok=True)
+    raise RuntimeError(f"Cannot open audit index {path}.")
+
+
+def _meta(db: sqlite3.Connection, key: str) -> Any:
+    row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def update(log: Path, db: sqlite3.Connection | None = None) -> int:
+    """Index events appended since the last update; returns how many were added."""
+    own = db is None
+    db = db or connect(log)
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            added = _update(log, db)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return added
+    finally:
+        if own:
+            db.close()
+
+
+def _update(log: Path, db: sqlite3.Connection) -> int:
+    offset = _meta(db, "offset") or 0
+    count = _meta(db, "count") or 0
+    head = _meta(db, "head")
+    size = log.stat().st_size if log.exists() else 0
+    if offset and (size < offset or audit.hash_before(log, offset) != head):
+        db.execute("DELETE FROM events")
+        offset = count = 0
+        head = None
+    if size == offset:
+        return 0
+
+    added = 0
+    rows: list[tuple[Any, ...]] = []
+    with log.open("rb") as fh:
+        fh.seek(offset)
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                event = json.loads(line)
+            except ValueError:
+                raise RuntimeError(f"Audit log {log} has an unreadable record at byte {offset}.")
+            if not isinstance(event, dict):
+                raise RuntimeError(f"Audit log {log} has a non-object record at byte {offset}.")
+            rows.append(
+                (count, offset, len(line), event.get("timestamp"), *(event.get(field) for field in FIELDS))
+            )
+            head = event.get("event_hash")
+            offset += len(line)
+            count += 1
+            added += 1
+            if len(rows) >= INSERT_BATCH:
+                db.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                rows.clear()
+    if rows:
+        db.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    db.executemany(
+        "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+        [("offset", offset), ("count", count), ("head", head)],
+    )
+    return added
+
+
+def _where(filters: dict[str, Any], since: str | None, until: str | None) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for field in FIELDS:
+        value = filters.get(field)
+        if value is not None:
+            clauses.append(f"{field} = ?")
+            params.append(value)
+    if since:
+        clauses.append("timestamp >= ?")
+        params.append(since)
+    if until:
+        # Inclusive prefix match, as in `archwf history`: 2025-01 covers all of January.
+        clauses.append("timestamp <= ?")
+        params.append(until + "\uffff")
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def count(log: Path, *, since: str | None = None, until: str | None = None, **filters: Any) -> int:
+    db = connect(log)
+    try:
+        update(log, db)
+        where, params = _where(filters, since, until)
+        return db.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()[0]
+    finally:
+        db.close()
+
+
+def query(
+    log: Path,
+    *,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int | None = None,
+    **filters: Any,
+) -> Iterator[bytes]:
+    """Yield the raw log lines (without newline) of matching events, oldest first.
+
+    ``filters`` are exact matches on :data:`FIELDS`; ``limit`` keeps the newest N.
+    """
+    db = connect(log)
+    try:
+        update(log, db)
+        where, params = _where(filters, since, until)
+        if limit is not None:
+            rows = db.execute(
+                f"SELECT offset, length FROM events{where} ORDER BY idx DESC LIMIT ?", [*params, max(0, limit)]
+            ).fetchall()
+            rows.reverse()
+        else:
+            rows = db.execute(f"SELECT offset, length FROM events{where} ORDER BY idx", params).fetchall()
+    finally:
+        db.close()
+    with log.open("rb") as fh:
+        for offset, length in rows:
+            fh.seek(offset)
+            yield fh.read(length).rstrip(b"\n")
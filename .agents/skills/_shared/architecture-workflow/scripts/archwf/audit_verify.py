@@ -0,0 +1,290 @@
+"""Parallel, checkpointed verification of the audit log hash chain.
+
+Every line only links to its neighbour, so the log can be checked in
+independent byte ranges (split on line boundaries): each worker
+recomputes the ``event_hash`` of every event in its range, checks the
+``prev_event_hash`` links inside it and returns the range's first
+``prev_event_hash``, last ``event_hash``, event count and Merkle root. The
+parent then only has to stitch neighbouring ranges together.
+
+A successful run appends one checkpoint per verified range to
+``<log>.checkpoints.jsonl``: the range's event indices and byte offsets,
+the chain head after it (``event_hash``, the cumulative hash), the Merkle
+root of its event hashes (RFC 6962 tree, SHA-256) and
+``checkpoint_hash``, which chains each checkpoint to the one before.
+With ``ARCHWF_AUDIT_CHECKPOINT_KEY`` set, checkpoints are also signed
+(HMAC-SHA256 over ``checkpoint_hash``) and unsigned or mis-signed ones are
+rejected.
+
+A full run re-verifies each checkpointed range against its checkpoint, in
+parallel, plus everything after the last one. An incremental run trusts
+the checkpointed prefix once the checkpoint chain and signatures check out
+and the log's event at the last checkpoint still has the recorded hash,
+so it only reads the events appended since.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from archwf import audit
+from archwf import fileio
+
+KEY_ENV = "ARCHWF_AUDIT_CHECKPOINT_KEY"
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+
+def checkpoints_path(log: Path) -> Path:
+    return log.with_name(f"{log.name}.checkpoints.jsonl")
+
+
+def _leaf(digest: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + digest).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class MerkleBuilder:
+    """Streaming RFC 6962 Merkle tree root; keeps O(log n) subtree roots."""
+
+    def __init__(self) -> None:
+        self.stack: list[tuple[int, bytes]] = []
+
+    def add(self, event_hash: str) -> None:
+        size, node = 1, _leaf(bytes.fromhex(event_hash))
+        while self.stack and self.stack[-1][0] == size:
+            left = self.stack.pop()[1]
+            size, node = size * 2, _node(left, node)
+        self.stack.append((size, node))
+
+    def root(self) -> str:
+        if not self.stack:
+            return hashlib.sha256(b"").hexdigest()
+        node = self.stack[-1][1]
+        for _, left in reversed(self.stack[:-1]):
+            node = _node(left, node)
+        return node.hex()
+
+
+def verify_range(path: str, start: int, end: int) -> dict[str, Any]:
+    """Check the events in bytes ``[start, end)`` of ``path``; runs in a worker process."""
+    count = 0
+    first_prev: str | None = None
+    prev: str | None = None
+    merkle = MerkleBuilder()
+    error = None
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        offset = start
+        while offset < end:
+            line = fh.readline()
+            if not line:
+                error = "log is shorter than expected"
+                break
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                error = "partial record at the end of the log"
+                break
+            try:
+                event = json.loads(line)
+                recorded = event["event_hash"]
+                link = event["prev_event_hash"]
+            except (ValueError, KeyError, TypeError) as exc:
+                error = f"unreadable record: {exc}"
+                break
+            if prev is not None and link != prev:
+                error = "prev_event_hash does not match the previous event_hash"
+                break
+            if audit.event_hash(event) != recorded:
+                error = "event_hash does not match the event content"
+                break
+            if first_prev is None:
+                first_prev = link
+            prev = recorded
+            merkle.add(recorded)
+            count += 1
+    return {
+        "start": start,
+        "end": end,
+        "count": count,
+        "first_prev": first_prev,
+        "last_hash": prev,
+        "merkle_root": merkle.root(),
+        "error": error,
+    }
+
+
+def split_ranges(path: Path, start: int, end: int, segment_bytes: int) -> list[tuple[int, int]]:
+    """Cut ``[start, end)`` into ranges of about ``segment_bytes``, each ending on a newline."""
+    ranges = []
+    with path.open("rb") as fh:
+        while start < end:
+            cut = min(start + segment_bytes, end)
+            if cut < end:
+                fh.seek(cut - 1)
+                rest = fh.readline()
+                cut = min(cut - 1 + len(rest), end)
+            ranges.append((start, cut))
+            start = cut
+    return ranges
+
+
+def checkpoint_key() -> bytes | None:
+    key = os.environ.get(KEY_ENV, "")
+    return key.encode("utf-8") if key else None
+
+
+def checkpoint_digest(cp: dict[str, Any]) -> str:
+    body = {k: v for k, v in cp.items() if k not in {"checkpoint_hash", "signature"}}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def sign(checkpoint_hash: str, key: bytes) -> str:
+    return hmac.new(key, checkpoint_hash.encode("ascii"), hashlib.sha256).hexdigest()
+
+
+def load_checkpoints(log: Path) -> list[dict[str, Any]]:
+    """Read and check the checkpoint chain; raises RuntimeError if it was tampered with."""
+    path = checkpoints_path(log)
+    if not path.exists():
+        return []
+    key = checkpoint_key()
+    checkpoints: list[dict[str, Any]] = []
+    prev_hash = audit.GENESIS_HASH
+    expected = {"end_index": 0, "end_offset": 0, "event_hash": audit.GENESIS_HASH}
+    for lineno, line in enumerate(fileio.read_text(path).splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            cp = json.loads(line)
+        except ValueError as exc:
+            raise RuntimeError(f"{path}:{lineno}: unreadable checkpoint: {exc}")
+        if not isinstance(cp, dict) or cp.get("prev_checkpoint_hash") != prev_hash or checkpoint_digest(cp) != cp.get("checkpoint_hash"):
+            raise RuntimeError(f"{path}:{lineno}: checkpoint chain is broken.")
+        if (cp.get("start_index"), cp.get("start_offset"), cp.get("prev_event_hash")) != (
+            expected["end_index"],
+            expected["end_offset"],
+            expected["event_hash"],
+        ):
+            raise RuntimeError(f"{path}:{lineno}: checkpoint does not start where the previous one ended.")
+        if key is not None and not hmac.compare_digest(str(cp.get("signature", "")), sign(cp["checkpoint_hash"], key)):
+            raise RuntimeError(f"{path}:{lineno}: checkpoint signature is missing or invalid.")
+        checkpoints.append(cp)
+        prev_hash = cp["checkpoint_hash"]
+        expected = cp
+    return checkpoints
+
+
+def append_checkpoints(log: Path, segments: list[dict[str, Any]], index: int, prev: dict[str, Any] | None) -> int:
+    key = checkpoint_key()
+    path = checkpoints_path(log)
+    created = datetime.now(timezone.utc).isoformat()
+    lines = []
+    with fileio.locked(path):
+        # Another verifier may have checkpointed the same ranges meanwhile.
+        current = load_checkpoints(log)
+        if current and (prev is None or current[-1]["checkpoint_hash"] != prev["checkpoint_hash"]):
+            return 0
+        prev_hash = prev["checkpoint_hash"] if prev else audit.GENESIS_HASH
+        for seg in segments:
+            cp = {
+                "checkpoint": len(current) + len(lines) + 1,
+                "start_index": index,
+                "end_index": index + seg["count"],
+                "start_offset": seg["start"],
+                "end_offset": seg["end"],
+                "prev_event_hash": seg["first_prev"],
+                "event_hash": seg["last_hash"],
+                "merkle_root": seg["merkle_root"],
+                "created": created,
+                "prev_checkpoint_hash": prev_hash,
+            }
+            cp["checkpoint_hash"] = checkpoint_digest(cp)
+            if key is not None:
+                cp["signature"] = sign(cp["checkpoint_hash"], key)
+            lines.append(json.dumps(cp, sort_keys=True, separators=(",", ":")))
+            prev_hash = cp["checkpoint_hash"]
+            index += seg["count"]
+        if lines:
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+    return len(lines)
+
+
+def verify(
+    log: Path,
+    *,
+    incremental: bool = False,
+    jobs: int | None = None,
+    segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    checkpoint: bool = True,
+) -> dict[str, Any]:
+    """Verify ``log``; raises RuntimeError naming the first bad event, else returns a summary."""
+    if not log.exists():
+        raise RuntimeError(f"Audit log not found: {log}")
+    checkpoints = load_checkpoints(log)
+    # Writers append whole batches under this lock, so the size read under it
+    # never cuts a record; a partial last record is a torn write and is reported.
+    with fileio.locked(log):
+        size = log.stat().st_size
+    last = checkpoints[-1] if checkpoints else None
+    trusted_offset = last["end_offset"] if last else 0
+    if trusted_offset > size:
+        raise RuntimeError(f"Audit log {log} is shorter than its last checkpoint (truncated?).")
+    if last and audit.hash_before(log, trusted_offset) != last["event_hash"]:
+        raise RuntimeError(f"Audit log {log} no longer matches checkpoint {last['checkpoint']} at event {last['end_index']}.")
+
+    # (range, checkpoint it must reproduce or None)
+    work: list[tuple[tuple[int, int], dict[str, Any] | None]] = []
+    if not incremental:
+        work.extend(((cp["start_offset"], cp["end_offset"]), cp) for cp in checkpoints)
+    work.extend((rng, None) for rng in split_ranges(log, trusted_offset, size, max(1, segment_bytes)))
+
+    ranges = [rng for rng, _ in work]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(ranges) <= 1:
+        results = [verify_range(str(log), start, end) for start, end in ranges]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as pool:
+            results = list(pool.map(verify_range, [str(log)] * len(ranges), *zip(*ranges)))
+
+    index = 0 if not incremental else (last["end_index"] if last else 0)
+    prev_hash = audit.GENESIS_HASH if not incremental or not last else last["event_hash"]
+    new_segments = []
+    for (_, cp), res in zip(work, results):
+        where = f"event {index + res['count']} (segment starting at byte {res['start']})"
+        if res["error"]:
+            raise RuntimeError(f"Audit log {log}: {res['error']} at {where}.")
+        if res["count"] and res["first_prev"] != prev_hash:
+            raise RuntimeError(f"Audit log {log}: chain broken at event {index}: prev_event_hash does not match.")
+        if cp is not None and (
+            res["count"] != cp["end_index"] - cp["start_index"]
+            or res["last_hash"] != cp["event_hash"]
+            or res["merkle_root"] != cp["merkle_root"]
+        ):
+            raise RuntimeError(f"Audit log {log}: events {cp['start_index']}-{cp['end_index']} differ from checkpoint {cp['checkpoint']}.")
+        if cp is None and res["count"]:
+            new_segments.append(res)
+        index += res["count"]
+        prev_hash = res["last_hash"] or prev_hash
+
+    written = append_checkpoints(log, new_segments, index - sum(s["count"] for s in new_segments), last) if checkpoint else 0
+    return {
+        "events": index,
+        "verified_events": sum(r["count"] for r in results),
+        "segments": len(results),
+        "checkpoints_written": written,
+        "head": prev_hash,
+        "signed": checkpoint_key() is not None,
+    }
@@ -0,0 +1,56 @@
+"""Build ``archwf.pyz``: the ``archwf`` package and shared scripts as one zipapp.
+
+Every module is stored as bytecode compiled with unchecked hash-based
+invalidation, so a run never compiles or stats sources (the repo's
+scripts are otherwise recompiled on each run when bytecode caching is off
+or the cache directory is not writable). The sources are stored next to
+the bytecode: another Python version rejects the bytecode's magic number
+and imports those instead (slower, but it runs). Rebuild after changing
+the scripts; the archive does not track its sources.
+"""
+from __future__ import annotations
+
+import os
+import py_compile
+import shutil
+import tempfile
+import zipapp
+from pathlib import Path
+
+from archwf.daemon import METHODS
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+ENTRY = "import sys\nfrom archwf.__main__ import main\nsys.exit(main())\n"
+INTERPRETER = "/usr/bin/env python3"
+
+
+def compile_into(source: Path, target: Path) -> None:
+    # Legacy layout (module.pyc next to where module.py would be) imports
+    # straight from a zip without the source.
+    py_compile.compile(
+        str(source),
+        cfile=str(target),
+        dfile=source.name,
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+    shutil.copyfile(source, target.with_suffix(".py"))
+
+
+def build(output: Path) -> Path:
+    output = output.resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="archwf-bundle-") as tmp:
+        staging = Path(tmp) / "app"
+        (staging / "archwf").mkdir(parents=True)
+        for source in sorted((SCRIPTS_DIR / "archwf").glob("*.py")):
+            compile_into(source, staging / "archwf" / f"{source.stem}.pyc")
+        for script in METHODS.values():
+            compile_into(SCRIPTS_DIR / script, staging / f"{Path(script).stem}.pyc")
+        # zipapp runs __main__.py by name, so the entry point stays source.
+        (staging / "__main__.py").write_text(ENTRY, encoding="utf-8")
+        tmp_output = Path(tmp) / output.name
+        zipapp.create_archive(staging, tmp_output, interpreter=INTERPRETER)
+        shutil.move(str(tmp_output), output)
+    os.chmod(output, 0o755)
+    return output
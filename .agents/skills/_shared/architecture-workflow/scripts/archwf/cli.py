@@ -0,0 +1,293 @@
+"""Maintenance subcommands of the ``archwf`` entry point.
+
+Loaded by ``archwf/__main__.py`` only for these commands; the workflow
+script subcommands are dispatched before this module is imported.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from archwf import archive, daemon, fileio, journal, serialization
+from archwf import manifest as manifest_store
+from archwf.paths import resolve_manifest_path, resolve_repo_root
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    repo_root = resolve_repo_root(Path.cwd())
+    manifest_path = resolve_manifest_path(repo_root, args.system)
+    journal_file = journal.journal_path(manifest_path)
+    if not manifest_path.exists() and not journal_file.exists():
+        print(f"Error: no manifest or journal found for system '{args.system}'.", file=sys.stderr)
+        return 1
+
+    with fileio.locked(manifest_path):
+        manifest: dict = {}
+        if manifest_path.exists():
+            data = serialization.load_yaml(manifest_path.read_text(encoding="utf-8"))
+            if data is not None and not isinstance(data, dict):
+                raise RuntimeError(f"Manifest at {manifest_path} must be a mapping/object.")
+            manifest = data or {}
+        records = journal.read_records(manifest_path)
+        for record in records:
+            journal.apply_record(manifest, record)
+
+        fileio.atomic_write_text(manifest_path, serialization.dump_yaml(manifest))
+        serialization.write_sidecar(manifest_path, manifest)
+        if args.disable_journal:
+            journal_file.unlink(missing_ok=True)
+        else:
+            journal_file.write_text("", encoding="utf-8")
+    print(f"Compacted {len(records)} journal record(s) into {manifest_path}")
+    return 0
+
+
+def cmd_archive(args: argparse.Namespace) -> int:
+    repo_root = resolve_repo_root(Path.cwd())
+    manifest_path = resolve_manifest_path(repo_root, args.system)
+    if not manifest_path.exists():
+        print(f"Error: no manifest found for system '{args.system}'.", file=sys.stderr)
+        return 1
+    manifest = manifest_store.load(manifest_path)
+    if args.keep is not None:
+        if args.keep < 1:
+            print("Error: --keep must be at least 1.", file=sys.stderr)
+            return 2
+        keep = {section: args.keep for section in archive.SECTIONS}
+    else:
+        keep = archive.retention(manifest)
+        if not keep:
+            print(
+                f"Error: no retention configured; pass --keep or set {archive.RETAIN_ENV} "
+                "or a 'retention' mapping in the manifest.",
+                file=sys.stderr,
+            )
+            return 2
+    before = {section: len(manifest[section]) for section in archive.SECTIONS}
+    manifest_store.save(manifest_path, manifest, retain=keep)
+    moved = sum(before[section] - len(manifest[section]) for section in archive.SECTIONS)
+    print(f"Archived {moved} entr{'y' if moved == 1 else 'ies'} to {archive.archive_dir(manifest_path)}")
+    return 0
+
+
+def cmd_history(args: argparse.Namespace) -> int:
+    repo_root = resolve_repo_root(Path.cwd())
+    manifest_path = resolve_manifest_path(repo_root, args.system)
+    manifest = manifest_store.load(manifest_path)
+    rows = []
+    for tier, section, entry in archive.iter_history(manifest_path, manifest, args.section):
+        if not isinstance(entry, dict):
+            continue
+        stamp = str(entry.get("timestamp") or "")
+        if args.since and stamp < args.since:
+            continue
+        if args.until and stamp[: len(args.until)] > args.until:
+            continue
+        if args.script and entry.get("script") != args.script:
+            continue
+        rows.append({"tier": tier, "section": section, "entry": manifest.expand(entry)})
+    # Tiers and sections are read one after another; --limit means the newest N overall.
+    rows.sort(key=lambda row: str(row["entry"].get("timestamp") or ""))
+    if args.limit is not None:
+        rows = rows[-args.limit :] if args.limit > 0 else []
+    for row in rows:
+        print(json.dumps(row, sort_keys=True, default=str))
+    return 0
+
+
+def cmd_portable(args: argparse.Namespace) -> int:
+    repo_root = resolve_repo_root(Path.cwd())
+    manifest_path = resolve_manifest_path(repo_root, args.system)
+    if not manifest_path.exists():
+        print(f"Error: no manifest found for system '{args.system}'.", file=sys.stderr)
+        return 1
+    before = manifest_path.stat().st_size
+    manifest = manifest_store.load(manifest_path)
+    recorded_root = manifest.get("repo_root")
+    manifest.roots = [str(repo_root), *(args.root or [])]
+    if isinstance(recorded_root, str) and recorded_root not in manifest.roots:
+        # Paths written on another machine are relative to the root recorded there.
+        manifest.roots.append(recorded_root)
+    manifest.make_portable()
+    manifest["manifest_path"] = manifest.portable(str(manifest_path))
+    manifest_store.save(manifest_path, manifest, rewrite=True)
+    after = manifest_path.stat().st_size
+    print(f"Rewrote {manifest_path}: {before} -> {after} bytes")
+    return 0
+
+
+def cmd_audit_verify(args: argparse.Namespace) -> int:
+    from archwf import audit, audit_verify
+
+    log = Path(args.log) if args.log else audit.log_path(resolve_repo_root(Path.cwd()))
+    summary = audit_verify.verify(
+        log,
+        incremental=args.incremental,
+        jobs=args.jobs,
+        segment_bytes=int(args.segment_mb * 1024 * 1024),
+        checkpoint=not args.no_checkpoint,
+    )
+    print(
+        f"OK: {log} has {summary['events']} event(s), head {summary['head'][:16]}; "
+        f"verified {summary['verified_events']} in {summary['segments']} segment(s), "
+        f"wrote {summary['checkpoints_written']} checkpoint(s)."
+    )
+    return 0
+
+
+def cmd_audit_query(args: argparse.Namespace) -> int:
+    from archwf import audit, audit_index
+
+    log = Path(args.log) if args.log else audit.log_path(resolve_repo_root(Path.cwd()))
+    if not log.exists():
+        print(f"Error: audit log not found: {log}", file=sys.stderr)
+        return 1
+    filters = {field: getattr(args, field) for field in audit_index.FIELDS}
+    if args.count:
+        print(audit_index.count(log, since=args.since, until=args.until, **filters))
+        return 0
+    out = sys.stdout.buffer
+    for line in audit_index.query(log, since=args.since, until=args.until, limit=args.limit, **filters):
+        out.write(line + b"\n")
+    out.flush()
+    return 0
+
+
+def socket_arg(args: argparse.Namespace) -> Path:
+    return Path(args.socket) if args.socket else daemon.socket_for_cwd()
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    return daemon.serve(socket_arg(args))
+
+
+def cmd_stop(args: argparse.Namespace) -> int:
+    return daemon.stop(socket_arg(args))
+
+
+def cmd_status(args: argparse.Namespace) -> int:
+    return daemon.status(socket_arg(args))
+
+
+def cmd_zipapp(args: argparse.Namespace) -> int:
+    from archwf import bundle
+
+    print(bundle.build(Path(args.output)))
+    return 0
+
+
+def build_parser(script_commands: dict[str, tuple[str, str]]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="archwf", description="Architecture workflow commands.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # Listed for --help only; archwf/__main__.py hands these to the scripts.
+    for name, (module, help_text) in script_commands.items():
+        sub.add_parser(name, help=f"{help_text} (runs {module}.py; see `archwf {name} --help`).")
+
+    compact = sub.add_parser(
+        "compact",
+        help="Fold the append-only manifest journal into the YAML snapshot.",
+    )
+    compact.add_argument("--system", required=True)
+    compact.add_argument(
+        "--disable-journal",
+        action="store_true",
+        help="Remove the journal after compacting so later runs rewrite the snapshot directly.",
+    )
+    compact.set_defaults(func=cmd_compact)
+
+    archive_cmd = sub.add_parser(
+        "archive",
+        help="Move old actions/validations from the manifest into compressed archive tiers.",
+    )
+    archive_cmd.add_argument("--system", required=True)
+    archive_cmd.add_argument(
+        "--keep",
+        type=int,
+        help="Entries to keep inline per section (default: the configured retention).",
+    )
+    archive_cmd.set_defaults(func=cmd_archive)
+
+    history = sub.add_parser(
+        "history",
+        help="Print manifest history across archive tiers and the inline manifest as JSON lines.",
+    )
+    history.add_argument("--system", required=True)
+    history.add_argument("--section", choices=archive.SECTIONS)
+    history.add_argument("--script", help="Only actions recorded by this script (e.g. wa_review.py).")
+    history.add_argument("--since", help="ISO timestamp or date prefix; inclusive.")
+    history.add_argument("--until", help="ISO timestamp or date prefix; inclusive.")
+    history.add_argument("--limit", type=int, help="Only the newest N matching entries.")
+    history.set_defaults(func=cmd_history)
+
+    portable = sub.add_parser(
+        "portable",
+        help="Rewrite an existing manifest with repo-relative paths and interned action outputs.",
+    )
+    portable.add_argument("--system", required=True)
+    portable.add_argument(
+        "--root",
+        action="append",
+        help="Additional absolute repo root the recorded paths may start with (repeatable).",
+    )
+    portable.set_defaults(func=cmd_portable)
+
+    audit_cmd = sub.add_parser(
+        "audit-verify",
+        help="Verify the audit log hash chain in parallel segments and record checkpoints.",
+    )
+    audit_cmd.add_argument("--log", help="Audit log path (default: docs/architecture/audit/audit-log.jsonl).")
+    audit_cmd.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Trust the checkpointed prefix and verify only events appended since the last checkpoint.",
+    )
+    audit_cmd.add_argument("--jobs", type=int, help="Worker processes (default: CPU count).")
+    audit_cmd.add_argument("--segment-mb", type=float, default=8.0, help="Size of new segments/checkpoints (default: 8).")
+    audit_cmd.add_argument("--no-checkpoint", action="store_true", help="Verify only; do not append checkpoints.")
+    audit_cmd.set_defaults(func=cmd_audit_verify)
+
+    query_cmd = sub.add_parser(
+        "audit-query",
+        help="Print audit log events matching the filters as JSON lines, via the SQLite sidecar index.",
+    )
+    query_cmd.add_argument("--log", help="Audit log path (default: docs/architecture/audit/audit-log.jsonl).")
+    query_cmd.add_argument("--stage")
+    query_cmd.add_argument("--actor")
+    query_cmd.add_argument("--session-id", dest="session_id")
+    query_cmd.add_argument("--project-id", dest="project_id", help="The system name for workflow events.")
+    query_cmd.add_argument("--adr-id", dest="adr_id", help="e.g. ADR-20250101-use-dynamodb")
+    query_cmd.add_argument("--since", help="ISO timestamp or date prefix; inclusive.")
+    query_cmd.add_argument("--until", help="ISO timestamp or date prefix; inclusive.")
+    query_cmd.add_argument("--limit", type=int, help="Only the newest N matching events.")
+    query_cmd.add_argument("--count", action="store_true", help="Print the number of matching events instead.")
+    query_cmd.set_defaults(func=cmd_audit_query)
+
+    for name, func, help_text in (
+        ("serve", cmd_serve, "Run the workflow daemon for this repository in the foreground."),
+        ("stop", cmd_stop, "Stop the workflow daemon for this repository."),
+        ("status", cmd_status, "Report whether a workflow daemon is listening."),
+    ):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--socket", help="Unix socket path (default: derived from the repo root).")
+        cmd.set_defaults(func=func)
+
+    zipapp_cmd = sub.add_parser(
+        "zipapp",
+        help="Bundle archwf and the shared scripts as precompiled bytecode into one executable zipapp.",
+    )
+    zipapp_cmd.add_argument("--output", default="archwf.pyz", help="Archive path (default: ./archwf.pyz).")
+    zipapp_cmd.set_defaults(func=cmd_zipapp)
+    return parser
+
+
+def main(argv: list[str] | None = None, script_commands: dict[str, tuple[str, str]] | None = None) -> int:
+    args = build_parser(script_commands or {}).parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
@@ -0,0 +1,156 @@
+"""Thin JSON-RPC client for the workflow daemon (``archwf serve``).
+
+Shared scripts call :func:`forward` at the top of ``main()``. When a daemon
+is listening for the current repository the run is executed there and its
+output replayed locally; otherwise ``forward`` returns None and the script
+runs normally. ``socket`` and ``hashlib`` are imported only once a run is
+actually looking for a daemon, keeping ``--help`` and disabled-daemon runs
+cheap to start.
+
+The socket lives in ``$XDG_RUNTIME_DIR`` or else in a private (0700)
+``archwf-<uid>`` directory under the temp dir. A client only talks to a
+socket owned by the current user with mode 0600, and where the platform
+reports it, only to a peer process running as the current user; otherwise
+the run stays local.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import socket
+
+from archwf.paths import resolve_repo_root
+
+# Set by the daemon so scripts it runs never forward back to it.
+SERVING = False
+CONNECT_TIMEOUT = 0.2
+
+
+def private_socket_dir() -> Path:
+    # The directories tempfile.gettempdir() tries first, without importing
+    # tempfile (and shutil, random) on every run that looks for a daemon.
+    for name in ("TMPDIR", "TEMP", "TMP"):
+        base = os.environ.get(name)
+        if base:
+            break
+    else:
+        base = "/tmp"
+    return Path(base) / f"archwf-{os.getuid()}"
+
+
+def socket_path(repo_root: Path) -> Path:
+    override = os.environ.get("ARCHWF_SOCKET")
+    if override:
+        return Path(override)
+    import hashlib
+
+    digest = hashlib.sha1(str(repo_root).encode("utf-8")).hexdigest()[:12]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / f"archwf-{os.getuid()}-{digest}.sock"
+    return private_socket_dir() / f"archwf-{digest}.sock"
+
+
+def check_socket(path: Path) -> bool:
+    """Whether ``path`` exists; raises RuntimeError if it is not a socket only we can use."""
+    import stat
+
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISSOCK(st.st_mode):
+        raise RuntimeError(f"{path} is not a socket")
+    if st.st_uid != os.getuid():
+        raise RuntimeError(f"socket {path} is owned by uid {st.st_uid}, not {os.getuid()}")
+    if stat.S_IMODE(st.st_mode) != 0o600:
+        raise RuntimeError(f"socket {path} has mode {stat.S_IMODE(st.st_mode):o}, expected 600")
+    return True
+
+
+def peer_uid(sock: socket.socket) -> int | None:
+    import socket
+
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    import struct
+
+    _, uid, _ = struct.unpack("3i", sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+    return uid
+
+
+def connect(path: Path) -> socket.socket | None:
+    """Connect to the daemon socket at ``path``, or return None if nothing is listening.
+
+    Raises RuntimeError if the socket or the process behind it belongs to
+    another user.
+    """
+    if not check_socket(path):
+        return None
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    uid = peer_uid(sock)
+    if uid is not None and uid != os.getuid():
+        sock.close()
+        raise RuntimeError(f"workflow daemon on {path} runs as uid {uid}, not {os.getuid()}")
+    sock.settimeout(None)
+    return sock
+
+
+def call(sock: socket.socket, method: str, params: dict[str, Any]) -> dict[str, Any]:
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+    with sock.makefile("rb") as fh:
+        line = fh.readline()
+    if not line:
+        raise RuntimeError("workflow daemon closed the connection without a response")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(f"workflow daemon error: {response['error'].get('message')}")
+    return response["result"]
+
+
+def forward(method: str, argv: list[str]) -> int | None:
+    if SERVING or os.environ.get("ARCHWF_DAEMON", "").strip().lower() in {"0", "off", "no"}:
+        return None
+    if "--interactive" in argv:
+        # Prompts need this process's terminal.
+        return None
+    if "-h" in argv or "--help" in argv:
+        return None
+    try:
+        repo_root = resolve_repo_root(Path.cwd())
+    except RuntimeError:
+        return None
+    try:
+        sock = connect(socket_path(repo_root))
+    except RuntimeError as exc:
+        print(f"Warning: not using the workflow daemon: {exc}", file=sys.stderr)
+        return None
+    if sock is None:
+        return None
+    env = {k: v for k, v in os.environ.items() if k.startswith("ARCHWF_")}
+    try:
+        with sock:
+            result = call(sock, method, {"argv": argv, "cwd": str(Path.cwd()), "env": env})
+    except (OSError, ValueError, RuntimeError) as exc:
+        # The request may already have executed, so do not silently rerun it.
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stderr.write(result.get("stderr", ""))
+    return int(result.get("exit_code", 1))
@@ -0,0 +1,24 @@
+"""UTC timestamps in the formats the workflow artifacts use.
+
+Built on ``time`` rather than ``datetime``, which every script run would
+otherwise import just for these strings. ``now_iso`` matches
+``datetime.now(timezone.utc).isoformat()``.
+"""
+from __future__ import annotations
+
+import time
+
+
+def now_iso() -> str:
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    micros = nanos // 1000
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{stamp}.{micros:06d}+00:00" if micros else f"{stamp}+00:00"
+
+
+def ymd() -> str:
+    return time.strftime("%Y%m%d", time.gmtime())
+
+
+def iso_date() -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime())
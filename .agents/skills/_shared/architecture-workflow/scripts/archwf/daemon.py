@@ -0,0 +1,224 @@
+"""Long-running workflow daemon serving the shared scripts over a Unix socket.
+
+Protocol: one JSON-RPC 2.0 request per line, one response per line. Methods
+``init``, ``new_adr``, ``wa_review``, ``validate`` and ``decision_trace`` take
+``{"argv": [...], "cwd": "...", "env": {...}}`` and return
+``{"exit_code": int, "stdout": str, "stderr": str}``. ``ping`` and
+``shutdown`` take no params.
+
+Script modules stay imported between requests (reloaded when their source
+changes) and templates, manifests and ADR indexes are served from
+:mod:`archwf.warm`. Requests run one at a time because the scripts use the
+process cwd, argv and stdio.
+"""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from archwf import client, warm
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+METHODS = {
+    "init": "init_arch_workflow.py",
+    "new_adr": "new_adr.py",
+    "wa_review": "wa_review.py",
+    "validate": "validate_archifacts.py",
+    "decision_trace": "decision_trace.py",
+}
+
+
+def scoped_env() -> dict[str, str]:
+    return {k: v for k, v in os.environ.items() if k.startswith("ARCHWF_")}
+
+
+def replace_scoped_env(env: dict[str, str]) -> None:
+    # Only the client's ARCHWF_* settings apply to a request.
+    for key in scoped_env():
+        del os.environ[key]
+    os.environ.update(env)
+
+
+class ScriptHost:
+    def __init__(self, scripts_dir: Path) -> None:
+        self.scripts_dir = scripts_dir
+        self.modules: dict[str, tuple[int, ModuleType]] = {}
+        self.lock = threading.Lock()
+
+    def module(self, script: str) -> ModuleType:
+        path = self.scripts_dir / script
+        if not path.is_file():
+            # Running from the archwf zipapp: the scripts are importable, not files.
+            return importlib.import_module(path.stem)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self.modules.get(script)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Cannot load shared script: {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[path.stem] = module
+        spec.loader.exec_module(module)
+        self.modules[script] = (mtime_ns, module)
+        return module
+
+    def run(self, script: str, argv: list[str], cwd: str, env: dict[str, str]) -> dict[str, Any]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self.lock:
+            saved_cwd, saved_argv = os.getcwd(), sys.argv[:]
+            saved_env = scoped_env()
+            try:
+                os.chdir(cwd)
+                replace_scoped_env(env)
+                sys.argv = [str(self.scripts_dir / script), *argv]
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    try:
+                        exit_code = int(self.module(script).main() or 0)
+                    except SystemExit as exc:
+                        if exc.code is None or isinstance(exc.code, int):
+                            exit_code = exc.code or 0
+                        else:
+                            print(exc.code, file=sys.stderr)
+                            exit_code = 1
+                    except Exception as exc:
+                        print(f"Error: {exc}", file=sys.stderr)
+                        exit_code = 1
+            finally:
+                os.chdir(saved_cwd)
+                sys.argv = saved_argv
+                replace_scoped_env(saved_env)
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "WorkflowServer"
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            response = self.server.dispatch(raw)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class WorkflowServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, host: ScriptHost) -> None:
+        self.host = host
+        super().__init__(str(path), RequestHandler)
+
+    def dispatch(self, raw: bytes) -> dict[str, Any]:
+        request_id = None
+        try:
+            request = json.loads(raw)
+            request_id = request.get("id")
+            method = request.get("method")
+            params = request.get("params") or {}
+            if method == "ping":
+                result: Any = {"pid": os.getpid(), "scripts_dir": str(self.host.scripts_dir)}
+            elif method == "shutdown":
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                result = {"stopping": True}
+            elif method in METHODS:
+                result = self.host.run(
+                    METHODS[method],
+                    [str(x) for x in params.get("argv", [])],
+                    str(params.get("cwd") or os.getcwd()),
+                    {str(k): str(v) for k, v in (params.get("env") or {}).items()},
+                )
+            else:
+                error = {"code": -32601, "message": f"Unknown method: {method}"}
+                return {"jsonrpc": "2.0", "id": request_id, "error": error}
+        except Exception as exc:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": str(exc)}}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def private_dir(path: Path) -> None:
+    """Create ``path`` as 0700 if missing; refuse one another user could reach."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f"{path} must be a 0700 directory owned by uid {os.getuid()}")
+
+
+def serve(socket_file: Path) -> int:
+    if client.check_socket(socket_file):
+        probe = client.connect(socket_file)
+        if probe is not None:
+            probe.close()
+            print(f"Error: a workflow daemon is already listening on {socket_file}", file=sys.stderr)
+            return 1
+        socket_file.unlink()
+    if socket_file.parent == client.private_socket_dir():
+        private_dir(socket_file.parent)
+    else:
+        socket_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    client.SERVING = True
+    warm.enable()
+    host = ScriptHost(SCRIPTS_DIR)
+    # Bind under a tight umask so the socket is never reachable by others, even briefly.
+    umask = os.umask(0o177)
+    try:
+        server = WorkflowServer(socket_file, host)
+    finally:
+        os.umask(umask)
+    with server:
+        print(f"archwf daemon listening on {socket_file}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                socket_file.unlink()
+    return 0
+
+
+def stop(socket_file: Path) -> int:
+    sock = client.connect(socket_file)
+    if sock is None:
+        print(f"No workflow daemon is listening on {socket_file}")
+        return 1
+    try:
+        with sock:
+            client.call(sock, "shutdown", {})
+    except (OSError, RuntimeError) as exc:
+        print(f"Error: workflow daemon on {socket_file} did not respond: {exc}", file=sys.stderr)
+        return 1
+    print(f"Stopped workflow daemon on {socket_file}")
+    return 0
+
+
+def status(socket_file: Path) -> int:
+    sock = client.connect(socket_file)
+    if sock is None:
+        print(f"No workflow daemon is listening on {socket_file}")
+        return 1
+    try:
+        with sock:
+            info = client.call(sock, "ping", {})
+    except (OSError, RuntimeError) as exc:
+        print(f"Workflow daemon on {socket_file} did not respond: {exc}")
+        return 1
+    print(f"Workflow daemon pid {info['pid']} listening on {socket_file}")
+    return 0
+
+
+def socket_for_cwd() -> Path:
+    from archwf.paths import resolve_repo_root
+
+    return client.socket_path(resolve_repo_root(Path.cwd()))
+
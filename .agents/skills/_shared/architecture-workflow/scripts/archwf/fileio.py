@@ -0,0 +1,72 @@
+"""Advisory file locks and atomic writes.
+
+Locks use ``fcntl.flock`` on a sidecar ``<name>.lock`` file, so the locked
+file itself can be replaced by rename while the lock is held. On platforms
+without ``fcntl`` locking is a no-op and writes are still atomic.
+
+Reads and writes made through these helpers are counted towards the run's
+I/O totals (see ``archwf.timing``).
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from archwf import timing
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+
+def lock_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.lock")
+
+
+@contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock for ``path`` for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path: Path, text: str, *, fsync: bool = True) -> None:
+    """Write ``text`` to a temp file in the same directory and rename it over ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            if fsync:
+                os.fsync(fh.fileno())
+            timing.count_written(fh.buffer.tell())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def read_text(path: Path) -> str:
+    with path.open(encoding="utf-8") as fh:
+        text = fh.read()
+        timing.count_read(fh.buffer.tell())
+    return text
+
+
+def write_text(path: Path, text: str) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        timing.count_written(fh.buffer.tell())
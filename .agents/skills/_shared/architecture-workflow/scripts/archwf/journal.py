@@ -0,0 +1,154 @@
+"""Append-only journal for manifests.
+
+In journaled mode ``<system>.yaml`` is a compacted snapshot and every script
+run appends its changes to ``<system>.journal.jsonl`` beside it instead of
+re-serializing the whole document. Loading replays the journal over the
+snapshot, so callers still see a single merged mapping.
+
+Journaled mode is active when the journal file exists or when
+``ARCHWF_MANIFEST_JOURNAL`` is set to a truthy value.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from archwf import fileio
+from archwf import timing
+
+JOURNAL_ENV = "ARCHWF_MANIFEST_JOURNAL"
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+# Per-manifest view of what was on disk at load time, used to derive the
+# append-only delta on save.
+_baselines: dict[str, dict[str, Any]] = {}
+
+
+def journal_path(manifest_path: Path) -> Path:
+    return manifest_path.with_name(f"{manifest_path.stem}{JOURNAL_SUFFIX}")
+
+
+def journal_enabled(manifest_path: Path) -> bool:
+    if os.environ.get(JOURNAL_ENV, "").strip().lower() in {"1", "true", "yes", "on"}:
+        return True
+    return journal_path(manifest_path).exists()
+
+
+def encode(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def apply_record(manifest: dict[str, Any], record: dict[str, Any]) -> None:
+    op = record.get("op")
+    if op == "append":
+        section = manifest.get(record["section"])
+        if not isinstance(section, list):
+            section = manifest[record["section"]] = []
+        section.append(record["value"])
+    elif op == "set":
+        manifest[record["key"]] = record["value"]
+    elif op == "delete":
+        manifest.pop(record["key"], None)
+    else:
+        raise RuntimeError(f"Unknown manifest journal operation: {op!r}")
+
+
+def read_records(manifest_path: Path) -> list[dict[str, Any]]:
+    path = journal_path(manifest_path)
+    if not path.exists():
+        return []
+    lines = fileio.read_text(path).splitlines()
+    records: list[dict[str, Any]] = []
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            if lineno == len(lines):
+                # Torn trailing write from an interrupted run; every earlier
+                # record is complete.
+                break
+            raise RuntimeError(f"Manifest journal {path} has an unreadable record at line {lineno}.")
+        if not isinstance(record, dict):
+            raise RuntimeError(f"Manifest journal {path} has a non-object record at line {lineno}.")
+        records.append(record)
+    return records
+
+
+def remember(manifest_path: Path, manifest: dict[str, Any]) -> None:
+    lengths: dict[str, int] = {}
+    values: dict[str, str] = {}
+    for key, value in manifest.items():
+        if isinstance(value, list):
+            lengths[key] = len(value)
+        else:
+            values[key] = encode(value)
+    _baselines[str(manifest_path)] = {"lengths": lengths, "values": values}
+
+
+def baseline(manifest_path: Path) -> dict[str, Any] | None:
+    """What was on disk when ``manifest_path`` was last loaded or saved in this process."""
+    return _baselines.get(str(manifest_path))
+
+
+def replay(manifest_path: Path, manifest: dict[str, Any]) -> dict[str, Any]:
+    for record in read_records(manifest_path):
+        apply_record(manifest, record)
+    remember(manifest_path, manifest)
+    return manifest
+
+
+def diff_records(baseline: dict[str, Any], manifest: dict[str, Any]) -> list[dict[str, Any]] | None:
+    lengths: dict[str, int] = baseline["lengths"]
+    values: dict[str, str] = baseline["values"]
+    records: list[dict[str, Any]] = []
+    for key in sorted(manifest):
+        value = manifest[key]
+        if isinstance(value, list) and key in lengths:
+            if len(value) < lengths[key]:
+                # History was rewritten rather than appended to; only a full
+                # snapshot can represent that.
+                return None
+            for item in value[lengths[key] :]:
+                records.append({"op": "append", "section": key, "value": item})
+        elif key in lengths or values.get(key) != encode(value):
+            records.append({"op": "set", "key": key, "value": value})
+    for key in sorted((set(lengths) | set(values)) - set(manifest)):
+        records.append({"op": "delete", "key": key})
+    return records
+
+
+def append_changes(manifest_path: Path, manifest: dict[str, Any]) -> bool:
+    """Append the delta since load to the journal.
+
+    Returns False when the caller must write a full snapshot instead (journal
+    disabled, no snapshot yet, manifest not loaded through ``replay``, or
+    history that was rewritten rather than appended to).
+    """
+    if not journal_enabled(manifest_path) or not manifest_path.exists():
+        return False
+    loaded = baseline(manifest_path)
+    if loaded is None:
+        return False
+    records = diff_records(loaded, manifest)
+    if records is None:
+        return False
+    if records:
+        payload = "".join(encode(record) + "\n" for record in records)
+        with journal_path(manifest_path).open("a", encoding="utf-8") as fh:
+            fh.write(payload)
+            fh.flush()
+            timing.count_written(len(payload.encode("utf-8")))
+    remember(manifest_path, manifest)
+    return True
+
+
+def reset(manifest_path: Path, manifest: dict[str, Any]) -> None:
+    """Mark a freshly written snapshot as containing every journaled change."""
+    path = journal_path(manifest_path)
+    if journal_enabled(manifest_path):
+        path.write_text("", encoding="utf-8")
+    remember(manifest_path, manifest)
@@ -0,0 +1,327 @@
+"""Shared manifest model and persistence.
+
+Every workflow script (and ``run_evals.py``) loads, stamps and saves
+``<system>.yaml`` through this module, so parsing, journaling, the JSON
+sidecar and error handling behave the same everywhere. A manifest that
+exists but cannot be parsed, or is not a mapping, is an error: scripts
+must never silently start from an empty mapping and overwrite history.
+
+Saves are safe to run concurrently for the same system: ``save`` holds an
+advisory lock, replaces the snapshot by atomic rename, and when another
+process wrote the manifest since it was loaded, rebases this process's
+changes (appended list entries and changed keys) onto the current content
+instead of overwriting it. Sections over their retention limit are rotated
+into the archive tiers (see ``archwf.archive``) as part of the same save.
+
+Paths are stored repo-relative. Files referenced from action ``outputs`` are
+interned in the ``artifact_table`` section (id -> relative path) and the
+action stores only the id, so repeated runs do not repeat long paths.
+
+Actions recorded through ``Manifest.record_action`` are also appended to the
+hash-chained audit log (see ``archwf.audit``) once the save succeeds. An
+audit failure at that point is a warning, not a failed save.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from archwf import WORKFLOW_VERSION
+from archwf import archive
+from archwf import clock
+from archwf import fileio
+from archwf import journal
+from archwf import serialization
+from archwf import timing
+from archwf import warm
+from archwf.paths import resolve_manifest_path
+
+SECTIONS: dict[str, type] = {
+    "adrs": list,
+    "wa_reviews": list,
+    "validations": list,
+    "decision_traces": list,
+    "actions": list,
+    "artifacts": dict,
+}
+
+# Snapshot/journal file identity at load time, keyed by manifest path.
+_revisions: dict[str, tuple[tuple[int, int, int] | None, ...]] = {}
+
+
+def legacy_manifest_path(repo_root: Path, system: str) -> Path:
+    return repo_root / "docs" / "architecture" / "manifest" / f"{system}.yaml"
+
+
+class Manifest(dict):
+    """A system manifest mapping.
+
+    Well-known sections are created on first access rather than up front,
+    and sections of the wrong type are discarded on load (the historical
+    ``normalize_manifest`` behaviour). Instances are plain dicts otherwise,
+    so existing ``manifest["actions"].append(...)`` call sites keep working.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None, *, path: Path | None = None) -> None:
+        super().__init__(data or {})
+        self.path = path
+        self.roots: list[str] = []
+        # Actions recorded since the last save, logged to the audit log once saved.
+        self.unaudited: list[dict[str, Any]] = []
+        for key, kind in SECTIONS.items():
+            if key in self and not isinstance(self[key], kind):
+                del self[key]
+
+    def __missing__(self, key: str) -> Any:
+        kind = SECTIONS.get(key)
+        if kind is None:
+            raise KeyError(key)
+        value = self[key] = kind()
+        return value
+
+    @property
+    def actions(self) -> list[dict[str, Any]]:
+        return self["actions"]
+
+    @property
+    def validations(self) -> list[dict[str, Any]]:
+        return self["validations"]
+
+    @property
+    def artifacts(self) -> dict[str, Any]:
+        return self["artifacts"]
+
+    def stamp(self, repo_root: Path, system: str, *, extra_sections: tuple[str, ...] = ()) -> None:
+        """Set the common header keys and make sure every section is present."""
+        if self.path is None:
+            raise RuntimeError("Manifest has no path; load it with archwf.manifest.load().")
+        if str(repo_root) not in self.roots:
+            self.roots.insert(0, str(repo_root))
+        self.setdefault("system", system)
+        self["manifest_path"] = self.portable(str(self.path))
+        # Absolute roots made manifests machine-specific; paths are relative to it now.
+        self.pop("repo_root", None)
+        self["workflow_version"] = WORKFLOW_VERSION
+        self["last_updated"] = clock.now_iso()
+        for key, kind in SECTIONS.items():
+            self.setdefault(key, kind())
+        for key in extra_sections:
+            if not isinstance(self.get(key), list):
+                self[key] = []
+
+    def relative(self, text: str) -> str | None:
+        for root in self.roots:
+            prefix = root.rstrip("/") + "/"
+            if text.startswith(prefix):
+                return text[len(prefix) :]
+        return None
+
+    def portable(self, value: Any) -> Any:
+        """Rewrite absolute paths under the repo root (recursively) as repo-relative."""
+        if isinstance(value, str):
+            rel = self.relative(value)
+            return value if rel is None else rel
+        if isinstance(value, dict):
+            return {k: self.portable(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.portable(v) for v in value]
+        return value
+
+    def intern(self, value: Any) -> Any:
+        """Replace paths under the repo root (recursively) with artifact table ids."""
+        if isinstance(value, dict):
+            return {k: self.intern(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.intern(v) for v in value]
+        if not isinstance(value, str):
+            return value
+        rel = self.relative(value)
+        if rel is None:
+            return value
+        import hashlib
+
+        table = self.get("artifact_table")
+        if not isinstance(table, dict):
+            table = self["artifact_table"] = {}
+        digest = hashlib.sha1(rel.encode("utf-8")).hexdigest()
+        for width in (8, 12, 40):
+            ref = f"art-{digest[:width]}"
+            if table.setdefault(ref, rel) == rel:
+                return ref
+        raise RuntimeError(f"Artifact id collision for {rel}.")
+
+    def expand(self, value: Any) -> Any:
+        """Inverse of ``intern`` for display: artifact ids become relative paths."""
+        table = self.get("artifact_table")
+        if not isinstance(table, dict):
+            return value
+        return archive.expand(value, table)
+
+    def portable_action(self, action: dict[str, Any]) -> dict[str, Any]:
+        return {k: (self.intern(v) if k == "outputs" else self.portable(v)) for k, v in action.items()}
+
+    def record_action(self, action: dict[str, Any]) -> dict[str, Any]:
+        """Append ``action`` with its outputs interned and other paths made relative."""
+        record = self.portable_action(action)
+        self["actions"].append(record)
+        timing.attach(record)
+        self.unaudited.append(action)
+        return record
+
+    def make_portable(self) -> None:
+        """Rewrite existing history in place; save with ``rewrite=True`` afterwards."""
+        for key, value in list(self.items()):
+            if key == "artifact_table":
+                continue
+            if key == "actions":
+                self[key] = [self.portable_action(a) if isinstance(a, dict) else a for a in value]
+            else:
+                self[key] = self.portable(value)
+        self.pop("repo_root", None)
+
+    def save(self) -> None:
+        if self.path is None:
+            raise RuntimeError("Manifest has no path; load it with archwf.manifest.load().")
+        save(self.path, self)
+        if self.unaudited and self.roots:
+            from archwf import audit
+
+            actions, self.unaudited = self.unaudited, []
+            try:
+                audit.record_actions(Path(self.roots[0]), str(self.get("system", "")), actions, self.portable)
+            except (OSError, RuntimeError) as exc:
+                if audit.strict():
+                    raise
+                # The events stay buffered in the audit writer and are retried at exit.
+                print(f"Warning: manifest saved to {self.path}, but the audit log was not updated: {exc}", file=sys.stderr)
+
+
+def migrate_legacy(repo_root: Path, system: str) -> str | None:
+    """Copy ``docs/architecture/manifest/<system>.yaml`` to the canonical path once."""
+    manifest_path = resolve_manifest_path(repo_root, system)
+    legacy_path = legacy_manifest_path(repo_root, system)
+    if legacy_path.exists() and not manifest_path.exists():
+        import shutil
+
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(legacy_path, manifest_path)
+        return str(legacy_path)
+    return None
+
+
+def revision(path: Path) -> tuple[tuple[int, int, int] | None, ...]:
+    out: list[tuple[int, int, int] | None] = []
+    for candidate in (path, journal.journal_path(path)):
+        try:
+            st = candidate.stat()
+        except OSError:
+            out.append(None)
+            continue
+        out.append((st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def read(path: Path) -> dict[str, Any]:
+    """Parse the snapshot and replay the journal; resets the journal baseline."""
+    if not path.exists():
+        return journal.replay(path, {})
+    try:
+        data = warm.load_parsed(path, serialization.load_yaml)
+    except RuntimeError:
+        raise
+    except Exception as exc:
+        raise RuntimeError(f"Manifest at {path} is not parseable YAML content: {exc}")
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise RuntimeError(f"Manifest at {path} must be a mapping/object.")
+    return journal.replay(path, data)
+
+
+def load(path: Path) -> Manifest:
+    with timing.phase("manifest_load"):
+        # Taken before reading: a write that lands mid-read shows up as a
+        # revision change at save time and is merged rather than lost.
+        _revisions[str(path)] = revision(path)
+        return Manifest(read(path), path=path)
+
+
+def open_manifest(repo_root: Path, system: str) -> tuple[Manifest, str | None]:
+    """Migrate a legacy manifest if needed and load the canonical one.
+
+    Returns the manifest and the legacy path it was migrated from, if any.
+    """
+    migrated_from = migrate_legacy(repo_root, system)
+    return load(resolve_manifest_path(repo_root, system)), migrated_from
+
+
+def merge_mapping(base: dict[str, Any], ours: dict[str, Any], theirs: dict[str, Any]) -> dict[str, Any]:
+    """Three-way merge: keys this process changed win, everything else comes from disk."""
+    merged = dict(theirs)
+    for key, value in ours.items():
+        if key in base and journal.encode(base[key]) == journal.encode(value):
+            continue
+        if isinstance(value, dict) and isinstance(base.get(key), dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_mapping(base[key], value, merged[key])
+        else:
+            merged[key] = value
+    for key in base:
+        if key not in ours:
+            merged.pop(key, None)
+    return merged
+
+
+def rebase(path: Path, data: dict[str, Any]) -> dict[str, Any]:
+    """Replay this process's changes since load onto the manifest currently on disk."""
+    loaded = journal.baseline(path)
+    records = journal.diff_records(loaded, data) if loaded is not None else None
+    if records is None:
+        # No load baseline, or list history was rewritten (not appended to):
+        # there is no delta to replay, so this snapshot replaces the file.
+        return data
+    lengths, values = loaded["lengths"], loaded["values"]
+    current = read(path)
+    for record in records:
+        key, value = record.get("key"), record.get("value")
+        if record["op"] == "set" and isinstance(value, list) and key not in lengths and key not in values:
+            # Section created by this process; another writer may have created it too.
+            if isinstance(current.get(key), list):
+                current[key].extend(value)
+                continue
+        if record["op"] == "set" and isinstance(value, dict) and key in values and isinstance(current.get(key), dict):
+            current[key] = merge_mapping(json.loads(values[key]), value, current[key])
+            continue
+        journal.apply_record(current, record)
+    return current
+
+
+def save(
+    path: Path,
+    manifest: dict[str, Any],
+    *,
+    retain: dict[str, int] | None = None,
+    rewrite: bool = False,
+) -> None:
+    """Persist ``manifest``.
+
+    ``retain`` forces an exact rotation to those limits. ``rewrite`` writes a
+    full snapshot as-is, for maintenance commands that edit existing entries
+    (which neither the journal nor the concurrent-write rebase can express).
+    """
+    with timing.phase("manifest_save"), fileio.locked(path):
+        data = dict(manifest)
+        stale = not rewrite and _revisions.get(str(path)) != revision(path)
+        if stale:
+            data = rebase(path, data)
+        rotated = archive.rotate(path, data, retain, slack=retain is None) > 0
+        timing.refresh()
+        if rewrite or not journal.append_changes(path, data):
+            fileio.atomic_write_text(path, serialization.dump_yaml(data))
+            journal.reset(path, data)
+        serialization.write_sidecar(path, data)
+        _revisions[str(path)] = revision(path)
+    if stale or rotated:
+        manifest.clear()
+        manifest.update(data)
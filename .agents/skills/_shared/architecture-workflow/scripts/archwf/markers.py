@@ -0,0 +1,83 @@
+"""Streaming ``MAJOR_DECISION`` marker extraction.
+
+Files are memory-mapped and searched for the marker prefix with
+``find``, so only lines that actually carry a marker are decoded. Every
+marker keeps its file/line provenance.
+"""
+from __future__ import annotations
+
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from archwf import timing
+
+PREFIX = b"MAJOR_DECISION:"
+MAJOR_DECISION_RE = re.compile(r"^MAJOR_DECISION:\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(.+?)\s*$")
+COUNT_CHUNK = 1 << 20
+
+
+class Marker(NamedTuple):
+    category: str
+    key: str
+    summary: str
+    path: str
+    line: int
+
+
+def count_newlines(buf: mmap.mmap, start: int, end: int) -> int:
+    # mmap has no count(); bounded slices keep the copy small.
+    total = 0
+    while start < end:
+        stop = min(end, start + COUNT_CHUNK)
+        total += buf[start:stop].count(b"\n")
+        start = stop
+    return total
+
+
+def iter_marker_lines(path: Path) -> Iterator[tuple[int, str]]:
+    """Yield ``(line_number, stripped_line)`` for lines starting with the marker prefix."""
+    with path.open("rb") as fh:
+        try:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped and hold no markers.
+            return
+        with buf:
+            size = len(buf)
+            timing.count_read(size)
+            lineno, counted_to = 1, 0
+            pos = buf.find(PREFIX)
+            while pos != -1:
+                line_start = buf.rfind(b"\n", 0, pos) + 1
+                line_end = buf.find(b"\n", pos)
+                if line_end == -1:
+                    line_end = size
+                if not buf[line_start:pos].strip():
+                    lineno += count_newlines(buf, counted_to, line_start)
+                    counted_to = line_start
+                    yield lineno, buf[line_start:line_end].decode("utf-8", errors="replace").strip()
+                pos = buf.find(PREFIX, line_end)
+
+
+def parse_marker(line: str) -> tuple[str, str, str] | None:
+    m = MAJOR_DECISION_RE.match(line)
+    if not m:
+        return None
+    return m.group(1).strip(), m.group(2).strip(), m.group(3).strip()
+
+
+def iter_markers(path: Path, invalid: list[str] | None = None) -> Iterator[Marker]:
+    """Yield well-formed markers from ``path``.
+
+    Lines that start with the prefix but do not match the canonical grammar
+    are reported into ``invalid`` when it is given and skipped otherwise.
+    """
+    for lineno, line in iter_marker_lines(path):
+        parsed = parse_marker(line)
+        if parsed is None:
+            if invalid is not None:
+                invalid.append(f"Invalid MAJOR_DECISION grammar: {line} ({path}:{lineno})")
+            continue
+        yield Marker(*parsed, str(path), lineno)
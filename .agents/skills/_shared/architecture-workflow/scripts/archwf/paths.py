@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+# Resolved repo root per starting directory, kept in memory only: it saves
+# the upward walk for the daemon, which resolves on every request, and for
+# scripts that resolve more than once per run. A hit is re-checked with
+# is_repo_root(), so the daemon notices a removed root.
+_repo_roots: dict[str, Path] = {}
+
+
+def is_repo_root(path: Path) -> bool:
+    return (path / ".git").exists() or (path / ".agents" / "skills").exists()
+
+
+def resolve_repo_root(start: Path) -> Path:
+    key = os.path.abspath(start)
+    cached = _repo_roots.get(key)
+    if cached is not None and is_repo_root(cached):
+        return cached
+    cur = start.resolve()
+    while True:
+        if is_repo_root(cur):
+            _repo_roots[key] = cur
+            return cur
+        if cur.parent == cur:
+            raise RuntimeError("Could not resolve REPO_ROOT; .git/ or .agents/skills/ was not found.")
+        cur = cur.parent
+
+
+def resolve_manifest_path(repo_root: Path, system: str) -> Path:
+    return Path(os.path.join(repo_root, f"{system}.yaml"))
+
+
+def slugify(value: str, default: str = "system") -> str:
+    return re.sub(r"[^a-zA-Z0-9]+", "-", value.strip().lower()).strip("-") or default
+
+
+def latest_file(path: Path, pattern: str) -> Path | None:
+    files = sorted(path.glob(pattern), key=lambda p: p.stat().st_mtime)
+    return files[-1] if files else None
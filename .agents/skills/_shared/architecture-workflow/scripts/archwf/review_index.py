@@ -0,0 +1,152 @@
+"""Per-system index of review artifacts.
+
+Stored at ``docs/architecture/.cache/review-index.json``. For the shared
+``reviews/`` directory the index maps each system slug to the paths of its
+WA reviews and decision traces, and is stamped with the directory's mtime.
+A stamp mismatch means files were added or removed, so the whole map is
+rebuilt from one directory listing. A lookup stats only that system's
+files and returns the newest by mtime, as the original glob did, so an
+older review edited in place still wins.
+
+A stamp taken less than ``RACY_NS`` after the directory last changed is
+not trusted: a file created within the same mtime tick would not move it.
+Writers (``wa_review.py``, ``decision_trace.py``) add their file to their
+entry but leave the stamp alone, since another process may have added
+files in the meantime; the next lookup rescans once. Every
+load-modify-save holds the index's advisory lock, so concurrent writers
+cannot drop each other's entries.
+
+Solution overviews have free-form names; they are resolved with the
+original glob on a miss and the matches remembered per system against the
+``solution-overviews/`` directory stamp.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from archwf import fileio
+from archwf.paths import slugify
+
+INDEX_VERSION = 2
+RACY_NS = 2_000_000_000
+REVIEW_KINDS = {
+    "wa_review": re.compile(r"^WA-REVIEW-\d{8}-(.+)\.md$"),
+    "decision_trace": re.compile(r"^DECISION-TRACE-\d{8}-(.+)\.md$"),
+}
+
+
+def index_path(arch_root: Path) -> Path:
+    return arch_root / ".cache" / "review-index.json"
+
+
+def dir_stamp(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def trusted_stamp(stamp: int | None) -> int | None:
+    """``stamp`` if it is old enough that a same-tick change cannot hide behind it."""
+    if stamp is None or time.time_ns() - stamp < RACY_NS:
+        return None
+    return stamp
+
+
+def newest(paths: list[str]) -> Path | None:
+    best: tuple[float, str] | None = None
+    for path in paths:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if best is None or mtime >= best[0]:
+            best = (mtime, path)
+    return Path(best[1]) if best else None
+
+
+def load(arch_root: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(fileio.read_text(index_path(arch_root)))
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        data = {"version": INDEX_VERSION}
+    data.setdefault("reviews_stamp", None)
+    data.setdefault("reviews", {})
+    data.setdefault("overviews", {})
+    return data
+
+
+def save(arch_root: Path, index: dict[str, Any]) -> None:
+    path = index_path(arch_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fileio.write_text(tmp, json.dumps(index, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def scan_reviews(reviews_dir: Path) -> dict[str, dict[str, list[str]]]:
+    out: dict[str, dict[str, list[str]]] = {}
+    if reviews_dir.is_dir():
+        with os.scandir(reviews_dir) as entries:
+            for entry in entries:
+                for kind, pattern in REVIEW_KINDS.items():
+                    m = pattern.match(entry.name)
+                    if m:
+                        out.setdefault(m.group(1), {}).setdefault(kind, []).append(entry.path)
+    for kinds in out.values():
+        for paths in kinds.values():
+            paths.sort()
+    return out
+
+
+def refresh(arch_root: Path) -> dict[str, Any]:
+    with fileio.locked(index_path(arch_root)):
+        index = load(arch_root)
+        stamp = dir_stamp(arch_root / "reviews")
+        if index["reviews_stamp"] is None or index["reviews_stamp"] != stamp:
+            index["reviews"] = scan_reviews(arch_root / "reviews")
+            index["reviews_stamp"] = trusted_stamp(stamp)
+            save(arch_root, index)
+    return index
+
+
+def latest_review(arch_root: Path, system: str, kind: str, index: dict[str, Any] | None = None) -> Path | None:
+    index = index if index is not None else refresh(arch_root)
+    return newest(index["reviews"].get(slugify(system), {}).get(kind, []))
+
+
+def record_review(arch_root: Path, system: str, kind: str, path: Path) -> None:
+    """Add ``path`` to the ``kind`` entries for ``system`` after writing it."""
+    with fileio.locked(index_path(arch_root)):
+        index = load(arch_root)
+        paths = index["reviews"].setdefault(slugify(system), {}).setdefault(kind, [])
+        if str(path) not in paths:
+            paths.append(str(path))
+            paths.sort()
+        save(arch_root, index)
+
+
+def latest_overview(arch_root: Path, system: str) -> Path | None:
+    overviews_dir = arch_root / "solution-overviews"
+    stamp = dir_stamp(overviews_dir)
+    with fileio.locked(index_path(arch_root)):
+        index = load(arch_root)
+        entry = index["overviews"].get(system)
+        if entry and entry.get("stamp") is not None and entry.get("stamp") == stamp:
+            return newest(entry.get("paths", []))
+        if stamp is None:
+            return None
+        paths = sorted(str(p) for p in overviews_dir.glob(f"*{system}*.md"))
+        index["overviews"][system] = {"paths": paths, "stamp": trusted_stamp(stamp)}
+        save(arch_root, index)
+    return newest(paths)
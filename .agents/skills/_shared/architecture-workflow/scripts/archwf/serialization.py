@@ -0,0 +1,302 @@
+"""Manifest serialization backends.
+
+YAML goes through libyaml's ``CSafeLoader``/``CSafeDumper`` when PyYAML was
+built with it and falls back to the pure-Python ``SafeLoader``/``SafeDumper``
+otherwise; ``ARCHWF_YAML_BACKEND=python`` forces the pure-Python path. The
+documents they produce load to the same data, but are not always
+byte-identical (the two dumpers wrap long escaped strings differently).
+
+Without PyYAML, manifests are written in the minimal ``fallback_yaml_dump``
+block subset and read back by ``fallback_yaml_load``, a single-pass reader
+for exactly that subset, so history survives on runtimes without PyYAML.
+
+Machine consumers can opt into a ``<system>.json`` sidecar written next to
+the manifest on every save, enabled by ``ARCHWF_MANIFEST_JSON`` or by the
+sidecar already existing.
+
+PyYAML is imported on first use, so commands that never touch a manifest
+(``--help``, the ``archwf`` dispatcher) do not pay for it at startup.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+from archwf import fileio
+
+SIDECAR_ENV = "ARCHWF_MANIFEST_JSON"
+
+_UNSET: Any = object()
+_yaml: Any = _UNSET
+
+
+def yaml_module() -> Any:
+    """Return the ``yaml`` module, importing it on first call; None if unavailable."""
+    global _yaml
+    if _yaml is _UNSET:
+        try:
+            import yaml  # type: ignore
+        except Exception:
+            yaml = None
+        _yaml = yaml
+    return _yaml
+
+
+# Characters escaped inside double-quoted scalars. Besides the quote, the
+# backslash and control characters this covers everything YAML (and
+# str.splitlines) treats as a line break, so every scalar stays on one line.
+_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t", "\r": "\\r"}
+_ESCAPES.update({chr(c): f"\\x{c:02x}" for c in [*range(0x20), 0x7F, 0x85] if chr(c) not in _ESCAPES})
+_ESCAPES.update({"\u2028": "\\u2028", "\u2029": "\\u2029"})
+_NEEDS_ESCAPE = re.compile("[" + re.escape("".join(_ESCAPES)) + "]")
+_UNESCAPES = {"\\": "\\", '"': '"', "/": "/", "n": "\n", "t": "\t", "r": "\r", "0": "\0"}
+_ESCAPE_SEQ = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)")
+_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_PLAIN_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+# Plain words YAML 1.1 resolves to null/bool; quoted when used as keys.
+_RESERVED = {
+    *("null", "Null", "NULL"),
+    *("true", "True", "TRUE", "false", "False", "FALSE"),
+    *("yes", "Yes", "YES", "no", "No", "NO", "on", "On", "ON", "off", "Off", "OFF"),
+}
+
+
+def _quote(text: str) -> str:
+    return '"' + _NEEDS_ESCAPE.sub(lambda m: _ESCAPES[m.group()], text) + '"'
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return _quote(str(value))
+
+
+def _key(key: Any) -> str:
+    if isinstance(key, str) and not (_PLAIN_KEY.fullmatch(key) and key not in _RESERVED):
+        return _quote(key)
+    return str(key)
+
+
+def fallback_yaml_dump(data: Any, indent: int = 0) -> str:
+    """Render ``data`` in the minimal block-YAML subset read by :func:`fallback_yaml_load`.
+
+    Keys are sorted, strings are always double-quoted (with YAML escapes),
+    and empty containers are written as ``{}``/``[]``; the output is also
+    valid YAML for PyYAML.
+    """
+    pad = " " * indent
+    if isinstance(data, dict):
+        if not data:
+            return f"{pad}{{}}"
+        lines: list[str] = []
+        for key in sorted(data.keys()):
+            value = data[key]
+            if isinstance(value, (dict, list)) and value:
+                lines.append(f"{pad}{_key(key)}:")
+                lines.append(fallback_yaml_dump(value, indent + 2))
+            else:
+                rendered = ("{}" if isinstance(value, dict) else "[]") if isinstance(value, (dict, list)) else _scalar(value)
+                lines.append(f"{pad}{_key(key)}: {rendered}")
+        return "\n".join(lines)
+    if isinstance(data, list):
+        if not data:
+            return f"{pad}[]"
+        lines = []
+        for item in data:
+            if isinstance(item, (dict, list)) and item:
+                lines.append(f"{pad}-")
+                lines.append(fallback_yaml_dump(item, indent + 2))
+            else:
+                rendered = ("{}" if isinstance(item, dict) else "[]") if isinstance(item, (dict, list)) else _scalar(item)
+                lines.append(f"{pad}- {rendered}")
+        return "\n".join(lines)
+    return f"{pad}{_scalar(data)}"
+
+
+def _unescape(body: str) -> str:
+    if "\\" not in body:
+        return body
+
+    def replace(match: re.Match[str]) -> str:
+        seq = match.group(1)
+        if len(seq) > 1:
+            return chr(int(seq[1:], 16))
+        # Older fallback dumps only escaped quotes; keep any other backslash as written.
+        return _UNESCAPES.get(seq, "\\" + seq)
+
+    return _ESCAPE_SEQ.sub(replace, body)
+
+
+def _parse_scalar(token: str, lineno: int) -> Any:
+    if token.startswith('"'):
+        match = _QUOTED.fullmatch(token)
+        if match is None:
+            raise RuntimeError(f"line {lineno}: unterminated or malformed quoted scalar: {token[:60]}")
+        return _unescape(match.group(1))
+    if token == "{}":
+        return {}
+    if token == "[]":
+        return []
+    if token == "null":
+        return None
+    if token == "true":
+        return True
+    if token == "false":
+        return False
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        raise RuntimeError(f"line {lineno}: expected a quoted string, number, true, false or null: {token[:60]}")
+
+
+class _FallbackReader:
+    """Single pass over ``(lineno, indent, content)`` triples; each line is visited once."""
+
+    def __init__(self, text: str) -> None:
+        self.lines: list[tuple[int, int, str]] = []
+        # Split on "\n" only: str.splitlines() also breaks on characters that
+        # may legitimately appear inside (older, unescaped) scalars.
+        for lineno, raw in enumerate(text.split("\n"), start=1):
+            content = raw.rstrip("\r").strip(" ")
+            if content:
+                self.lines.append((lineno, len(raw) - len(raw.lstrip(" ")), content))
+        self.pos = 0
+
+    def parse(self) -> Any:
+        if not self.lines:
+            return None
+        value = self.block(self.lines[0][1])
+        if self.pos < len(self.lines):
+            lineno, _, content = self.lines[self.pos]
+            raise RuntimeError(f"line {lineno}: unexpected content: {content[:60]}")
+        return value
+
+    def block(self, indent: int) -> Any:
+        lineno, _, content = self.lines[self.pos]
+        if content == "-" or content.startswith("- "):
+            return self.sequence(indent)
+        if self.key_split(content) is None:
+            self.pos += 1
+            return _parse_scalar(content, lineno)
+        return self.mapping(indent)
+
+    def child(self, indent: int) -> Any:
+        """Value of a ``key:`` or ``-`` line with nothing after it: the deeper-indented block."""
+        if self.pos < len(self.lines) and self.lines[self.pos][1] > indent:
+            return self.block(self.lines[self.pos][1])
+        # Dumps made before empty containers were written as {}/[] left these empty.
+        return None
+
+    def sequence(self, indent: int) -> list[Any]:
+        items: list[Any] = []
+        while self.pos < len(self.lines):
+            lineno, line_indent, content = self.lines[self.pos]
+            if line_indent != indent or not (content == "-" or content.startswith("- ")):
+                break
+            self.pos += 1
+            rest = content[2:].strip(" ")
+            items.append(_parse_scalar(rest, lineno) if rest else self.child(indent))
+        return items
+
+    def mapping(self, indent: int) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        while self.pos < len(self.lines):
+            lineno, line_indent, content = self.lines[self.pos]
+            if line_indent != indent or content == "-" or content.startswith("- "):
+                break
+            split = self.key_split(content)
+            if split is None:
+                raise RuntimeError(f"line {lineno}: expected 'key: value': {content[:60]}")
+            key, rest = split
+            self.pos += 1
+            result[key] = _parse_scalar(rest, lineno) if rest else self.child(indent)
+        if self.pos < len(self.lines) and self.lines[self.pos][1] > indent:
+            lineno, _, content = self.lines[self.pos]
+            raise RuntimeError(f"line {lineno}: unexpected indentation: {content[:60]}")
+        return result
+
+    @staticmethod
+    def key_split(content: str) -> tuple[str, str] | None:
+        if content.startswith('"'):
+            match = _QUOTED.match(content)
+            if match is None or not content.startswith(":", match.end()):
+                return None
+            return _unescape(match.group(1)), content[match.end() + 1 :].strip(" ")
+        key, sep, rest = content.partition(":")
+        if not sep or (rest and not rest.startswith(" ")):
+            return None
+        return key.rstrip(" "), rest.strip(" ")
+
+
+def fallback_yaml_load(text: str) -> Any:
+    """Read the block-YAML subset written by :func:`fallback_yaml_dump`, in one pass.
+
+    Anything outside that subset (PyYAML's own output style, flow
+    collections other than ``{}``/``[]``, block scalars, comments) raises
+    RuntimeError naming the offending line.
+    """
+    return _FallbackReader(text).parse()
+
+
+def yaml_backend() -> str | None:
+    yaml = yaml_module()
+    if yaml is None:
+        return None
+    if os.environ.get("ARCHWF_YAML_BACKEND", "").strip().lower() == "python":
+        return "python"
+    return "libyaml" if getattr(yaml, "__with_libyaml__", False) else "python"
+
+
+def _loader() -> Any:
+    yaml = yaml_module()
+    return yaml.CSafeLoader if yaml_backend() == "libyaml" else yaml.SafeLoader
+
+
+def _dumper() -> Any:
+    yaml = yaml_module()
+    return yaml.CSafeDumper if yaml_backend() == "libyaml" else yaml.SafeDumper
+
+
+def load_yaml(text: str) -> Any:
+    yaml = yaml_module()
+    if yaml is None:
+        try:
+            return fallback_yaml_load(text)
+        except RuntimeError as exc:
+            raise RuntimeError(f"PyYAML is not installed and the manifest is not in the fallback YAML subset ({exc}).")
+    return yaml.load(text, Loader=_loader())
+
+
+def dump_yaml(data: Any) -> str:
+    yaml = yaml_module()
+    if yaml is None:
+        return fallback_yaml_dump(data) + "\n"
+    return yaml.dump(data, Dumper=_dumper(), sort_keys=True, default_flow_style=False)
+
+
+def sidecar_path(manifest_path: Path) -> Path:
+    return manifest_path.with_suffix(".json")
+
+
+def sidecar_enabled(manifest_path: Path) -> bool:
+    if os.environ.get(SIDECAR_ENV, "").strip().lower() in {"1", "true", "yes", "on"}:
+        return True
+    return sidecar_path(manifest_path).exists()
+
+
+def write_sidecar(manifest_path: Path, data: dict[str, Any]) -> None:
+    if not sidecar_enabled(manifest_path):
+        return
+    text = json.dumps(data, sort_keys=True, default=str) + "\n"
+    fileio.atomic_write_text(sidecar_path(manifest_path), text, fsync=False)
@@ -0,0 +1,82 @@
+"""Compiled ``{{placeholder}}`` templates.
+
+A template is tokenized once into literal runs and placeholder names, and
+cached per path against ``st_mtime_ns``/``st_size``. Rendering is a single
+pass with one dict lookup per placeholder.
+
+A list value repeats the whole line once per item when the placeholder is
+the only one on that line (``  - "{{owner}}"`` becomes one YAML list item
+per owner); elsewhere list items are joined with ``", "``. Placeholders with
+no value are left verbatim so baseline documents keep their fill-in
+markers; they are reported as ``unknown``, and values the template never
+uses are reported as ``unused``.
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Mapping, NamedTuple, Sequence, Union
+
+from archwf import fileio
+
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+Value = Union[str, Sequence[str]]
+
+
+class Rendered(NamedTuple):
+    text: str
+    unknown: list[str]
+    unused: list[str]
+
+
+class Template:
+    def __init__(self, source: str, name: str = "<template>") -> None:
+        self.name = name
+        pieces = PLACEHOLDER_RE.split(source)
+        literals, keys = pieces[0::2], pieces[1::2]
+        self.head = literals[0]
+        # (key, list joiner, following literal) per placeholder. The joiner
+        # closes the current line and reopens it for the next list item; it
+        # is None when another placeholder shares the line.
+        self.slots: list[tuple[str, str | None, str]] = []
+        for i, key in enumerate(keys):
+            before, after = literals[i], literals[i + 1]
+            alone = (i == 0 or "\n" in before) and (i == len(keys) - 1 or "\n" in after)
+            joiner = None
+            if alone:
+                prefix = before[before.rfind("\n") + 1 :]
+                cut = after.find("\n")
+                suffix = after + "\n" if cut == -1 else after[: cut + 1]
+                joiner = suffix + prefix
+            self.slots.append((key, joiner, after))
+        self.placeholders = frozenset(keys)
+
+    def render(self, values: Mapping[str, Value]) -> Rendered:
+        get = values.get
+        parts = [self.head]
+        unknown: list[str] = []
+        for key, joiner, literal in self.slots:
+            value = get(key)
+            if value is None:
+                unknown.append(key)
+                value = "{{" + key + "}}"
+            elif not isinstance(value, str):
+                value = (joiner or ", ").join(value)
+            parts.append(value)
+            parts.append(literal)
+        unused = sorted(set(values) - self.placeholders)
+        return Rendered("".join(parts), sorted(set(unknown)), unused)
+
+
+_cache: dict[str, tuple[int, int, Template]] = {}
+
+
+def load(path: Path) -> Template:
+    st = path.stat()
+    hit = _cache.get(str(path))
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    template = Template(fileio.read_text(path), name=path.name)
+    _cache[str(path)] = (st.st_mtime_ns, st.st_size, template)
+    return template
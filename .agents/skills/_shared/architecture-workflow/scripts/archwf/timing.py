@@ -0,0 +1,151 @@
+"""Per-run phase timing and I/O accounting.
+
+Each script calls :func:`begin` at the top of ``main()`` and wraps its
+stages in ``with timing.phase(name):``. Phases used by the workflow scripts:
+
+- ``resolve``: repo-root resolution
+- ``manifest_load``: manifest snapshot read, parse and journal replay
+- ``scan``: locating artifacts (ADR index, review index, globs, digests)
+- ``parse``: reading WA reviews, markers and batch inputs
+- ``render``: template rendering and report assembly
+- ``write``: writing generated documents and the architecture index
+- ``manifest_save``: locking, rebase, rotation and the manifest write
+- ``audit``: chaining and committing the run's audit log events
+
+Bytes read and written are counted by the shared I/O helpers (manifest,
+journal, archive, caches, templates) and by the scripts for the documents
+they produce. Reads that stream or memory-map a whole file count its size.
+
+The action recorded for the run carries a ``timing`` mapping. It is filled
+in during the manifest save, just before the manifest is encoded, so
+``manifest_save`` covers locking, rebase and rotation but not the final
+encode and write of that same save; ``--profile`` prints the complete
+breakdown, including it, to stderr when the script finishes.
+
+Batch modes share one run across worker threads: each action gets the
+run's totals as of its own save, and phases overlap, so they can add up to
+more than the wall time.
+
+Outside a run (library use, ``archwf`` maintenance commands) every helper
+is a no-op.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+
+class Run:
+    def __init__(self, script: str) -> None:
+        self.script = script
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        # Phases in progress, keyed by (thread id, phase name).
+        self.open: dict[tuple[int, str], float] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+        # The action entry each thread recorded, refreshed by that thread's save.
+        self.records = threading.local()
+
+    def summary(self) -> dict[str, Any]:
+        now = time.perf_counter()
+        with self.lock:
+            phases = dict(self.phases)
+            # Phases still running (the save that embeds this summary) count up to now.
+            for (_, name), started in self.open.items():
+                phases[name] = phases.get(name, 0.0) + (now - started)
+        return {
+            "wall_ms": round((now - self.started) * 1000, 3),
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in phases.items()},
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
+_run: Run | None = None
+
+
+def begin(script: str) -> Run:
+    """Start timing a script run; replaces any previous run in this process."""
+    global _run
+    _run = Run(script)
+    return _run
+
+
+def current() -> Run | None:
+    return _run
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    run = _run
+    key = (threading.get_ident(), name)
+    if run is None or key in run.open:
+        # Nested use of the same phase is attributed to the outer block.
+        yield
+        return
+    with run.lock:
+        run.open[key] = time.perf_counter()
+    try:
+        yield
+    finally:
+        with run.lock:
+            started = run.open.pop(key)
+            run.phases[name] = run.phases.get(name, 0.0) + (time.perf_counter() - started)
+
+
+def count_read(n: int) -> None:
+    if _run is not None:
+        with _run.lock:
+            _run.bytes_read += n
+
+
+def count_written(n: int) -> None:
+    if _run is not None:
+        with _run.lock:
+            _run.bytes_written += n
+
+
+def count_file(path: Path) -> None:
+    """Count a file that was streamed or memory-mapped in full as read."""
+    if _run is None:
+        return
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return
+    count_read(size)
+
+
+def attach(record: dict[str, Any]) -> None:
+    """Make ``record`` (the run's action entry) carry this run's timing."""
+    if _run is not None:
+        _run.records.current = record
+        record["timing"] = _run.summary()
+
+
+def refresh() -> None:
+    """Update the attached action's timing; called just before the manifest is encoded."""
+    record = getattr(_run.records, "current", None) if _run is not None else None
+    if record is not None:
+        record["timing"] = _run.summary()
+
+
+def report(stream: TextIO | None = None) -> None:
+    if _run is None:
+        return
+    stream = stream or sys.stderr
+    summary = _run.summary()
+    wall = summary["wall_ms"] or 1.0
+    print(f"Profile: {_run.script}", file=stream)
+    for name, ms in sorted(summary["phases_ms"].items(), key=lambda item: -item[1]):
+        print(f"  {name:<14} {ms:10.3f} ms  {ms / wall:6.1%}", file=stream)
+    accounted = sum(summary["phases_ms"].values())
+    print(f"  {'other':<14} {max(0.0, wall - accounted):10.3f} ms", file=stream)
+    print(f"  {'wall':<14} {wall:10.3f} ms", file=stream)
+    print(f"  bytes read {summary['bytes_read']}, written {summary['bytes_written']}", file=stream)
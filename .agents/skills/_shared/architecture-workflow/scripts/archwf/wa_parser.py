@@ -0,0 +1,107 @@
+"""Single-pass parser for Well-Architected review documents.
+
+The review is read line by line once; each ``## <heading>`` section is
+yielded as soon as the next heading (or end of input) is reached, so memory
+is bounded by the largest section rather than the whole document.
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, NamedTuple
+
+PILLARS = [
+    "Operational Excellence",
+    "Security",
+    "Reliability",
+    "Performance Efficiency",
+    "Cost Optimization",
+    "Sustainability",
+]
+SCORE_RE = re.compile(r"^Score:\s*(Pass|Needs Work|Fail)\s*$")
+CHECKLIST_RE = re.compile(r"^\s*-\s*\[([ xX])\]\s*(.*?)\s*$")
+FINDINGS_RE = re.compile(r"^Findings(?:\s*\+\s*Remediations)?:\s*$")
+
+
+class PillarSection(NamedTuple):
+    pillar: str
+    score: str | None
+    checklist: list[tuple[bool, str]]
+    findings: list[str]
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def heading_name(line: str) -> str | None:
+    if line.startswith("##") and len(line) > 2 and line[2] in " \t":
+        return line[2:].strip()
+    return None
+
+
+def iter_sections(lines: Iterable[str]) -> Iterator[PillarSection]:
+    name: str | None = None
+    score: str | None = None
+    checklist: list[tuple[bool, str]] = []
+    findings: list[str] = []
+    in_findings = False
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        heading = heading_name(line)
+        if heading is not None:
+            if name is not None:
+                yield PillarSection(name, score, checklist, findings)
+            name, score, checklist, findings, in_findings = heading, None, [], [], False
+            continue
+        if name is None:
+            continue
+        if score is None:
+            m = SCORE_RE.match(line)
+            if m:
+                score = m.group(1)
+                continue
+        if in_findings:
+            if line.strip():
+                findings.append(line.rstrip())
+            continue
+        if FINDINGS_RE.match(line):
+            in_findings = True
+            continue
+        m = CHECKLIST_RE.match(line)
+        if m:
+            checklist.append((m.group(1) != " ", m.group(2)))
+    if name is not None:
+        yield PillarSection(name, score, checklist, findings)
+
+
+def parse_review(source: str | Iterable[str]) -> dict[str, PillarSection]:
+    lines = iter_lines(source) if isinstance(source, str) else source
+    wanted = set(PILLARS)
+    sections: dict[str, PillarSection] = {}
+    for section in iter_sections(lines):
+        # First occurrence wins, matching the validator's historical behaviour.
+        if section.pillar in wanted and section.pillar not in sections:
+            sections[section.pillar] = section
+    return sections
+
+
+def parse_scores(source: str | Iterable[str]) -> tuple[dict[str, str], list[str]]:
+    sections = parse_review(source)
+    issues: list[str] = []
+    scores: dict[str, str] = {}
+    for pillar in PILLARS:
+        section = sections.get(pillar)
+        if section is None:
+            issues.append(f"Missing WA pillar section: {pillar}")
+        elif section.score is None:
+            issues.append(f"Missing score for pillar: {pillar}")
+        else:
+            scores[pillar] = section.score
+    return scores, issues
@@ -0,0 +1,45 @@
+"""Process-wide file caches used while the workflow daemon is serving.
+
+Outside the daemon every helper is a plain passthrough. Inside it, parsed
+documents are kept in memory and revalidated against
+``st_mtime_ns``/``st_size`` on every access, so edits made on disk between
+requests are picked up without an explicit watcher.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+from archwf import fileio
+
+_enabled = False
+_parsed: dict[str, tuple[int, int, Any]] = {}
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def clear() -> None:
+    _parsed.clear()
+
+
+def stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_parsed(path: Path, parse: Callable[[str], Any]) -> Any:
+    if not _enabled:
+        return parse(fileio.read_text(path))
+    mtime_ns, size = stat_key(path)
+    hit = _parsed.get(str(path))
+    if not (hit and hit[0] == mtime_ns and hit[1] == size):
+        hit = (mtime_ns, size, parse(fileio.read_text(path)))
+        _parsed[str(path)] = hit
+    # Callers mutate what they load (appending actions), so never hand out
+    # the cached object itself.
+    import copy
+
+    return copy.deepcopy(hit[2])
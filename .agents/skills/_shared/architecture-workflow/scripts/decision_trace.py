@@ -2,142 +2,45 @@
 from __future__ import annotations
 
 import argparse
-import os
-import re
-import shutil
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
 
-import yaml
+from archwf import WORKFLOW_VERSION
+from archwf import adr_index as adr_cache
+from archwf import client as daemon_client
+from archwf import fileio
+from archwf import manifest as manifest_store
+from archwf import markers as decision_markers
+from archwf import review_index
+from archwf import timing
+from archwf.clock import iso_date, now_iso, ymd
+from archwf.paths import latest_file, resolve_manifest_path, resolve_repo_root, slugify
 
-WORKFLOW_VERSION = "1.0.0"
-MAJOR_DECISION_RE = re.compile(r"^MAJOR_DECISION:\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(.+?)\s*$")
+MAJOR_DECISION_RE = decision_markers.MAJOR_DECISION_RE
 
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def ymd() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%d")
-
-
-def iso_date() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-
-def slugify(value: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9]+", "-", value.strip().lower()).strip("-") or "system"
-
-
-def is_repo_root(path: Path) -> bool:
-    return (path / ".git").exists() or (path / ".agents" / "skills").exists()
-
-
-def resolve_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while True:
-        if is_repo_root(cur):
-            return cur
-        if cur.parent == cur:
-            raise RuntimeError("Could not resolve REPO_ROOT; .git/ or .agents/skills/ was not found.")
-        cur = cur.parent
-
-
-def resolve_manifest_path(repo_root: Path, system: str) -> Path:
-    return Path(os.path.join(repo_root, f"{system}.yaml"))
-
-
-def migrate_legacy_manifest(repo_root: Path, system: str) -> str | None:
-    manifest_path = resolve_manifest_path(repo_root, system)
-    legacy_manifest_path = repo_root / "docs" / "architecture" / "manifest" / f"{system}.yaml"
-    if legacy_manifest_path.exists() and not manifest_path.exists():
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_manifest_path, manifest_path)
-        return str(legacy_manifest_path)
-    return None
-
-
-def normalize_manifest(m: Any) -> dict[str, Any]:
-    manifest = m if isinstance(m, dict) else {}
-    if not isinstance(manifest.get("adrs"), list):
-        manifest["adrs"] = []
-    if not isinstance(manifest.get("wa_reviews"), list):
-        manifest["wa_reviews"] = []
-    if not isinstance(manifest.get("validations"), list):
-        manifest["validations"] = []
-    if not isinstance(manifest.get("decision_traces"), list):
-        manifest["decision_traces"] = []
-    if not isinstance(manifest.get("actions"), list):
-        manifest["actions"] = []
-    if not isinstance(manifest.get("artifacts"), dict):
-        manifest["artifacts"] = {}
-    return manifest
-
-
-def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return data if isinstance(data, dict) else {}
-
-
-def save_manifest(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=True, default_flow_style=False),
-        encoding="utf-8",
-    )
-
-
-def ensure_common_manifest_keys(m: dict[str, Any], repo_root: Path, manifest_path: Path, system: str) -> None:
-    m.setdefault("system", system)
-    m["manifest_path"] = str(manifest_path)
-    m["repo_root"] = str(repo_root)
-    m["workflow_version"] = WORKFLOW_VERSION
-    m["last_updated"] = now_iso()
-    m.setdefault("artifacts", {})
-    m.setdefault("adrs", [])
-    m.setdefault("wa_reviews", [])
-    m.setdefault("validations", [])
-    m.setdefault("decision_traces", [])
-    m.setdefault("actions", [])
-
-
-def latest_file(path: Path, pattern: str) -> Path | None:
-    files = sorted(path.glob(pattern), key=lambda p: p.stat().st_mtime)
-    return files[-1] if files else None
-
-
-def parse_markers(text: str) -> list[tuple[str, str, str]]:
-    markers: list[tuple[str, str, str]] = []
-    for line in text.splitlines():
-        m = MAJOR_DECISION_RE.match(line.strip())
-        if m:
-            markers.append((m.group(1).strip(), m.group(2).strip(), m.group(3).strip()))
-    return markers
+def parse_markers(path: Path | None) -> list[decision_markers.Marker]:
+    with timing.phase("parse"):
+        return list(decision_markers.iter_markers(path)) if path else []
 
 
 def adr_index(decisions_dir: Path) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for adr in decisions_dir.glob("ADR-*.md"):
-        slug = adr.stem.split("-", 2)[-1]
-        out[slug] = str(adr)
-        text = adr.read_text(encoding="utf-8")
-        m = re.search(r"^decision_id:\s*\"?([^\n\"]+)\"?\s*$", text, re.M)
-        if m:
-            out[m.group(1).strip()] = str(adr)
-    return out
+    with timing.phase("scan"):
+        return adr_cache.adr_index(decisions_dir)
 
 
 def main() -> int:
+    forwarded = daemon_client.forward("decision_trace", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
     parser = argparse.ArgumentParser(description="Generate decision trace linking markers to ADRs.")
     parser.add_argument("--system")
     parser.add_argument("--date", help="YYYY-MM-DD")
     parser.add_argument("--interactive", action="store_true")
+    parser.add_argument("--profile", action="store_true", help="Print a per-phase timing breakdown to stderr.")
     args = parser.parse_args()
+    timing.begin("decision_trace.py")
 
     if not args.system:
         if args.interactive:
@@ -151,49 +54,53 @@ def main() -> int:
             return 2
 
     try:
-        repo_root = resolve_repo_root(Path.cwd())
+        with timing.phase("resolve"):
+            repo_root = resolve_repo_root(Path.cwd())
         arch_root = repo_root / "docs" / "architecture"
         reviews_dir = arch_root / "reviews"
-        overviews_dir = arch_root / "solution-overviews"
         decisions_dir = arch_root / "decisions"
 
-        overview = latest_file(overviews_dir, f"*{args.system}*.md")
-        wa = latest_file(reviews_dir, f"WA-REVIEW-*-*{args.system}*.md")
-        overview_text = overview.read_text(encoding="utf-8") if overview else ""
-        wa_text = wa.read_text(encoding="utf-8") if wa else ""
-
-        markers = parse_markers(overview_text) + parse_markers(wa_text)
+        with timing.phase("scan"):
+            overview = review_index.latest_overview(arch_root, args.system)
+            wa = review_index.latest_review(arch_root, args.system, "wa_review") or latest_file(
+                reviews_dir, f"WA-REVIEW-*-*{args.system}*.md"
+            )
+        markers = parse_markers(overview) + parse_markers(wa)
         adrs = adr_index(decisions_dir)
 
         out_path = reviews_dir / f"DECISION-TRACE-{ymd()}-{slugify(args.system)}.md"
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        lines = [
-            "# Decision Trace\n",
-            f"System: {args.system}\n",
-            f"Date: {args.date or iso_date()}\n\n",
-            "## Decision to ADR Mapping\n",
-        ]
-        if not markers:
-            lines.append("No MAJOR_DECISION markers found.\n")
-        else:
-            for category, key, summary in markers:
-                lines.append(f"- Category: {category}\n")
-                lines.append(f"  Key: {key}\n")
-                lines.append(f"  Summary: {summary}\n")
-                lines.append(f"  ADR: {adrs.get(key, 'MISSING')}\n")
-        out_path.write_text("".join(lines), encoding="utf-8")
+        with timing.phase("render"):
+            lines = [
+                "# Decision Trace\n",
+                f"System: {args.system}\n",
+                f"Date: {args.date or iso_date()}\n\n",
+                "## Decision to ADR Mapping\n",
+            ]
+            if not markers:
+                lines.append("No MAJOR_DECISION markers found.\n")
+            else:
+                for marker in markers:
+                    lines.append(f"- Category: {marker.category}\n")
+                    lines.append(f"  Key: {marker.key}\n")
+                    lines.append(f"  Summary: {marker.summary}\n")
+                    lines.append(f"  ADR: {adrs.get(marker.key, 'MISSING')}\n")
+                    lines.append(f"  Source: {marker.path}:{marker.line}\n")
+        with timing.phase("write"):
+            fileio.write_text(out_path, "".join(lines))
+            review_index.record_review(arch_root, args.system, "decision_trace", out_path)
 
         manifest_path = resolve_manifest_path(repo_root, args.system)
-        migrated_manifest_from = migrate_legacy_manifest(repo_root, args.system)
-        manifest = normalize_manifest(load_manifest(manifest_path))
-        ensure_common_manifest_keys(manifest, repo_root, manifest_path, args.system)
+        migrated_manifest_from = manifest_store.migrate_legacy(repo_root, args.system)
+        manifest = manifest_store.load(manifest_path)
+        manifest.stamp(repo_root, args.system)
         manifest["decision_traces"].append(
             {
-                "path": str(out_path),
+                "path": manifest.portable(str(out_path)),
                 "timestamp": now_iso(),
             }
         )
-        manifest["actions"].append(
+        manifest.record_action(
             {
                 "script": "decision_trace.py",
                 "timestamp": now_iso(),
@@ -204,10 +111,12 @@ def main() -> int:
             }
         )
         if migrated_manifest_from:
-            manifest["actions"][-1]["migrated_manifest_from"] = migrated_manifest_from
-        save_manifest(manifest_path, manifest)
+            manifest.actions[-1]["migrated_manifest_from"] = manifest.portable(migrated_manifest_from)
+        manifest.save()
 
         print(str(out_path))
+        if args.profile:
+            timing.report()
         return 0
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
@@ -3,118 +3,31 @@ from __future__ import annotations
 
 import argparse
 import os
-import shutil
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-try:
-    import yaml  # type: ignore
-except Exception:
-    yaml = None
-
-WORKFLOW_VERSION = "1.0.0"
-
-
-def fallback_yaml_dump(data: Any, indent: int = 0) -> str:
-    pad = " " * indent
-    if isinstance(data, dict):
-        lines: list[str] = []
-        for key in sorted(data.keys()):
-            value = data[key]
-            if isinstance(value, (dict, list)):
-                lines.append(f"{pad}{key}:")
-                lines.append(fallback_yaml_dump(value, indent + 2))
-            else:
-                if value is None:
-                    rendered = "null"
-                elif isinstance(value, bool):
-                    rendered = "true" if value else "false"
-                elif isinstance(value, (int, float)):
-                    rendered = str(value)
-                else:
-                    text = str(value).replace('"', '\\"')
-                    rendered = f"\"{text}\""
-                lines.append(f"{pad}{key}: {rendered}")
-        return "\n".join(lines)
-    if isinstance(data, list):
-        lines = []
-        for item in data:
-            if isinstance(item, (dict, list)):
-                lines.append(f"{pad}-")
-                lines.append(fallback_yaml_dump(item, indent + 2))
-            else:
-                if item is None:
-                    rendered = "null"
-                elif isinstance(item, bool):
-                    rendered = "true" if item else "false"
-                elif isinstance(item, (int, float)):
-                    rendered = str(item)
-                else:
-                    text = str(item).replace('"', '\\"')
-                    rendered = f"\"{text}\""
-                lines.append(f"{pad}- {rendered}")
-        return "\n".join(lines)
-    if data is None:
-        return f"{pad}null"
-    if isinstance(data, bool):
-        return f"{pad}{'true' if data else 'false'}"
-    if isinstance(data, (int, float)):
-        return f"{pad}{data}"
-    text = str(data).replace('"', '\\"')
-    return f"{pad}\"{text}\""
-
-
-def utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def is_repo_root(path: Path) -> bool:
-    return (path / ".git").exists() or (path / ".agents" / "skills").exists()
+from typing import TYPE_CHECKING
 
+from archwf import WORKFLOW_VERSION
+from archwf import arch_index
+from archwf import client as daemon_client
+from archwf import fileio
+from archwf import manifest as manifest_store
+from archwf import paths
+from archwf import timing
+from archwf.clock import iso_date, now_iso
+from archwf.paths import resolve_manifest_path
 
-def resolve_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while True:
-        if is_repo_root(cur):
-            return cur
-        if cur.parent == cur:
-            raise RuntimeError(
-                "Could not resolve REPO_ROOT. Walked to filesystem root without finding .git/ or .agents/skills/."
-            )
-        cur = cur.parent
-
-
-def resolve_manifest_path(repo_root: Path, system: str) -> Path:
-    return Path(os.path.join(repo_root, f"{system}.yaml"))
+if TYPE_CHECKING:
+    from archwf import templates
 
 
-def migrate_legacy_manifest(repo_root: Path, system: str) -> str | None:
-    manifest_path = resolve_manifest_path(repo_root, system)
-    legacy_manifest_path = repo_root / "docs" / "architecture" / "manifest" / f"{system}.yaml"
-    if legacy_manifest_path.exists() and not manifest_path.exists():
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_manifest_path, manifest_path)
-        return str(legacy_manifest_path)
-    return None
-
-
-def normalize_manifest(m: Any) -> dict[str, Any]:
-    manifest = m if isinstance(m, dict) else {}
-    if not isinstance(manifest.get("adrs"), list):
-        manifest["adrs"] = []
-    if not isinstance(manifest.get("wa_reviews"), list):
-        manifest["wa_reviews"] = []
-    if not isinstance(manifest.get("validations"), list):
-        manifest["validations"] = []
-    if not isinstance(manifest.get("decision_traces"), list):
-        manifest["decision_traces"] = []
-    if not isinstance(manifest.get("actions"), list):
-        manifest["actions"] = []
-    if not isinstance(manifest.get("artifacts"), dict):
-        manifest["artifacts"] = {}
-    return manifest
+def resolve_repo_root(start: Path) -> Path:
+    try:
+        return paths.resolve_repo_root(start)
+    except RuntimeError:
+        raise RuntimeError(
+            "Could not resolve REPO_ROOT. Walked to filesystem root without finding .git/ or .agents/skills/."
+        ) from None
 
 
 def ensure_architecture_dirs(repo_root: Path) -> dict[str, str]:
@@ -136,33 +49,24 @@ def ensure_architecture_dirs(repo_root: Path) -> dict[str, str]:
 def ensure_index(repo_root: Path) -> str:
     index_path = repo_root / "docs" / "architecture" / "index.md"
     lines = [
-        "# Architecture Index\n",
-        "\n",
-        "- Decisions: `docs/architecture/decisions/`\n",
-        "- Reviews: `docs/architecture/reviews/`\n",
-        "- Diagrams: `docs/architecture/diagrams/`\n",
-        "- Threat Models: `docs/architecture/threat-models/`\n",
-        "- Runbooks: `docs/architecture/runbooks/`\n",
-        "- Solution Overviews: `docs/architecture/solution-overviews/`\n",
-        "- Manifest: `docs/architecture/manifest/`\n",
+        "- Decisions: `docs/architecture/decisions/`",
+        "- Reviews: `docs/architecture/reviews/`",
+        "- Diagrams: `docs/architecture/diagrams/`",
+        "- Threat Models: `docs/architecture/threat-models/`",
+        "- Runbooks: `docs/architecture/runbooks/`",
+        "- Solution Overviews: `docs/architecture/solution-overviews/`",
+        "- Manifest: `docs/architecture/manifest/`",
     ]
-    if not index_path.exists():
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-        index_path.write_text("".join(lines), encoding="utf-8")
-    else:
-        existing = index_path.read_text(encoding="utf-8")
-        for line in lines[2:]:
-            if line.strip() not in existing:
-                existing += line
-        index_path.write_text(existing, encoding="utf-8")
+    with timing.phase("write"):
+        arch_index.update(index_path.parent, lines)
     return str(index_path)
 
 
 def render_template(template_path: Path, replacements: dict[str, str]) -> str:
-    text = template_path.read_text(encoding="utf-8")
-    for key, value in replacements.items():
-        text = text.replace("{{" + key + "}}", value)
-    return text
+    from archwf import templates
+
+    # Placeholders without a value stay in the baseline docs for owners to fill in.
+    return templates.load(template_path).render(replacements).text
 
 
 def ensure_file(
@@ -172,120 +76,240 @@ def ensure_file(
     force: bool,
     force_overwrite_allowed: bool,
 ) -> str:
-    if path.exists():
-        if force and force_overwrite_allowed:
-            path.write_text(content, encoding="utf-8")
-            return "overwritten"
-        return "exists"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    return "created"
-
-
-def baseline_doc_pack(
-    repo_root: Path,
-    system: str,
-    *,
-    force: bool,
-) -> tuple[dict[str, str], dict[str, list[str]]]:
-    arch = repo_root / "docs" / "architecture"
-    templates = repo_root / ".agents" / "skills" / "_shared" / "architecture-workflow" / "templates"
+    # Parent directories come from ensure_architecture_dirs(), run once per invocation.
+    with timing.phase("write"):
+        if path.exists():
+            if force and force_overwrite_allowed:
+                fileio.write_text(path, content)
+                return "overwritten"
+            return "exists"
+        fileio.write_text(path, content)
+        return "created"
+
+
+DIAGRAM_PLACEHOLDERS = {
+    "diagram_context": "# Diagram Placeholder: Context\n\nDefine system context, external actors, and trust boundaries.\n",
+    "diagram_containers": "# Diagram Placeholder: Containers\n\nDefine runtime containers/services and key interactions.\n",
+    "diagram_dataflow": "# Diagram Placeholder: Data Flow\n\nDefine primary data paths, stores, and transformation boundaries.\n",
+    "diagram_network": "# Diagram Placeholder: Network\n\nDefine VPC/VNet topology, subnets, routing, and ingress/egress controls.\n",
+}
+
+
+def load_doc_templates(repo_root: Path) -> dict[str, templates.Template]:
+    template_dir = repo_root / ".agents" / "skills" / "_shared" / "architecture-workflow" / "templates"
     required_templates = {
-        "solution": templates / "solution-overview.md",
-        "threat": templates / "threat-model-lite.md",
-        "runbook": templates / "runbook-baseline.md",
+        "solution": template_dir / "solution-overview.md",
+        "threat": template_dir / "threat-model-lite.md",
+        "runbook": template_dir / "runbook-baseline.md",
     }
     for key, template_path in required_templates.items():
         if not template_path.exists():
             raise RuntimeError(f"Missing required template '{key}': {template_path}")
+    from archwf import templates
 
-    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    with timing.phase("parse"):
+        return {key: templates.load(path) for key, path in required_templates.items()}
+
+
+def plan_doc_pack(
+    repo_root: Path,
+    system: str,
+    doc_templates: dict[str, templates.Template],
+) -> list[tuple[str, Path, str, bool]]:
+    """Return ``(key, path, content, force_overwrite_allowed)`` for each baseline file."""
+    arch = repo_root / "docs" / "architecture"
     replacements = {
         "system": system,
-        "date": date,
+        "date": iso_date(),
         "owners": "TBD",
     }
+    # Placeholders without a value stay in the baseline docs for owners to fill in.
+    with timing.phase("render"):
+        plan = [
+            (
+                "solution_overview",
+                arch / "solution-overviews" / f"{system}.md",
+                doc_templates["solution"].render(replacements).text,
+                True,
+            ),
+            (
+                "threat_model_lite",
+                arch / "threat-models" / f"{system}-threat-model-lite.md",
+                doc_templates["threat"].render(replacements).text,
+                True,
+            ),
+            (
+                "runbook_baseline",
+                arch / "runbooks" / f"{system}-runbook-baseline.md",
+                doc_templates["runbook"].render(replacements).text,
+                True,
+            ),
+        ]
+    for key, content in DIAGRAM_PLACEHOLDERS.items():
+        name = key.split("_", 1)[1]
+        plan.append((key, arch / "diagrams" / f"{system}-{name}.md", content, False))
+    return plan
 
-    paths = {
-        "solution_overview": arch / "solution-overviews" / f"{system}.md",
-        "threat_model_lite": arch / "threat-models" / f"{system}-threat-model-lite.md",
-        "runbook_baseline": arch / "runbooks" / f"{system}-runbook-baseline.md",
-        "diagram_context": arch / "diagrams" / f"{system}-context.md",
-        "diagram_containers": arch / "diagrams" / f"{system}-containers.md",
-        "diagram_dataflow": arch / "diagrams" / f"{system}-dataflow.md",
-        "diagram_network": arch / "diagrams" / f"{system}-network.md",
-    }
 
-    states = {"created": [], "exists": [], "overwritten": []}
+def baseline_doc_pack(
+    repo_root: Path,
+    system: str,
+    *,
+    force: bool,
+    doc_templates: dict[str, templates.Template] | None = None,
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    plan = plan_doc_pack(repo_root, system, doc_templates or load_doc_templates(repo_root))
+    states: dict[str, list[str]] = {"created": [], "exists": [], "overwritten": []}
+    for _, path, content, overwrite_allowed in plan:
+        state = ensure_file(path, content, force=force, force_overwrite_allowed=overwrite_allowed)
+        states[state].append(str(path))
+    return {key: str(path) for key, path, _, _ in plan}, states
 
-    solution_state = ensure_file(
-        paths["solution_overview"],
-        render_template(required_templates["solution"], replacements),
-        force=force,
-        force_overwrite_allowed=True,
-    )
-    states[solution_state].append(str(paths["solution_overview"]))
 
-    threat_state = ensure_file(
-        paths["threat_model_lite"],
-        render_template(required_templates["threat"], replacements),
-        force=force,
-        force_overwrite_allowed=True,
-    )
-    states[threat_state].append(str(paths["threat_model_lite"]))
+def read_systems_file(path: Path) -> list[str]:
+    """One system per line; blank lines and ``#`` comments are ignored, duplicates dropped."""
+    if not path.exists():
+        raise RuntimeError(f"Systems file not found: {path}")
+    systems: dict[str, None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            systems[line] = None
+    return list(systems)
 
-    runbook_state = ensure_file(
-        paths["runbook_baseline"],
-        render_template(required_templates["runbook"], replacements),
-        force=force,
-        force_overwrite_allowed=True,
-    )
-    states[runbook_state].append(str(paths["runbook_baseline"]))
 
-    diagram_placeholders = {
-        "diagram_context": "# Diagram Placeholder: Context\n\nDefine system context, external actors, and trust boundaries.\n",
-        "diagram_containers": "# Diagram Placeholder: Containers\n\nDefine runtime containers/services and key interactions.\n",
-        "diagram_dataflow": "# Diagram Placeholder: Data Flow\n\nDefine primary data paths, stores, and transformation boundaries.\n",
-        "diagram_network": "# Diagram Placeholder: Network\n\nDefine VPC/VNet topology, subnets, routing, and ingress/egress controls.\n",
-    }
-    for key, content in diagram_placeholders.items():
-        state = ensure_file(
-            paths[key],
-            content,
-            force=force,
-            force_overwrite_allowed=False,
+def record_init(
+    repo_root: Path,
+    system: str,
+    dirs: dict[str, str],
+    index_path: str,
+    baseline_paths: dict[str, str],
+    baseline_states: dict[str, list[str]],
+    inputs: dict[str, object],
+) -> Path:
+    manifest_path = resolve_manifest_path(repo_root, system)
+    migrated_manifest_from = manifest_store.migrate_legacy(repo_root, system)
+    manifest = manifest_store.load(manifest_path)
+    manifest.stamp(repo_root, system)
+
+    manifest["artifacts"].update(
+        manifest.portable(
+            {
+                "index": index_path,
+                "decisions_dir": dirs["decisions"],
+                "reviews_dir": dirs["reviews"],
+                "diagrams_dir": dirs["diagrams"],
+                "threat_models_dir": dirs["threat-models"],
+                "runbooks_dir": dirs["runbooks"],
+                "solution_overviews_dir": dirs["solution-overviews"],
+                "manifest_dir": dirs["manifest"],
+            }
         )
-        states[state].append(str(paths[key]))
+    )
+    manifest["artifacts"]["baseline_doc_pack"] = manifest.portable(
+        {
+            "solution_overview": baseline_paths["solution_overview"],
+            "threat_model_lite": baseline_paths["threat_model_lite"],
+            "runbook_baseline": baseline_paths["runbook_baseline"],
+            "diagrams": {
+                "context": baseline_paths["diagram_context"],
+                "containers": baseline_paths["diagram_containers"],
+                "dataflow": baseline_paths["diagram_dataflow"],
+                "network": baseline_paths["diagram_network"],
+            },
+        }
+    )
 
-    return {k: str(v) for k, v in paths.items()}, states
+    manifest.record_action(
+        {
+            "script": "init_arch_workflow.py",
+            "timestamp": now_iso(),
+            "inputs": inputs,
+            "outputs": {
+                "index_path": index_path,
+                "manifest_path": str(manifest_path),
+                "baseline_doc_pack": baseline_paths,
+                "baseline_created": baseline_states["created"],
+                "baseline_existing": baseline_states["exists"],
+                "baseline_overwritten": baseline_states["overwritten"],
+            },
+            "exit_code": 0,
+            "workflow_version": WORKFLOW_VERSION,
+        }
+    )
+    if migrated_manifest_from:
+        manifest.actions[-1]["migrated_manifest_from"] = manifest.portable(migrated_manifest_from)
 
+    manifest.save()
+    return manifest_path
 
-def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    text = path.read_text(encoding="utf-8")
-    if yaml is None:
-        # No YAML parser available in runtime: preserve deterministic behavior
-        # by treating non-empty manifests as opaque and starting a fresh mapping.
-        return {}
-    try:
-        data = yaml.safe_load(text)
-    except Exception as exc:
-        raise RuntimeError(f"Manifest at {path} is not parseable YAML content: {exc}")
-    if data is None:
-        return {}
-    if not isinstance(data, dict):
-        raise RuntimeError(f"Manifest at {path} must be a mapping/object.")
-    return data
 
+def init_many(args: argparse.Namespace, systems: list[str]) -> int:
+    from concurrent.futures import ThreadPoolExecutor
 
-def write_manifest(path: Path, manifest: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if yaml is None:
-        content = fallback_yaml_dump(manifest) + "\n"
-    else:
-        content = yaml.safe_dump(manifest, sort_keys=True, default_flow_style=False)
-    path.write_text(content, encoding="utf-8")
+    if not systems:
+        print("Error: no systems listed in --systems-file.", file=sys.stderr)
+        return 2
+    with timing.phase("resolve"):
+        repo_root = resolve_repo_root(Path.cwd())
+    # Shared setup happens once for the whole batch.
+    dirs = ensure_architecture_dirs(repo_root)
+    index_path = ensure_index(repo_root)
+    doc_templates = load_doc_templates(repo_root)
+    force = bool(args.force)
+    plans = {system: plan_doc_pack(repo_root, system, doc_templates) for system in systems}
+
+    def write(item: tuple[str, Path, str, bool]) -> str:
+        _, path, content, overwrite_allowed = item
+        return ensure_file(path, content, force=force, force_overwrite_allowed=overwrite_allowed)
+
+    def record(system: str) -> Path:
+        baseline_paths = {key: str(path) for key, path, _, _ in plans[system]}
+        inputs = {"system": system, "systems_file": args.systems_file, "interactive": False, "force": force}
+        return record_init(repo_root, system, dirs, index_path, baseline_paths, states[system], inputs)
+
+    states: dict[str, dict[str, list[str]]] = {}
+    errors: dict[str, str] = {}
+    jobs = max(1, args.jobs or min(32, (os.cpu_count() or 1) + 4))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Every system's files go through one pool, then every system's manifest.
+        futures = {
+            system: [pool.submit(write, item) for item in plan] for system, plan in plans.items()
+        }
+        for system, plan in plans.items():
+            states[system] = {"created": [], "exists": [], "overwritten": []}
+            for (_, path, _, _), future in zip(plan, futures[system]):
+                try:
+                    states[system][future.result()].append(str(path))
+                except OSError as exc:
+                    errors[system] = str(exc)
+        recorded = {system: pool.submit(record, system) for system in systems if system not in errors}
+        for system, future in recorded.items():
+            try:
+                future.result()
+            except Exception as exc:
+                errors[system] = str(exc)
+
+    totals = {"created": 0, "exists": 0, "overwritten": 0}
+    for system in systems:
+        if system in errors:
+            print(f"{system}: error ({errors[system]})")
+            continue
+        counts = {state: len(paths) for state, paths in states[system].items()}
+        for state, count in counts.items():
+            totals[state] += count
+        print(
+            f"{system}: created {counts['created']}, existing {counts['exists']}, "
+            f"overwritten {counts['overwritten']}"
+        )
+    print(
+        f"Initialized {len(systems) - len(errors)} of {len(systems)} system(s). "
+        f"Baseline created: {totals['created']}, existing: {totals['exists']}, "
+        f"overwritten: {totals['overwritten']}."
+    )
+    if args.profile:
+        timing.report()
+    return 1 if errors else 0
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -293,6 +317,12 @@ def build_parser() -> argparse.ArgumentParser:
         description="Initialize docs/architecture workflow folders and canonical manifest."
     )
     parser.add_argument("--system", help="System identifier used for manifest naming.")
+    parser.add_argument(
+        "--systems-file",
+        help="Initialize every system listed in this file (one per line, # comments allowed).",
+    )
+    parser.add_argument("--jobs", type=int, help="Worker threads for --systems-file runs.")
+    parser.add_argument("--profile", action="store_true", help="Print a per-phase timing breakdown to stderr.")
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -307,8 +337,23 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> int:
+    forwarded = daemon_client.forward("init", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
     parser = build_parser()
     args = parser.parse_args()
+    timing.begin("init_arch_workflow.py")
+
+    if args.systems_file:
+        if args.system:
+            print("Error: --system cannot be combined with --systems-file.", file=sys.stderr)
+            return 2
+        try:
+            return init_many(args, read_systems_file(Path(args.systems_file)))
+        except RuntimeError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            return 1
 
     if not args.system:
         if args.interactive:
@@ -325,75 +370,32 @@ def main() -> int:
             return 2
 
     try:
-        repo_root = resolve_repo_root(Path.cwd())
+        with timing.phase("resolve"):
+            repo_root = resolve_repo_root(Path.cwd())
         dirs = ensure_architecture_dirs(repo_root)
         index_path = ensure_index(repo_root)
         baseline_paths, baseline_states = baseline_doc_pack(repo_root, args.system, force=bool(args.force))
 
-        manifest_path = resolve_manifest_path(repo_root, args.system)
-        migrated_manifest_from = migrate_legacy_manifest(repo_root, args.system)
-        manifest = normalize_manifest(load_manifest(manifest_path))
-
-        manifest.setdefault("system", args.system)
-        manifest["manifest_path"] = str(manifest_path)
-        manifest["repo_root"] = str(repo_root)
-        manifest["workflow_version"] = WORKFLOW_VERSION
-        manifest["last_updated"] = utc_now()
-
-        manifest["artifacts"].update(
+        manifest_path = record_init(
+            repo_root,
+            args.system,
+            dirs,
+            index_path,
+            baseline_paths,
+            baseline_states,
             {
-                "index": index_path,
-                "decisions_dir": dirs["decisions"],
-                "reviews_dir": dirs["reviews"],
-                "diagrams_dir": dirs["diagrams"],
-                "threat_models_dir": dirs["threat-models"],
-                "runbooks_dir": dirs["runbooks"],
-                "solution_overviews_dir": dirs["solution-overviews"],
-                "manifest_dir": dirs["manifest"],
-            }
-        )
-        manifest["artifacts"]["baseline_doc_pack"] = {
-            "solution_overview": baseline_paths["solution_overview"],
-            "threat_model_lite": baseline_paths["threat_model_lite"],
-            "runbook_baseline": baseline_paths["runbook_baseline"],
-            "diagrams": {
-                "context": baseline_paths["diagram_context"],
-                "containers": baseline_paths["diagram_containers"],
-                "dataflow": baseline_paths["diagram_dataflow"],
-                "network": baseline_paths["diagram_network"],
+                "system": args.system,
+                "interactive": bool(args.interactive),
+                "force": bool(args.force),
             },
-        }
-
-        manifest["actions"].append(
-            {
-                "script": "init_arch_workflow.py",
-                "timestamp": utc_now(),
-                "inputs": {
-                    "system": args.system,
-                    "interactive": bool(args.interactive),
-                    "force": bool(args.force),
-                },
-                "outputs": {
-                    "index_path": index_path,
-                    "manifest_path": str(manifest_path),
-                    "baseline_doc_pack": baseline_paths,
-                    "baseline_created": baseline_states["created"],
-                    "baseline_existing": baseline_states["exists"],
-                    "baseline_overwritten": baseline_states["overwritten"],
-                },
-                "exit_code": 0,
-                "workflow_version": WORKFLOW_VERSION,
-            }
         )
-        if migrated_manifest_from:
-            manifest["actions"][-1]["migrated_manifest_from"] = migrated_manifest_from
-
-        write_manifest(manifest_path, manifest)
         print(f"Initialized architecture workflow for system '{args.system}'.")
         print(f"Manifest: {manifest_path}")
         print(f"Baseline created: {len(baseline_states['created'])}")
         print(f"Baseline existing: {len(baseline_states['exists'])}")
         print(f"Baseline overwritten: {len(baseline_states['overwritten'])}")
+        if args.profile:
+            timing.report()
         return 0
     except RuntimeError as err:
         print(f"Error: {err}", file=sys.stderr)
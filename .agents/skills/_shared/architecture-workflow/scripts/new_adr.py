@@ -2,110 +2,294 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
-import re
-import shutil
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
+from archwf import WORKFLOW_VERSION
+from archwf import arch_index
+from archwf import client as daemon_client
+from archwf import fileio
+from archwf import manifest as manifest_store
+from archwf import timing
+from archwf.clock import iso_date, now_iso, ymd
+from archwf.paths import resolve_manifest_path, resolve_repo_root, slugify
 
-WORKFLOW_VERSION = "1.0.0"
-
-
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def today_ymd() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%d")
-
-
-def is_repo_root(path: Path) -> bool:
-    return (path / ".git").exists() or (path / ".agents" / "skills").exists()
-
-
-def resolve_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while True:
-        if is_repo_root(cur):
-            return cur
-        if cur.parent == cur:
-            raise RuntimeError("Could not resolve REPO_ROOT; .git/ or .agents/skills/ was not found.")
-        cur = cur.parent
-
-
-def resolve_manifest_path(repo_root: Path, system: str) -> Path:
-    return Path(os.path.join(repo_root, f"{system}.yaml"))
-
-
-def migrate_legacy_manifest(repo_root: Path, system: str) -> str | None:
-    manifest_path = resolve_manifest_path(repo_root, system)
-    legacy_manifest_path = repo_root / "docs" / "architecture" / "manifest" / f"{system}.yaml"
-    if legacy_manifest_path.exists() and not manifest_path.exists():
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_manifest_path, manifest_path)
-        return str(legacy_manifest_path)
-    return None
-
-
-def normalize_manifest(m: Any) -> dict[str, Any]:
-    manifest = m if isinstance(m, dict) else {}
-    if not isinstance(manifest.get("adrs"), list):
-        manifest["adrs"] = []
-    if not isinstance(manifest.get("wa_reviews"), list):
-        manifest["wa_reviews"] = []
-    if not isinstance(manifest.get("validations"), list):
-        manifest["validations"] = []
-    if not isinstance(manifest.get("decision_traces"), list):
-        manifest["decision_traces"] = []
-    if not isinstance(manifest.get("actions"), list):
-        manifest["actions"] = []
-    if not isinstance(manifest.get("artifacts"), dict):
-        manifest["artifacts"] = {}
-    return manifest
-
-
-def slugify(value: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9]+", "-", value.strip().lower()).strip("-") or "decision"
+REQUIRED = ["system", "title", "category", "status", "owners", "tags"]
+ADR_FIELDS = {*REQUIRED, "slug", "date", "supersedes", "superseded_by", "template"}
 
 
 def parse_csv(value: str) -> list[str]:
     return [x.strip() for x in value.split(",") if x.strip()]
 
 
-def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return data if isinstance(data, dict) else {}
+def as_list(value: Any) -> list[str]:
+    if isinstance(value, list):
+        return [str(x).strip() for x in value if str(x).strip()]
+    return parse_csv(str(value or ""))
+
+
+def render_adr(repo_root: Path, decisions_dir: Path, fields: dict[str, Any]) -> dict[str, Any]:
+    """Render one ADR from CLI or batch-row fields without touching the filesystem."""
+    missing = [name for name in REQUIRED if not fields.get(name)]
+    if missing:
+        raise RuntimeError("missing required fields: " + ", ".join(missing))
+    template_name = fields.get("template") or "full"
+    if template_name not in {"short", "full"}:
+        raise RuntimeError(f"invalid template {template_name!r}; expected 'short' or 'full'.")
+    template_path = (
+        repo_root
+        / ".agents"
+        / "skills"
+        / "_shared"
+        / "architecture-workflow"
+        / "templates"
+        / f"adr-{template_name}.md"
+    )
+    if not template_path.exists():
+        raise RuntimeError(f"Template file not found: {template_path}")
+
+    title = str(fields["title"])
+    adr_slug = str(fields.get("slug") or slugify(title, "decision"))
+    decision_id = adr_slug
+    date_display = str(fields.get("date") or iso_date())
+    adr_name = f"ADR-{ymd()}-{adr_slug}.md"
+
+    owners = as_list(fields["owners"])
+    tags = as_list(fields["tags"])
+    if not owners:
+        raise RuntimeError("No owners provided after parsing --owners.")
+    if not tags:
+        raise RuntimeError("No tags provided after parsing --tags.")
+
+    replacements = {
+        "decision_id": decision_id,
+        "system": str(fields["system"]),
+        "category": str(fields["category"]),
+        "status": str(fields["status"]),
+        "owner": owners,
+        "date": date_display,
+        "tag": tags,
+        "title": title,
+        "context": "Describe business and technical context.",
+        "decision": "Describe the selected decision clearly.",
+        "alternative_1": "Alternative 1",
+        "alternative_2": "Alternative 2",
+        "consequence_1": "Consequence 1",
+        "consequence_2": "Consequence 2",
+        "security_notes": "Security/compliance implications.",
+        "cost_notes": "Cost implications.",
+        "operational_notes": "Operational implications.",
+        "reference_1": "Reference 1",
+        "reference_2": "Reference 2",
+        "problem_statement": "Problem statement.",
+        "background": "Background.",
+        "constraint_1": "Constraint 1",
+        "constraint_2": "Constraint 2",
+        "selected_option": "Selected option.",
+        "rationale_1": "Rationale 1",
+        "rationale_2": "Rationale 2",
+        "option_a": "Option A",
+        "option_b": "Option B",
+        "positive_1": "Positive impact 1",
+        "positive_2": "Positive impact 2",
+        "negative_1": "Negative impact 1",
+        "negative_2": "Negative impact 2",
+        "supersedes": str(fields.get("supersedes") or ""),
+        "superseded_by": str(fields.get("superseded_by") or ""),
+    }
+    from archwf import templates
+
+    # List values expand to one line per owner/tag where the placeholder stands alone.
+    with timing.phase("render"):
+        rendered = templates.load(template_path).render(replacements)
+    return {
+        "system": str(fields["system"]),
+        "name": adr_name,
+        "path": decisions_dir / adr_name,
+        "text": rendered.text,
+        "unknown": rendered.unknown,
+        "template": template_path.name,
+        "entry": {
+            "decision_id": decision_id,
+            "slug": adr_slug,
+            "category": str(fields["category"]),
+            "status": str(fields["status"]),
+            "owners": owners,
+            "date": date_display,
+        },
+    }
+
+
+def warn_unknown(adr: dict[str, Any]) -> None:
+    if adr["unknown"]:
+        print(
+            f"Warning: {adr['template']} has placeholders without values: "
+            + ", ".join("{{" + key + "}}" for key in adr["unknown"]),
+            file=sys.stderr,
+        )
 
 
-def save_manifest(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=True, default_flow_style=False),
-        encoding="utf-8",
+def update_index(index_path: Path, adr_names: list[str]) -> None:
+    with timing.phase("write"):
+        arch_index.update(index_path.parent, [arch_index.adr_line(name) for name in adr_names])
+
+
+def record_adrs(
+    repo_root: Path,
+    system: str,
+    adrs: list[dict[str, Any]],
+    *,
+    inputs: dict[str, Any],
+    outputs: dict[str, Any],
+    migrated_manifest_from: str | None,
+) -> None:
+    manifest = manifest_store.load(resolve_manifest_path(repo_root, system))
+    manifest.stamp(repo_root, system)
+    for adr in adrs:
+        manifest["adrs"].append({**adr["entry"], "path": manifest.portable(str(adr["path"]))})
+    manifest.record_action(
+        {
+            "script": "new_adr.py",
+            "timestamp": now_iso(),
+            "inputs": inputs,
+            "outputs": outputs,
+            "exit_code": 0,
+            "workflow_version": WORKFLOW_VERSION,
+        }
     )
+    if migrated_manifest_from:
+        manifest.actions[-1]["migrated_manifest_from"] = manifest.portable(migrated_manifest_from)
+    manifest.save()
 
 
-def ensure_common_manifest_keys(m: dict[str, Any], repo_root: Path, manifest_path: Path, system: str) -> None:
-    m.setdefault("system", system)
-    m["manifest_path"] = str(manifest_path)
-    m["repo_root"] = str(repo_root)
-    m["workflow_version"] = WORKFLOW_VERSION
-    m["last_updated"] = now_iso()
-    m.setdefault("artifacts", {})
-    m.setdefault("adrs", [])
-    m.setdefault("wa_reviews", [])
-    m.setdefault("validations", [])
-    m.setdefault("decision_traces", [])
-    m.setdefault("actions", [])
+def read_batch(path: Path) -> list[tuple[int, dict[str, Any] | str]]:
+    """Return ``(row_number, fields_or_error)`` for every row of a .jsonl or .csv batch."""
+    if not path.exists():
+        raise RuntimeError(f"Batch file not found: {path}")
+    timing.count_file(path)
+    rows: list[tuple[int, dict[str, Any] | str]] = []
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        with path.open(encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    rows.append((lineno, f"invalid JSON: {exc}"))
+                    continue
+                rows.append((lineno, row if isinstance(row, dict) else "expected a JSON object"))
+    elif suffix == ".csv":
+        import csv
+
+        with path.open(encoding="utf-8", newline="") as fh:
+            # Row numbers count the header line, matching what editors show.
+            for lineno, row in enumerate(csv.DictReader(fh), start=2):
+                rows.append((lineno, {k: v for k, v in row.items() if k is not None}))
+    else:
+        raise RuntimeError(f"Unsupported batch file type '{path.suffix}'; use .jsonl or .csv.")
+    return rows
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with timing.phase("resolve"):
+        repo_root = resolve_repo_root(Path.cwd())
+    decisions_dir = repo_root / "docs" / "architecture" / "decisions"
+    index_path = repo_root / "docs" / "architecture" / "index.md"
+    batch_path = Path(args.batch)
+
+    # CLI values act as defaults for columns a row leaves empty.
+    defaults = {
+        name: getattr(args, name)
+        for name in ADR_FIELDS
+        if getattr(args, name, None) not in (None, "")
+    }
+    errors: list[str] = []
+    planned: list[dict[str, Any]] = []
+    seen: dict[str, int] = {}
+    with timing.phase("parse"):
+        rows = read_batch(batch_path)
+    for lineno, row in rows:
+        if isinstance(row, str):
+            errors.append(f"row {lineno}: {row}")
+            continue
+        fields = {str(k).strip().replace("-", "_"): v for k, v in row.items()}
+        unknown = sorted(set(fields) - ADR_FIELDS)
+        if unknown:
+            errors.append(f"row {lineno}: unknown field(s): {', '.join(unknown)}")
+            continue
+        fields = {**defaults, **{k: v for k, v in fields.items() if v not in (None, "", [])}}
+        try:
+            adr = render_adr(repo_root, decisions_dir, fields)
+        except RuntimeError as exc:
+            errors.append(f"row {lineno}: {exc}")
+            continue
+        if adr["name"] in seen:
+            errors.append(f"row {lineno}: duplicate ADR {adr['name']} (first seen in row {seen[adr['name']]})")
+            continue
+        seen[adr["name"]] = lineno
+        adr["row"] = lineno
+        warn_unknown(adr)
+        planned.append(adr)
+
+    def write(adr: dict[str, Any]) -> str | None:
+        try:
+            with timing.phase("write"):
+                fileio.write_text(adr["path"], adr["text"])
+        except OSError as exc:
+            return f"row {adr['row']}: {exc}"
+        return None
+
+    decisions_dir.mkdir(parents=True, exist_ok=True)
+    written: list[dict[str, Any]] = []
+    if planned:
+        with ThreadPoolExecutor(max_workers=args.jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            for adr, error in zip(planned, pool.map(write, planned)):
+                if error:
+                    errors.append(error)
+                else:
+                    written.append(adr)
+
+    if written:
+        update_index(index_path, [adr["name"] for adr in written])
+        by_system: dict[str, list[dict[str, Any]]] = {}
+        for adr in written:
+            by_system.setdefault(adr["system"], []).append(adr)
+        for system, adrs in sorted(by_system.items()):
+            migrated_manifest_from = manifest_store.migrate_legacy(repo_root, system)
+            record_adrs(
+                repo_root,
+                system,
+                adrs,
+                inputs={"batch": str(batch_path), "rows": len(adrs), "defaults": defaults},
+                outputs={"adr_paths": [str(adr["path"]) for adr in adrs], "index_path": str(index_path)},
+                migrated_manifest_from=migrated_manifest_from,
+            )
+
+    for adr in written:
+        print(str(adr["path"]))
+    for error in errors:
+        print(f"Error: {error}", file=sys.stderr)
+    print(
+        f"Created {len(written)} ADR(s) from {batch_path}; {len(errors)} row(s) failed.",
+        file=sys.stderr,
+    )
+    if args.profile:
+        timing.report()
+    return 1 if errors else 0
 
 
 def main() -> int:
+    forwarded = daemon_client.forward("new_adr", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
     parser = argparse.ArgumentParser(description="Create ADR and update docs/architecture manifest.")
     parser.add_argument("--system")
     parser.add_argument("--title")
@@ -118,11 +302,24 @@ def main() -> int:
     parser.add_argument("--supersedes", default="")
     parser.add_argument("--superseded-by", default="")
     parser.add_argument("--template", choices=["short", "full"], default="full")
+    parser.add_argument(
+        "--batch",
+        help="Create one ADR per row of a .jsonl or .csv file; other flags become per-row defaults.",
+    )
+    parser.add_argument("--jobs", type=int, help="Parallel ADR writers for --batch.")
     parser.add_argument("--interactive", action="store_true")
+    parser.add_argument("--profile", action="store_true", help="Print a per-phase timing breakdown to stderr.")
     args = parser.parse_args()
+    timing.begin("new_adr.py")
 
-    required = ["system", "title", "category", "status", "owners", "tags"]
-    missing = [name for name in required if not getattr(args, name)]
+    if args.batch:
+        try:
+            return run_batch(args)
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+
+    missing = [name for name in REQUIRED if not getattr(args, name)]
 
     if missing and not args.interactive:
         print(
@@ -140,140 +337,36 @@ def main() -> int:
                 setattr(args, key, input(f"{key}: ").strip())
             except EOFError:
                 setattr(args, key, "")
-        remaining = [name for name in required if not getattr(args, name)]
+        remaining = [name for name in REQUIRED if not getattr(args, name)]
         if remaining:
             print("Error: required values still missing after interactive prompts.", file=sys.stderr)
             return 2
 
     try:
-        repo_root = resolve_repo_root(Path.cwd())
-        manifest_path = resolve_manifest_path(repo_root, args.system)
-        migrated_manifest_from = migrate_legacy_manifest(repo_root, args.system)
+        with timing.phase("resolve"):
+            repo_root = resolve_repo_root(Path.cwd())
+        migrated_manifest_from = manifest_store.migrate_legacy(repo_root, args.system)
         decisions_dir = repo_root / "docs" / "architecture" / "decisions"
         index_path = repo_root / "docs" / "architecture" / "index.md"
-        template_path = (
-            repo_root
-            / ".agents"
-            / "skills"
-            / "_shared"
-            / "architecture-workflow"
-            / "templates"
-            / f"adr-{args.template}.md"
-        )
-
-        if not template_path.exists():
-            raise RuntimeError(f"Template file not found: {template_path}")
-
-        decisions_dir.mkdir(parents=True, exist_ok=True)
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-
-        adr_slug = args.slug or slugify(args.title)
-        decision_id = adr_slug
-        date_display = args.date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        adr_name = f"ADR-{today_ymd()}-{adr_slug}.md"
-        adr_path = decisions_dir / adr_name
-
-        owners = parse_csv(args.owners)
-        tags = parse_csv(args.tags)
-        if not owners:
-            raise RuntimeError("No owners provided after parsing --owners.")
-        if not tags:
-            raise RuntimeError("No tags provided after parsing --tags.")
-
-        template = template_path.read_text(encoding="utf-8")
-        replacements = {
-            "{{decision_id}}": decision_id,
-            "{{system}}": args.system,
-            "{{category}}": args.category,
-            "{{status}}": args.status,
-            "{{owner}}": owners[0],
-            "{{date}}": date_display,
-            "{{tag}}": tags[0],
-            "{{title}}": args.title,
-            "{{context}}": "Describe business and technical context.",
-            "{{decision}}": "Describe the selected decision clearly.",
-            "{{alternative_1}}": "Alternative 1",
-            "{{alternative_2}}": "Alternative 2",
-            "{{consequence_1}}": "Consequence 1",
-            "{{consequence_2}}": "Consequence 2",
-            "{{security_notes}}": "Security/compliance implications.",
-            "{{cost_notes}}": "Cost implications.",
-            "{{operational_notes}}": "Operational implications.",
-            "{{reference_1}}": "Reference 1",
-            "{{reference_2}}": "Reference 2",
-            "{{problem_statement}}": "Problem statement.",
-            "{{background}}": "Background.",
-            "{{constraint_1}}": "Constraint 1",
-            "{{constraint_2}}": "Constraint 2",
-            "{{selected_option}}": "Selected option.",
-            "{{rationale_1}}": "Rationale 1",
-            "{{rationale_2}}": "Rationale 2",
-            "{{option_a}}": "Option A",
-            "{{option_b}}": "Option B",
-            "{{positive_1}}": "Positive impact 1",
-            "{{positive_2}}": "Positive impact 2",
-            "{{negative_1}}": "Negative impact 1",
-            "{{negative_2}}": "Negative impact 2",
-        }
-        for key, value in replacements.items():
-            template = template.replace(key, value)
-
-        template = template.replace('supersedes: ""', f'supersedes: "{args.supersedes}"')
-        template = template.replace('superseded_by: ""', f'superseded_by: "{args.superseded_by}"')
-
-        # Replace single-item placeholders with full lists.
-        template = re.sub(
-            r"owners:\n\s+-\s+\".*?\"",
-            "owners:\n" + "\n".join(f'  - "{o}"' for o in owners),
-            template,
-            count=1,
-        )
-        template = re.sub(
-            r"tags:\n\s+-\s+\".*?\"",
-            "tags:\n" + "\n".join(f'  - "{t}"' for t in tags),
-            template,
-            count=1,
-        )
 
-        adr_path.write_text(template, encoding="utf-8")
-
-        if not index_path.exists():
-            index_path.write_text("# Architecture Index\n\n", encoding="utf-8")
-        idx = index_path.read_text(encoding="utf-8")
-        idx_line = f"- ADR: `docs/architecture/decisions/{adr_name}`\n"
-        if idx_line not in idx:
-            idx += idx_line
-            index_path.write_text(idx, encoding="utf-8")
-
-        manifest = normalize_manifest(load_manifest(manifest_path))
-        ensure_common_manifest_keys(manifest, repo_root, manifest_path, args.system)
-        manifest["adrs"].append(
-            {
-                "decision_id": decision_id,
-                "slug": adr_slug,
-                "category": args.category,
-                "status": args.status,
-                "owners": owners,
-                "date": date_display,
-                "path": str(adr_path),
-            }
-        )
-        manifest["actions"].append(
-            {
-                "script": "new_adr.py",
-                "timestamp": now_iso(),
-                "inputs": vars(args),
-                "outputs": {"adr_path": str(adr_path), "index_path": str(index_path)},
-                "exit_code": 0,
-                "workflow_version": WORKFLOW_VERSION,
-            }
+        adr = render_adr(repo_root, decisions_dir, vars(args))
+        warn_unknown(adr)
+        with timing.phase("write"):
+            decisions_dir.mkdir(parents=True, exist_ok=True)
+            fileio.write_text(adr["path"], adr["text"])
+        update_index(index_path, [adr["name"]])
+        record_adrs(
+            repo_root,
+            args.system,
+            [adr],
+            inputs=vars(args),
+            outputs={"adr_path": str(adr["path"]), "index_path": str(index_path)},
+            migrated_manifest_from=migrated_manifest_from,
         )
-        if migrated_manifest_from:
-            manifest["actions"][-1]["migrated_manifest_from"] = migrated_manifest_from
-        save_manifest(manifest_path, manifest)
 
-        print(str(adr_path))
+        print(str(adr["path"]))
+        if args.profile:
+            timing.report()
         return 0
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
@@ -2,215 +2,56 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
-import shutil
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml  # type: ignore
-except Exception:
-    yaml = None
-
-WORKFLOW_VERSION = "1.0.0"
-PILLARS = [
-    "Operational Excellence",
-    "Security",
-    "Reliability",
-    "Performance Efficiency",
-    "Cost Optimization",
-    "Sustainability",
-]
-MAJOR_DECISION_RE = re.compile(r"^MAJOR_DECISION:\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(.+?)\s*$")
-
-
-def fallback_yaml_dump(data: Any, indent: int = 0) -> str:
-    pad = " " * indent
-    if isinstance(data, dict):
-        lines: list[str] = []
-        for key in sorted(data.keys()):
-            value = data[key]
-            if isinstance(value, (dict, list)):
-                lines.append(f"{pad}{key}:")
-                lines.append(fallback_yaml_dump(value, indent + 2))
-            else:
-                if value is None:
-                    rendered = "null"
-                elif isinstance(value, bool):
-                    rendered = "true" if value else "false"
-                elif isinstance(value, (int, float)):
-                    rendered = str(value)
-                else:
-                    text = str(value).replace('"', '\\"')
-                    rendered = f"\"{text}\""
-                lines.append(f"{pad}{key}: {rendered}")
-        return "\n".join(lines)
-    if isinstance(data, list):
-        lines = []
-        for item in data:
-            if isinstance(item, (dict, list)):
-                lines.append(f"{pad}-")
-                lines.append(fallback_yaml_dump(item, indent + 2))
-            else:
-                if item is None:
-                    rendered = "null"
-                elif isinstance(item, bool):
-                    rendered = "true" if item else "false"
-                elif isinstance(item, (int, float)):
-                    rendered = str(item)
-                else:
-                    text = str(item).replace('"', '\\"')
-                    rendered = f"\"{text}\""
-                lines.append(f"{pad}- {rendered}")
-        return "\n".join(lines)
-    if data is None:
-        return f"{pad}null"
-    if isinstance(data, bool):
-        return f"{pad}{'true' if data else 'false'}"
-    if isinstance(data, (int, float)):
-        return f"{pad}{data}"
-    text = str(data).replace('"', '\\"')
-    return f"{pad}\"{text}\""
-
-
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def is_repo_root(path: Path) -> bool:
-    return (path / ".git").exists() or (path / ".agents" / "skills").exists()
-
-
-def resolve_repo_root(start: Path) -> Path:
-    cur = start.resolve()
-    while True:
-        if is_repo_root(cur):
-            return cur
-        if cur.parent == cur:
-            raise RuntimeError("Could not resolve REPO_ROOT; .git/ or .agents/skills/ was not found.")
-        cur = cur.parent
-
-
-def resolve_manifest_path(repo_root: Path, system: str) -> Path:
-    return Path(os.path.join(repo_root, f"{system}.yaml"))
-
-
-def migrate_legacy_manifest(repo_root: Path, system: str) -> str | None:
-    manifest_path = resolve_manifest_path(repo_root, system)
-    legacy_manifest_path = repo_root / "docs" / "architecture" / "manifest" / f"{system}.yaml"
-    if legacy_manifest_path.exists() and not manifest_path.exists():
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_manifest_path, manifest_path)
-        return str(legacy_manifest_path)
-    return None
-
-
-def normalize_manifest(m: Any) -> dict[str, Any]:
-    manifest = m if isinstance(m, dict) else {}
-    if not isinstance(manifest.get("adrs"), list):
-        manifest["adrs"] = []
-    if not isinstance(manifest.get("wa_reviews"), list):
-        manifest["wa_reviews"] = []
-    if not isinstance(manifest.get("validations"), list):
-        manifest["validations"] = []
-    if not isinstance(manifest.get("decision_traces"), list):
-        manifest["decision_traces"] = []
-    if not isinstance(manifest.get("actions"), list):
-        manifest["actions"] = []
-    if not isinstance(manifest.get("artifacts"), dict):
-        manifest["artifacts"] = {}
-    return manifest
-
-
-def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    text = path.read_text(encoding="utf-8")
-    if yaml is None:
-        return {}
-    try:
-        data = yaml.safe_load(text)
-    except Exception:
-        return {}
-    return data if isinstance(data, dict) else {}
-
+from archwf import WORKFLOW_VERSION
+from archwf import adr_index as adr_cache
+from archwf import client as daemon_client
+from archwf import fileio
+from archwf import manifest as manifest_store
+from archwf import markers as decision_markers
+from archwf import review_index
+from archwf import timing
+from archwf import wa_parser
+from archwf.clock import now_iso
+from archwf.paths import latest_file, resolve_manifest_path, resolve_repo_root
 
-def save_manifest(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if yaml is None:
-        content = fallback_yaml_dump(data) + "\n"
-    else:
-        content = yaml.safe_dump(data, sort_keys=True, default_flow_style=False)
-    path.write_text(content, encoding="utf-8")
+PILLARS = wa_parser.PILLARS
+MAJOR_DECISION_RE = decision_markers.MAJOR_DECISION_RE
 
 
-def ensure_common_manifest_keys(m: dict[str, Any], repo_root: Path, manifest_path: Path, system: str) -> None:
-    m.setdefault("system", system)
-    m["manifest_path"] = str(manifest_path)
-    m["repo_root"] = str(repo_root)
-    m["workflow_version"] = WORKFLOW_VERSION
-    m["last_updated"] = now_iso()
-    m.setdefault("artifacts", {})
-    m.setdefault("adrs", [])
-    m.setdefault("wa_reviews", [])
-    m.setdefault("validations", [])
-    m.setdefault("decision_traces", [])
-    m.setdefault("actions", [])
+def latest_wa_review(arch_root: Path, system: str, index: dict[str, Any] | None = None) -> Path | None:
+    with timing.phase("scan"):
+        found = review_index.latest_review(arch_root, system, "wa_review", index)
+        if found is None:
+            found = latest_file(arch_root / "reviews", f"WA-REVIEW-*-*{system}*.md")
+    return found
 
 
-def latest_file(path: Path, pattern: str) -> Path | None:
-    files = sorted(path.glob(pattern), key=lambda p: p.stat().st_mtime)
-    return files[-1] if files else None
+def parse_scores(wa_path: Path) -> tuple[dict[str, str], list[str]]:
+    with timing.phase("parse"), wa_path.open(encoding="utf-8") as fh:
+        timing.count_file(wa_path)
+        return wa_parser.parse_scores(fh)
 
 
-def parse_scores(wa_text: str) -> tuple[dict[str, str], list[str]]:
+def parse_major_decisions(*paths: Path) -> tuple[list[decision_markers.Marker], list[str]]:
+    markers: list[decision_markers.Marker] = []
     issues: list[str] = []
-    scores: dict[str, str] = {}
-    for pillar in PILLARS:
-        section = re.search(rf"^##\s+{re.escape(pillar)}\s*$", wa_text, re.M)
-        if not section:
-            issues.append(f"Missing WA pillar section: {pillar}")
-            continue
-        following = wa_text[section.end() :]
-        next_section = re.search(r"^##\s+", following, re.M)
-        chunk = following[: next_section.start()] if next_section else following
-        score_match = re.search(r"^Score:\s*(Pass|Needs Work|Fail)\s*$", chunk, re.M)
-        if not score_match:
-            issues.append(f"Missing score for pillar: {pillar}")
-            continue
-        scores[pillar] = score_match.group(1)
-    return scores, issues
-
-
-def parse_major_decisions(*texts: str) -> tuple[list[tuple[str, str, str]], list[str]]:
-    markers: list[tuple[str, str, str]] = []
-    issues: list[str] = []
-    for text in texts:
-        for line in text.splitlines():
-            line = line.strip()
-            if not line.startswith("MAJOR_DECISION:"):
-                continue
-            m = MAJOR_DECISION_RE.match(line)
-            if not m:
-                issues.append(f"Invalid MAJOR_DECISION grammar: {line}")
-                continue
-            markers.append((m.group(1).strip(), m.group(2).strip(), m.group(3).strip()))
+    with timing.phase("parse"):
+        for path in paths:
+            markers.extend(decision_markers.iter_markers(path, issues))
     return markers, issues
 
 
 def adr_keys(decisions_dir: Path) -> set[str]:
-    keys: set[str] = set()
-    for adr in decisions_dir.glob("ADR-*.md"):
-        slug = adr.stem.split("-", 2)[-1]
-        keys.add(slug)
-        text = adr.read_text(encoding="utf-8")
-        m = re.search(r"^decision_id:\s*\"?([^\n\"]+)\"?\s*$", text, re.M)
-        if m:
-            keys.add(m.group(1).strip())
-    return keys
+    with timing.phase("scan"):
+        return adr_cache.adr_keys(decisions_dir)
 
 
 def required_baseline_paths(arch_root: Path, system: str) -> dict[str, Path]:
@@ -225,87 +66,157 @@ def required_baseline_paths(arch_root: Path, system: str) -> dict[str, Path]:
     }
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Validate architecture artifacts and WA gating.")
-    parser.add_argument("--system")
-    parser.add_argument("--max-needs-work", type=int, default=2)
-    parser.add_argument("--allow-fail-pillars", action="store_true")
-    parser.add_argument("--interactive", action="store_true")
-    args = parser.parse_args()
+def discover_systems(repo_root: Path) -> tuple[list[str], list[str]]:
+    """Systems with a canonical manifest, and those with only a legacy one.
 
-    if not args.system:
-        if args.interactive:
+    Legacy manifests are reported rather than validated, because validating
+    would migrate (write) them.
+    """
+    with timing.phase("scan"):
+        systems = set()
+        for path in repo_root.glob("*.yaml"):
             try:
-                args.system = input("system: ").strip()
-            except EOFError:
-                args.system = ""
-        if not args.system:
-            print("Error: missing --system. Use --interactive for prompt mode.", file=sys.stderr)
-            parser.print_usage(sys.stderr)
-            return 2
-
-    exit_code = 0
+                text = fileio.read_text(path)
+            except OSError:
+                continue
+            if re.search(r"^workflow_version:", text, re.M):
+                systems.add(path.stem)
+        legacy = {p.stem for p in (repo_root / "docs" / "architecture" / "manifest").glob("*.yaml")} - systems
+    return sorted(systems), sorted(legacy)
+
+
+def validate_system(
+    arch_root: Path,
+    system: str,
+    keys: set[str],
+    wa: Path | None,
+    *,
+    max_needs_work: int,
+    allow_fail_pillars: bool,
+) -> tuple[list[str], dict[str, Path]]:
     issues: list[str] = []
+    baseline = required_baseline_paths(arch_root, system)
+    for label, path in baseline.items():
+        if not path.exists():
+            issues.append(
+                f"Missing required baseline artifact ({label}): {path}. "
+                "Run init_arch_workflow.py --system <system> to create it."
+            )
 
-    try:
-        repo_root = resolve_repo_root(Path.cwd())
-        arch_root = repo_root / "docs" / "architecture"
-        reviews_dir = arch_root / "reviews"
-        decisions_dir = arch_root / "decisions"
-        manifest_path = resolve_manifest_path(repo_root, args.system)
-        migrated_manifest_from = migrate_legacy_manifest(repo_root, args.system)
-
-        baseline = required_baseline_paths(arch_root, args.system)
-        for label, path in baseline.items():
-            if not path.exists():
-                issues.append(
-                    f"Missing required baseline artifact ({label}): {path}. "
-                    "Run init_arch_workflow.py --system <system> to create it."
-                )
-
-        overview = baseline["solution_overview"]
-        if not overview.exists():
-            overview_text = ""
-        else:
-            overview_text = overview.read_text(encoding="utf-8")
+    marker_sources = [baseline["solution_overview"]] if baseline["solution_overview"].exists() else []
+    if not wa:
+        issues.append(f"Missing WA review for system '{system}' in {arch_root / 'reviews'}")
+        scores = {}
+    else:
+        scores, score_issues = parse_scores(wa)
+        issues.extend(score_issues)
+        marker_sources.append(wa)
+
+    fail_count = sum(1 for v in scores.values() if v == "Fail")
+    nw_count = sum(1 for v in scores.values() if v == "Needs Work")
+    if fail_count > 0 and not allow_fail_pillars:
+        issues.append("Gate failure: at least one pillar is Fail. Use --allow-fail-pillars to override.")
+    if nw_count > max_needs_work:
+        issues.append(
+            f"Gate failure: Needs Work count ({nw_count}) exceeds max ({max_needs_work})."
+        )
 
-        wa = latest_file(reviews_dir, f"WA-REVIEW-*-*{args.system}*.md")
-        if not wa:
-            issues.append(f"Missing WA review for system '{args.system}' in {reviews_dir}")
-            wa_text = ""
-            scores = {}
-        else:
-            wa_text = wa.read_text(encoding="utf-8")
-            scores, score_issues = parse_scores(wa_text)
-            issues.extend(score_issues)
-
-        fail_count = sum(1 for v in scores.values() if v == "Fail")
-        nw_count = sum(1 for v in scores.values() if v == "Needs Work")
-        if fail_count > 0 and not args.allow_fail_pillars:
-            issues.append("Gate failure: at least one pillar is Fail. Use --allow-fail-pillars to override.")
-        if nw_count > args.max_needs_work:
+    markers, marker_issues = parse_major_decisions(*marker_sources)
+    issues.extend(marker_issues)
+
+    for marker in markers:
+        if marker.key not in keys:
             issues.append(
-                f"Gate failure: Needs Work count ({nw_count}) exceeds max ({args.max_needs_work})."
+                f"Missing ADR mapping for MAJOR_DECISION key '{marker.key}' "
+                f"({marker.category} | {marker.summary}) at {marker.path}:{marker.line}."
             )
+    return issues, baseline
+
+
+def file_digest(path: Path | None) -> str | None:
+    if path is None or not path.is_file():
+        return None
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+            timing.count_read(len(chunk))
+    return digest.hexdigest()
+
+
+def compute_fingerprint(
+    baseline: dict[str, Path],
+    wa: Path | None,
+    keys: set[str],
+    *,
+    max_needs_work: int,
+    allow_fail_pillars: bool,
+) -> dict[str, Any]:
+    return {
+        "workflow_version": WORKFLOW_VERSION,
+        "baseline": {label: file_digest(path) for label, path in sorted(baseline.items())},
+        "wa_review": {"path": wa.name if wa else None, "sha256": file_digest(wa)},
+        "adr_keys": hashlib.sha256("\n".join(sorted(keys)).encode("utf-8")).hexdigest(),
+        "gate": {
+            "allow_fail_pillars": bool(allow_fail_pillars),
+            "max_needs_work": int(max_needs_work),
+        },
+    }
 
-        markers, marker_issues = parse_major_decisions(overview_text, wa_text)
-        issues.extend(marker_issues)
 
-        keys = adr_keys(decisions_dir)
-        for category, key, summary in markers:
-            if key not in keys:
-                issues.append(
-                    f"Missing ADR mapping for MAJOR_DECISION key '{key}' ({category} | {summary})."
-                )
+def cached_validation(manifest: dict[str, Any], fingerprint: dict[str, Any]) -> dict[str, Any] | None:
+    if not manifest["validations"]:
+        return None
+    last = manifest["validations"][-1]
+    if isinstance(last, dict) and last.get("result") == "pass" and last.get("fingerprint") == fingerprint:
+        return last
+    return None
 
-        result = "pass" if not issues else "fail"
-        if issues:
-            exit_code = 1
 
-        manifest = normalize_manifest(load_manifest(manifest_path))
-        ensure_common_manifest_keys(manifest, repo_root, manifest_path, args.system)
-        manifest["artifacts"].setdefault("baseline_doc_pack", {})
-        manifest["artifacts"]["baseline_doc_pack"].update(
+def check_system(
+    repo_root: Path,
+    system: str,
+    keys: set[str],
+    wa: Path | None,
+    *,
+    inputs: dict[str, Any],
+    max_needs_work: int,
+    allow_fail_pillars: bool,
+    incremental: bool,
+) -> tuple[list[str], str | None]:
+    arch_root = repo_root / "docs" / "architecture"
+    migrated_manifest_from = manifest_store.migrate_legacy(repo_root, system)
+    baseline = required_baseline_paths(arch_root, system)
+    with timing.phase("scan"):
+        fingerprint = compute_fingerprint(
+            baseline,
+            wa,
+            keys,
+            max_needs_work=max_needs_work,
+            allow_fail_pillars=allow_fail_pillars,
+        )
+    manifest_path = resolve_manifest_path(repo_root, system)
+    manifest = manifest_store.load(manifest_path)
+
+    cached = cached_validation(manifest, fingerprint) if incremental else None
+    if cached is None:
+        issues, _ = validate_system(
+            arch_root,
+            system,
+            keys,
+            wa,
+            max_needs_work=max_needs_work,
+            allow_fail_pillars=allow_fail_pillars,
+        )
+    else:
+        issues = []
+    result = "pass" if not issues else "fail"
+    exit_code = 1 if issues else 0
+
+    manifest.stamp(repo_root, system)
+    manifest["artifacts"].setdefault("baseline_doc_pack", {})
+    manifest["artifacts"]["baseline_doc_pack"].update(
+        manifest.portable(
             {
                 "solution_overview": str(baseline["solution_overview"]),
                 "threat_model_lite": str(baseline["threat_model_lite"]),
@@ -318,39 +229,221 @@ def main() -> int:
                 },
             }
         )
+    )
+    if cached is None:
         manifest["validations"].append(
             {
                 "timestamp": now_iso(),
                 "result": result,
                 "issues": issues,
                 "gate": {
-                    "allow_fail_pillars": bool(args.allow_fail_pillars),
-                    "max_needs_work": int(args.max_needs_work),
+                    "allow_fail_pillars": bool(allow_fail_pillars),
+                    "max_needs_work": int(max_needs_work),
                 },
+                "fingerprint": fingerprint,
             }
         )
-        manifest["actions"].append(
-            {
-                "script": "validate_archifacts.py",
-                "timestamp": now_iso(),
-                "inputs": vars(args),
-                "outputs": {"result": result, "issues_count": len(issues)},
-                "exit_code": exit_code,
-                "workflow_version": WORKFLOW_VERSION,
-            }
+    outputs: dict[str, Any] = {"result": result, "issues_count": len(issues)}
+    if cached is not None:
+        outputs["cached_from"] = cached.get("timestamp")
+    manifest.record_action(
+        {
+            "script": "validate_archifacts.py",
+            "timestamp": now_iso(),
+            "inputs": inputs,
+            "outputs": outputs,
+            "exit_code": exit_code,
+            "workflow_version": WORKFLOW_VERSION,
+        }
+    )
+    if migrated_manifest_from:
+        manifest.actions[-1]["migrated_manifest_from"] = manifest.portable(migrated_manifest_from)
+    manifest.save()
+    return issues, outputs.get("cached_from")
+
+
+def run_system(
+    repo_root: Path,
+    system: str,
+    keys: set[str],
+    index: dict[str, Any],
+    max_needs_work: int,
+    allow_fail_pillars: bool,
+    incremental: bool,
+    inputs: dict[str, Any],
+) -> tuple[str, str, list[str], str | None]:
+    try:
+        issues, cached_from = check_system(
+            repo_root,
+            system,
+            keys,
+            latest_wa_review(repo_root / "docs" / "architecture", system, index),
+            inputs=inputs,
+            max_needs_work=max_needs_work,
+            allow_fail_pillars=allow_fail_pillars,
+            incremental=incremental,
         )
-        if migrated_manifest_from:
-            manifest["actions"][-1]["migrated_manifest_from"] = migrated_manifest_from
-        save_manifest(manifest_path, manifest)
+        return system, "pass" if not issues else "fail", issues, cached_from
+    except Exception as exc:
+        return system, "error", [str(exc)], None
+
+
+def validate_many(args: argparse.Namespace, systems: list[str]) -> int:
+    from concurrent.futures import ProcessPoolExecutor
+
+    with timing.phase("resolve"):
+        repo_root = resolve_repo_root(Path.cwd())
+    arch_root = repo_root / "docs" / "architecture"
+    if not systems:
+        print("Error: no systems found to validate.", file=sys.stderr)
+        return 2
+
+    # Shared inputs are computed once and handed to every worker.
+    keys = adr_keys(arch_root / "decisions")
+    with timing.phase("scan"):
+        index = review_index.refresh(arch_root)
+    base_inputs = {k: v for k, v in vars(args).items() if k not in {"systems", "all_systems"}}
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(systems)))
+    work = [
+        (
+            repo_root,
+            system,
+            keys,
+            index,
+            args.max_needs_work,
+            args.allow_fail_pillars,
+            args.incremental,
+            {**base_inputs, "system": system},
+        )
+        for system in systems
+    ]
+    if jobs == 1:
+        results = [run_system(*item) for item in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(run_system, *zip(*work)))
+
+    failed = [r for r in results if r[1] != "pass"]
+    for system, result, issues, cached_from in results:
+        detail = f" ({len(issues)} issue(s))" if issues else ""
+        if cached_from:
+            detail = f" (unchanged since {cached_from})"
+        print(f"{system}: {result}{detail}")
+        for issue in issues:
+            print(f"  - {issue}")
+    print(f"Validated {len(results)} system(s): {len(results) - len(failed)} passed, {len(failed)} failed.")
+
+    if args.report:
+        report = {
+            "timestamp": now_iso(),
+            "workflow_version": WORKFLOW_VERSION,
+            "gate": {
+                "allow_fail_pillars": bool(args.allow_fail_pillars),
+                "max_needs_work": int(args.max_needs_work),
+            },
+            "systems": [
+                {"system": system, "result": result, "issues": issues, "cached_from": cached_from}
+                for system, result, issues, cached_from in results
+            ],
+        }
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        fileio.write_text(report_path, json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"Report: {report_path}")
+
+    if args.profile:
+        timing.report()
+    return 1 if failed else 0
+
+
+def main() -> int:
+    forwarded = daemon_client.forward("validate", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
+    parser = argparse.ArgumentParser(description="Validate architecture artifacts and WA gating.")
+    parser.add_argument("--system")
+    parser.add_argument("--systems", help="Comma-separated systems to validate in one run.")
+    parser.add_argument(
+        "--all-systems",
+        action="store_true",
+        help="Validate every system that has a manifest.",
+    )
+    parser.add_argument("--jobs", type=int, help="Worker processes for multi-system runs (default: CPU count).")
+    parser.add_argument("--report", help="Write an aggregated JSON report for multi-system runs.")
+    parser.add_argument("--max-needs-work", type=int, default=2)
+    parser.add_argument("--allow-fail-pillars", action="store_true")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the last passing validation when baseline artifacts, WA review, ADR keys and gate are unchanged.",
+    )
+    parser.add_argument("--interactive", action="store_true")
+    parser.add_argument("--profile", action="store_true", help="Print a per-phase timing breakdown to stderr.")
+    args = parser.parse_args()
+    timing.begin("validate_archifacts.py")
+
+    if args.all_systems or args.systems:
+        if args.system:
+            print("Error: --system cannot be combined with --systems/--all-systems.", file=sys.stderr)
+            return 2
+        try:
+            if args.all_systems:
+                systems, legacy = discover_systems(resolve_repo_root(Path.cwd()))
+                if legacy:
+                    print(
+                        f"Warning: skipping {len(legacy)} system(s) with only a legacy "
+                        f"docs/architecture/manifest/ manifest: {', '.join(legacy)}. "
+                        "Run validate_archifacts.py --system <system> to migrate and validate one.",
+                        file=sys.stderr,
+                    )
+            else:
+                systems = sorted({x.strip() for x in args.systems.split(",") if x.strip()})
+            return validate_many(args, systems)
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+
+    if not args.system:
+        if args.interactive:
+            try:
+                args.system = input("system: ").strip()
+            except EOFError:
+                args.system = ""
+        if not args.system:
+            print("Error: missing --system. Use --interactive for prompt mode.", file=sys.stderr)
+            parser.print_usage(sys.stderr)
+            return 2
+
+    try:
+        with timing.phase("resolve"):
+            repo_root = resolve_repo_root(Path.cwd())
+        arch_root = repo_root / "docs" / "architecture"
+        decisions_dir = arch_root / "decisions"
+
+        issues, cached_from = check_system(
+            repo_root,
+            args.system,
+            adr_keys(decisions_dir),
+            latest_wa_review(arch_root, args.system),
+            inputs=vars(args),
+            max_needs_work=args.max_needs_work,
+            allow_fail_pillars=args.allow_fail_pillars,
+            incremental=args.incremental,
+        )
+        if args.profile:
+            timing.report()
 
         if issues:
             print("Validation failed with actionable issues:", file=sys.stderr)
             for issue in issues:
                 print(f"- {issue}", file=sys.stderr)
+            return 1
+        if cached_from:
+            print(f"Validation passed (inputs unchanged since {cached_from}).")
         else:
             print("Validation passed.")
-
-        return exit_code
+        return 0
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
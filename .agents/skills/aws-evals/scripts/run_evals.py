@@ -5,9 +5,7 @@ import argparse
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-import yaml
+from types import ModuleType
 
 WORKFLOW_VERSION = "1.0.0"
 
@@ -83,34 +81,13 @@ def resolve_repo_root(start: Path) -> Path:
         cur = cur.parent
 
 
-def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return data if isinstance(data, dict) else {}
-
-
-def save_manifest(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=True, default_flow_style=False),
-        encoding="utf-8",
-    )
-
+def manifest_store(repo_root: Path) -> ModuleType:
+    scripts_dir = repo_root / ".agents" / "skills" / "_shared" / "architecture-workflow" / "scripts"
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    from archwf import manifest
 
-def ensure_common_manifest_keys(m: dict[str, Any], repo_root: Path, manifest_path: Path, system: str) -> None:
-    m.setdefault("system", system)
-    m["manifest_path"] = str(manifest_path)
-    m["repo_root"] = str(repo_root)
-    m["workflow_version"] = WORKFLOW_VERSION
-    m["last_updated"] = now_iso()
-    m.setdefault("artifacts", {})
-    m.setdefault("adrs", [])
-    m.setdefault("wa_reviews", [])
-    m.setdefault("validations", [])
-    m.setdefault("decision_traces", [])
-    m.setdefault("actions", [])
-    m.setdefault("evals", [])
+    return manifest
 
 
 def parse_args() -> argparse.Namespace:
@@ -232,17 +209,16 @@ def main() -> int:
         print(f"Wrote notes: {notes_path}")
 
         if args.system:
-            manifest_path = repo_root / "docs" / "architecture" / "manifest" / f"{args.system}.yaml"
-            manifest = load_manifest(manifest_path)
-            ensure_common_manifest_keys(manifest, repo_root, manifest_path, args.system)
+            manifest, migrated_manifest_from = manifest_store(repo_root).open_manifest(repo_root, args.system)
+            manifest.stamp(repo_root, args.system, extra_sections=("evals",))
             manifest["evals"].append(
                 {
                     "timestamp": now_iso(),
                     "scenarios": selected,
-                    "notes_path": str(notes_path),
+                    "notes_path": manifest.portable(str(notes_path)),
                 }
             )
-            manifest["actions"].append(
+            manifest.record_action(
                 {
                     "script": "run_evals.py",
                     "timestamp": now_iso(),
@@ -258,16 +234,15 @@ def main() -> int:
                     "workflow_version": WORKFLOW_VERSION,
                 }
             )
-            save_manifest(manifest_path, manifest)
-            print(f"Updated manifest: {manifest_path}")
+            if migrated_manifest_from:
+                manifest.actions[-1]["migrated_manifest_from"] = manifest.portable(migrated_manifest_from)
+            manifest.save()
+            print(f"Updated manifest: {manifest.path}")
 
         return 0
     except RuntimeError as err:
         print(f"Error: {err}", file=sys.stderr)
         return 1
-    except yaml.YAMLError:
-        print("Error: existing manifest is not valid YAML content.", file=sys.stderr)
-        return 1
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import importlib.util
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -33,6 +35,41 @@ def resolve_python_command(repo_root: Path) -> Path | str:
     return venv_python if venv_python.exists() else "python3"
 
 
+def can_run_in_process(repo_root: Path) -> bool:
+    if os.environ.get("ARCHWF_DISPATCH", "").strip().lower() == "subprocess":
+        return False
+    venv = repo_root / ".venv"
+    # A repo-local virtualenv may carry dependencies this interpreter lacks.
+    return not (venv / "bin" / "python").exists() or Path(sys.prefix).resolve() == venv.resolve()
+
+
+def run_in_process(shared: Path, argv: list[str]) -> int | None:
+    saved_argv, saved_path = sys.argv[:], sys.path[:]
+    sys.argv = [str(shared), *argv]
+    sys.path.insert(0, str(shared.parent))
+    try:
+        spec = importlib.util.spec_from_file_location(shared.stem, shared)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        # Registered so process pools in the shared script can pickle its functions.
+        sys.modules[shared.stem] = module
+        try:
+            spec.loader.exec_module(module)
+        except ImportError:
+            del sys.modules[shared.stem]
+            return None
+        try:
+            return int(module.main() or 0)
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                return exc.code or 0
+            print(exc.code, file=sys.stderr)
+            return 1
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+
+
 def main() -> int:
     script_name = Path(__file__).name
     if script_name not in ALLOWED:
@@ -55,6 +92,10 @@ def main() -> int:
         if not shared.exists():
             print(f"Error: shared script not found: {shared}", file=sys.stderr)
             return 1
+        if can_run_in_process(repo_root):
+            code = run_in_process(shared, sys.argv[1:])
+            if code is not None:
+                return code
         proc = subprocess.run(
             [str(resolve_python_command(repo_root)), str(shared), *sys.argv[1:]],
             check=False,